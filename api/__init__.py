@@ -1,5 +1,12 @@
-from api.adapter import ApiAdapter
-from api.binance_api import BinanceApi
-from api.yahoo_api import YahooFinanceApi
+from utils.lazy import lazy_getattr
 
-__all__ = ["ApiAdapter", "BinanceApi", "YahooFinanceApi"]
+_MODULES = {
+    "ApiAdapter": "api.adapter",
+    "AsyncApiAdapter": "api.async_adapter",
+    "BinanceApi": "api.binance_api",
+    "YahooFinanceApi": "api.yahoo_api",
+}
+
+__all__ = list(_MODULES)
+
+__getattr__ = lazy_getattr(__name__, _MODULES)
@@ -1,53 +1,167 @@
-import os
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
 import pandas as pd
 
 from api.base import BaseApi
-from constants.constants import CrawlerColumns
+from constants.constants import Config, CrawlerColumns, IntervalType
+from profiling.profiler import get_profiler
+from storage.base import BaseStorage, to_timestamp, to_timestamps
+from storage.candle_index import CandleIndex
+from storage.compact_candles import CompactCandles
+from storage.csv_storage import CsvStorage
+from storage.resampler import Resampler
 
 
 class ApiAdapter(BaseApi):
-    def __init__(self, api):
-        """ Get the api."""
+    def __init__(self,
+                 api,
+                 storage: Optional[BaseStorage] = None,
+                 cache_only: bool = False,
+                 compact: bool = False,
+                 ):
+        """ Get the api and the storage of candles.
+        args:
+            api (BaseApi): api of candles, unused if cache_only
+            storage (BaseStorage): storage of candles
+            cache_only (bool): load the stored candles without any request
+            compact (bool): return CompactCandles of float32 prices
+        """
         self.api = api
+        self.storage = storage or CsvStorage()
+        self.cache_only = cache_only
+        self.compact = compact
+        self.resampler = Resampler(self.storage)
+        self.indexes = {}
 
-    def fetch_candles(self, filename: str, params: dict):
-        """ Fetch historical candles data.
+    def fetch_candles(self,
+                      params: dict,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      bars: Optional[int] = None,
+                      ) -> pd.DataFrame:
+        """ Fetch historical candles data, only requesting the candles
+            missing from the storage within [start, end]. Candles of a
+            longer timeframe in params are derived from the stored ones.
         args:
-            filename (str): csv filename to be saved
             params (dict): query paramter for requests
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+            bars (int): number of the latest candles to be loaded, e.g.
+                        the tail to be traded with the lookback of the
+                        strategy, all of them if None
 
         returns:
-            complete candles data (pd.DataFrame)
+            complete candles data (pd.DataFrame, or CompactCandles)
         """
+        symbol = params[Config.SYMBOL]
+        interval = params.get(Config.INTERVAL, "")
+        timeframe = params.get(Config.TIMEFRAME)
+        profiler = get_profiler()
+        if not self.cache_only:
+            last_updates = self.storage.last_updated(symbol, interval)
+            params["isEmpty"] = last_updates is None
+            index = None if last_updates is None \
+                else self._get_index(symbol, interval, last_updates)
+            if last_updates is None or end is None or end > last_updates:
+                if last_updates is not None:
+                    params["start"] = last_updates
+                    # naive utc as the stored datetimes
+                    params["end"] = datetime.now(timezone.utc) \
+                        .replace(tzinfo=None)
+                candles = self._request(params)
+                if last_updates is not None:
+                    # the request starts at the latest stored candle
+                    candles = candles[to_timestamps(
+                        candles[CrawlerColumns.DATETIME.value],
+                    ) > to_timestamp(last_updates)]
+                with profiler.stage("storage.append"):
+                    self.storage.append(symbol, interval, candles)
+                if index is not None:
+                    index.extend(to_timestamps(
+                        candles[CrawlerColumns.DATETIME.value]))
+
+            if index is not None:
+                self._repair(params, index, start, end)
+
+        with profiler.stage("storage.load"):
+            if bars is not None and timeframe in (None, interval):
+                candles = self.storage.load_tail(
+                    symbol, interval, bars, end=end).loc[start:]
+            elif self.compact and timeframe in (None, interval):
+                return self.storage.load_compact(
+                    symbol, interval, start=start, end=end)
+            else:
+                candles = self.resampler.load(
+                    symbol, interval, timeframe, start=start, end=end)
+                if bars is not None:
+                    candles = candles.iloc[max(len(candles) - bars, 0):]
+            return CompactCandles.from_frame(candles) if self.compact \
+                else candles
 
-        file_existed = os.path.exists(filename)
-        params["isEmpty"] = not file_existed
-        if file_existed:
-            historical_candles = pd.read_csv(filename)
-            last_updates = \
-                historical_candles.iloc[-1][CrawlerColumns.DATETIME.value]
+    def _get_index(self,
+                   symbol: str,
+                   interval: str,
+                   last_updates: datetime,
+                   ) -> CandleIndex:
+        """ Index of the stored candles kept between the calls, only read
+            from the storage again if its latest candle is not the indexed
+            one, e.g. the candles were stored elsewhere."""
+        index = self.indexes.get((symbol, interval))
+        if index is None or len(index.timestamps) == 0 \
+                or index.timestamps[-1] != to_timestamp(last_updates):
+            index = CandleIndex(
+                self.storage.timestamps(symbol, interval),
+                IntervalType(interval).milliseconds
+                if interval in IntervalType.list() else None,
+            )
+            self.indexes[(symbol, interval)] = index
+        return index
 
-            params["start"] = datetime.strptime(
-                last_updates,
-                "%Y-%m-%d %H:%M:%S",
+    def _repair(self,
+                params: dict,
+                index: CandleIndex,
+                start: Optional[datetime] = None,
+                end: Optional[datetime] = None,
+                ) -> None:
+        """ Merge the repeated (or unordered) stored candles, and for the
+            continuously traded apis request the stored gaps within
+            [start, end] as well. Markets with closures (e.g. Yahoo) are
+            not gap-filled since their closures would look missing."""
+        symbol = params[Config.SYMBOL]
+        interval = params[Config.INTERVAL]
+        gaps = []
+        if self.api.continuous_trading and index.interval is not None:
+            gaps = index.gaps(
+                start=to_timestamp(start) if start is not None else None,
+                end=to_timestamp(end) if end is not None else None,
             )
-            params["end"] = datetime.now()
 
-        candles = self.api.fetch_candles(params)
-        candles = pd.DataFrame(
+        candles = [
+            self._request({
+                **params,
+                "isEmpty": False,
+                "start": _to_datetime(gap_start),
+                "end": _to_datetime(gap_end),
+            })
+            for gap_start, gap_end in gaps
+        ]
+        candles = [candle for candle in candles if not candle.empty]
+        if candles or index.has_duplicates():
+            with get_profiler().stage("storage.merge"):
+                self.storage.merge(
+                    symbol, interval, pd.concat(candles) if candles else None)
+            self.resampler.invalidate(symbol, interval)
+            self.indexes.pop((symbol, interval), None)
+
+    def _request(self, params: dict) -> pd.DataFrame:
+        with get_profiler().stage("api.fetch_candles"):
+            candles = self.api.fetch_candles(params)
+        return pd.DataFrame(
             candles,
             columns=[column.value for column in CrawlerColumns],
         )
-        candles.to_csv(
-            filename,
-            mode="a",
-            header=(not file_existed),
-            index=False,
-        )
 
-        candles = pd.read_csv(
-            filename, index_col=CrawlerColumns.DATETIME.value)
-        candles.index = pd.DatetimeIndex(candles.index.values)
-        return candles
+
+def _to_datetime(timestamp: int) -> datetime:
+    return pd.Timestamp(timestamp, unit="ms").to_pydatetime()
@@ -0,0 +1,93 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+from api.adapter import ApiAdapter
+from constants.constants import Config
+from storage.base import BaseStorage
+
+
+class AsyncApiAdapter:
+    def __init__(self,
+                 api,
+                 storage: Optional[BaseStorage] = None,
+                 max_concurrency: int = 8,
+                 cache_only: bool = False,
+                 ):
+        """ Get the api, the storage of candles and the concurrency cap.
+        args:
+            api (BaseApi): api to fetch candles
+            storage (BaseStorage): storage of candles
+            max_concurrency (int): maximum number of symbols in flight
+            cache_only (bool): load the stored candles without any request
+        """
+        self.api_adapter = ApiAdapter(api, storage, cache_only)
+        self.max_concurrency = max_concurrency
+
+    async def fetch_candles(self,
+                            params: dict,
+                            start: Optional[datetime] = None,
+                            end: Optional[datetime] = None,
+                            executor: Optional[ThreadPoolExecutor] = None,
+                            ) -> pd.DataFrame:
+        """ Fetch and persist historical candles data without blocking
+            the event loop.
+        args:
+            params (dict): query paramter for requests
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+            executor (ThreadPoolExecutor): threads running the requests
+
+        returns:
+            complete candles data (pd.DataFrame)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            self.api_adapter.fetch_candles,
+            dict(params),
+            start,
+            end,
+        )
+
+    async def fetch_candles_many(self,
+                                 symbols: list,
+                                 interval: str = "",
+                                 timeframe: Optional[str] = None,
+                                 start: Optional[datetime] = None,
+                                 end: Optional[datetime] = None,
+                                 ) -> dict:
+        """ Fetch and persist candles of many symbols concurrently.
+        args:
+            symbols (list): symbols to be fetched
+            interval (str): interval of the stored candles
+            timeframe (str): interval of the candles derived from the stored
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            complete candles data of each symbol (dict[str, pd.DataFrame])
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            async def fetch(symbol: str) -> tuple:
+                async with semaphore:
+                    candles = await self.fetch_candles(
+                        {
+                            Config.SYMBOL: symbol,
+                            Config.INTERVAL: interval,
+                            Config.TIMEFRAME: timeframe,
+                        },
+                        start=start,
+                        end=end,
+                        executor=executor,
+                    )
+                return symbol, candles
+
+            results = await asyncio.gather(
+                *(fetch(symbol) for symbol in symbols))
+        return dict(results)
@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from api.rate_limiter import RateLimiter
+
+
+class Backfill:
+    def __init__(self,
+                 page_limit: int = 1000,
+                 max_workers: int = 4,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 page_weight: int = 2,
+                 ):
+        """ Split a time range into pages and fetch them concurrently.
+        args:
+            page_limit (int): maximum number of rows of a page
+            max_workers (int): number of concurrent requests
+            rate_limiter (RateLimiter): shared request weight budget
+            page_weight (int): request weight of fetching a page
+        """
+        self.page_limit = page_limit
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.page_weight = page_weight
+
+    def fetch(self,
+              fetch_page: Callable[[int, int, int], list],
+              start: int,
+              end: int,
+              interval: int,
+              ) -> list:
+        """
+        args:
+            fetch_page (Callable): fetch rows of [start, end] with a limit,
+                                   each row starts with its open time
+            start (int): first open time to be fetched [unit: millisecond]
+            end (int): last open time to be fetched [unit: millisecond]
+            interval (int): candle interval [unit: millisecond]
+
+        returns:
+            rows within [start, end] sorted and deduplicated by open time
+                (list)
+        """
+        windows = self._split_windows(start, end, interval)
+        if not windows:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pages = list(executor.map(
+                lambda window: self._fetch_window(fetch_page, *window),
+                windows,
+            ))
+
+        rows, open_times = [], set()
+        for page in pages:
+            for row in page:
+                if row[0] in open_times or not start <= row[0] <= end:
+                    continue
+                open_times.add(row[0])
+                rows.append(row)
+        rows.sort(key=lambda row: row[0])
+        return rows
+
+    def _split_windows(self,
+                       start: int, end: int, interval: int) -> list:
+        """ Split [start, end] into windows holding a page of candles."""
+        span = interval * self.page_limit
+        return [
+            (window_start, min(window_start + span - 1, end))
+            for window_start in range(start, end + 1, span)
+        ]
+
+    def _fetch_window(self,
+                      fetch_page: Callable[[int, int, int], list],
+                      start: int,
+                      end: int,
+                      ) -> list:
+        """ Keep paging when a window holds more rows than a page,
+            e.g. months are approximated by 31 days.
+        """
+        rows = []
+        while start <= end:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.page_weight)
+            page = fetch_page(start, end, self.page_limit) or []
+            rows.extend(page)
+            if len(page) < self.page_limit:
+                break
+            start = int(page[-1][0]) + 1
+        return rows
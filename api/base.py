@@ -1,9 +1,24 @@
 import abc
+from typing import TYPE_CHECKING, Optional
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from api.http_client import HttpClient
+
 
 class BaseApi(metaclass=abc.ABCMeta):
+    # whether candles are listed at every interval, so a missing one is a gap
+    continuous_trading = False
+
+    def __init__(self, client: Optional["HttpClient"] = None):
+        """ Get the http client, shared by all apis by default."""
+        if client is None:
+            # requests is imported only by the apis using the network
+            from api.http_client import get_http_client
+            client = get_http_client()
+        self.client = client
+
     @abc.abstractmethod
     def fetch_candles(self, payload: dict = None) -> pd.DataFrame:
         """ Fetch historical candles data."""
@@ -1,10 +1,16 @@
+import functools
+import time
 from enum import Enum
+from typing import Optional
 
 import pandas as pd
 import requests
 
+from api.backfill import Backfill
 from api.base import BaseApi
-from constants.constants import CrawlerColumns
+from api.http_client import HttpClient
+from api.rate_limiter import RateLimiter
+from constants.constants import CrawlerColumns, IntervalType
 
 
 class BinanceColumns(Enum):
@@ -23,6 +29,32 @@ class BinanceColumns(Enum):
 
 
 class BinanceApi(BaseApi):
+    continuous_trading = True
+
+    def __init__(self,
+                 base_url: str = "https://api.binance.com",
+                 page_limit: int = 1000,
+                 max_workers: int = 4,
+                 weight_per_minute: int = 1200,
+                 client: Optional[HttpClient] = None,
+                 ):
+        """ Setup the endpoint and the backfill of klines pages.
+        args:
+            base_url (str): endpoint, e.g. a local stand-in server
+            page_limit (int): maximum number of klines per request
+            max_workers (int): number of concurrent requests
+            weight_per_minute (int): request weight budget per minute
+            client (HttpClient): http client, shared by default
+        """
+        super().__init__(client)
+        self.base_url = base_url
+        self.rate_limiter = RateLimiter(weight_per_minute)
+        self.backfill = Backfill(
+            page_limit=page_limit,
+            max_workers=max_workers,
+            rate_limiter=self.rate_limiter,
+        )
+
     def fetch_candles(self, params=None):
         """ Fetch historical candles data from binance.
             interval should be:
@@ -30,36 +62,84 @@ class BinanceApi(BaseApi):
                 1h, 2h, 4h, 6h, 8h, 12h,
                 1d, 3d, 1w, 1M
         """
+        interval = IntervalType(params["interval"])
+        end = _to_milliseconds(params.get("end")) \
+            if params.get("end") is not None \
+            else int(time.time() * 1000)
+        if params.get("start") is not None:
+            start = _to_milliseconds(params["start"])
+        else:
+            start = self._fetch_first_open_time(params["symbol"], interval)
+
+        candles = self.backfill.fetch(
+            functools.partial(self._fetch_klines, params["symbol"], interval),
+            start,
+            end,
+            interval.milliseconds,
+        )
+        candles = pd.DataFrame(
+            candles,
+            columns=[column.value for column in BinanceColumns],
+        )
+        close_times = candles[BinanceColumns.CLOSE_TIME.value].astype("int64")
+        candles[CrawlerColumns.DATETIME.value] = pd.to_datetime(
+            close_times // 1000,
+            unit="s",
+        )
+        # the kline still open is dropped, otherwise it would be stored
+        # with its close time ahead and never be replaced by the closed one
+        closed = (close_times <= int(time.time() * 1000)) \
+            & (close_times // 1000 * 1000 <= end)
+        return candles.loc[closed, [column.value for column in CrawlerColumns]]
+
+    def _fetch_first_open_time(self,
+                               symbol: str, interval: IntervalType) -> int:
+        """ Get the open time of the first listed candle."""
+        candles = self._request_klines({
+            "symbol": symbol,
+            "interval": interval.value,
+            "startTime": 0,
+            "limit": 1,
+        })
+        if not candles:
+            return int(time.time() * 1000)
+        return int(candles[0][0])
+
+    def _fetch_klines(self,
+                      symbol: str,
+                      interval: IntervalType,
+                      start: int,
+                      end: int,
+                      limit: int,
+                      ) -> list:
+        """ Fetch a page of klines within [start, end]."""
+        return self._request_klines({
+            "symbol": symbol,
+            "interval": interval.value,
+            "startTime": start,
+            "endTime": end,
+            "limit": limit,
+        })
+
+    def _request_klines(self, payload: dict) -> list:
         try:
-            payload = {
-                "symbol": params["symbol"],
-                "interval": params["interval"],
-            }
-            if params["isEmpty"]:
-                payload["limit"] = 1000
-            else:
-                payload["startTime"] = int(params["start"].timestamp())
-                payload["endTime"] = int(params["end"].timestamp())
-
-            response = requests.get(
-                "https://api.binance.com/api/v3/klines",
+            response = self.client.get(
+                f"{self.base_url}/api/v3/klines",
                 params=payload,
             )
-            response.raise_for_status()
+            used_weight = response.headers.get("X-MBX-USED-WEIGHT-1M")
+            if used_weight is not None:
+                self.rate_limiter.sync(int(used_weight))
             candles = response.json()
-            if candles is None:
-                return
-
-            candles = pd.DataFrame(
-                candles,
-                columns=[column.value for column in BinanceColumns],
-            )
-            candles[CrawlerColumns.DATETIME.value] = pd.to_datetime(
-                candles[BinanceColumns.CLOSE_TIME.value] // 1000,
-                unit="s",
-            )
 
         except requests.exceptions.RequestException as error:
+            if error.response is None:
+                raise Exception(error)
             raise Exception(error.response.text)
 
-        return candles[[column.value for column in CrawlerColumns]]
+        return candles or []
+
+
+def _to_milliseconds(value) -> int:
+    """ Convert a datetime (naive as utc) to epoch millisecond."""
+    return int(pd.Timestamp(value).timestamp() * 1000)
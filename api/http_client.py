@@ -0,0 +1,135 @@
+import random
+import threading
+import time
+from typing import Callable, Optional, Tuple, Type
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from profiling.profiler import get_profiler
+
+RETRY_STATUS_CODES = (418, 429, 500, 502, 503, 504)
+TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class HttpClient:
+    def __init__(self,
+                 timeout: Tuple[float, float] = (3.05, 30),
+                 max_retries: int = 5,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 60,
+                 pool_maxsize: int = 16,
+                 ):
+        """ Keep-alive session with retry, backoff and rate limit respect.
+        args:
+            timeout (tuple[float, float]): connect and read timeout
+                                           [unit: second]
+            max_retries (int): number of retries of a failed request
+            backoff_factor (float): base of exponential backoff
+                                    [unit: second]
+            max_backoff (float): upper bound of a backoff [unit: second]
+            pool_maxsize (int): number of connections kept per host
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, params: Optional[dict] = None,
+            **kwargs) -> requests.Response:
+        """ Send GET request through the pooled session."""
+        return self.request("GET", url, params=params, **kwargs)
+
+    def request(self, method: str, url: str,
+                **kwargs) -> requests.Response:
+        """ Send request and retry on connection errors, timeouts,
+            rate limit and server errors.
+
+        returns:
+            successful response (requests.Response)
+
+        raises:
+            requests.exceptions.RequestException when retries run out
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        profiler = get_profiler()
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                profiler.count("api.retries")
+            try:
+                with profiler.stage("api.request"):
+                    response = self.session.request(method, url, **kwargs)
+            except TRANSIENT_ERRORS:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._get_backoff(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES \
+                    or attempt == self.max_retries:
+                response.raise_for_status()
+                return response
+            time.sleep(self._get_backoff(attempt, response))
+
+    def call(self,
+             func: Callable,
+             retry_on: Tuple[Type[Exception], ...] = TRANSIENT_ERRORS,
+             ):
+        """ Retry a third-party call which does not go through the session,
+            e.g. yfinance, with the same backoff. Other errors than retry_on
+            are raised at once.
+        args:
+            func (Callable): call without arguments
+            retry_on (tuple[type[Exception], ...]): transient errors to be
+                                                    retried
+        """
+        profiler = get_profiler()
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                profiler.count("api.retries")
+            try:
+                with profiler.stage("api.call"):
+                    return func()
+            except retry_on:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._get_backoff(attempt))
+
+    def _get_backoff(self,
+                     attempt: int,
+                     response: Optional[requests.Response] = None,
+                     ) -> float:
+        """ Wait as the server asks by Retry-After, otherwise exponential
+            backoff with full jitter.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None and retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        return random.uniform(0, backoff)
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """ Get the client shared by all apis of the process."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+    return _shared_client
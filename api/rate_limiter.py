@@ -0,0 +1,40 @@
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, weight_per_minute: int = 1200):
+        """ Token bucket shared by the threads requesting the same exchange.
+        args:
+            weight_per_minute (int): request weight budget per minute
+        """
+        self.capacity = weight_per_minute
+        self.tokens = float(weight_per_minute)
+        self.refill_rate = weight_per_minute / 60
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, weight: int = 1) -> None:
+        """ Block until the request weight fits in the budget."""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                waiting = (weight - self.tokens) / self.refill_rate
+            time.sleep(waiting)
+
+    def sync(self, used_weight: int) -> None:
+        """ Align the budget with the weight reported by the server."""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, self.capacity - used_weight)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.refill_rate,
+        )
+        self.updated_at = now
@@ -4,8 +4,15 @@ import pandas as pd
 import yfinance
 
 from api.base import BaseApi
+from api.http_client import TRANSIENT_ERRORS
 from constants.constants import CrawlerColumns
 
+try:
+    from yfinance.exceptions import YFRateLimitError
+    YAHOO_TRANSIENT_ERRORS = TRANSIENT_ERRORS + (YFRateLimitError,)
+except ImportError:
+    YAHOO_TRANSIENT_ERRORS = TRANSIENT_ERRORS
+
 
 class YahooFinanceColumns(Enum):
     DATE = "Date"
@@ -22,14 +29,20 @@ class YahooFinanceApi(BaseApi):
     def fetch_candles(self, params):
         """ Fetch historical candles data from yahoo."""
         try:
-            if params["isEmpty"]:
-                candles = yfinance.Ticker(params["symbol"]).history(
-                    period="max",
+            if params["isEmpty"] and params.get("start") is None:
+                candles = self.client.call(
+                    lambda: yfinance.Ticker(params["symbol"]).history(
+                        period="max",
+                    ),
+                    retry_on=YAHOO_TRANSIENT_ERRORS,
                 )
             else:
-                candles = yfinance.Ticker(params["symbol"]).history(
-                    start=params["start"],
-                    end=params["end"],
+                candles = self.client.call(
+                    lambda: yfinance.Ticker(params["symbol"]).history(
+                        start=params["start"],
+                        end=params.get("end"),
+                    ),
+                    retry_on=YAHOO_TRANSIENT_ERRORS,
                 )
             if candles.empty:
                 return
@@ -1,66 +1,126 @@
 import argparse
-import importlib
 
 import yaml
-from backtesting import Backtest, Strategy
 
-from api import ApiAdapter, BinanceApi, YahooFinanceApi
-from constants import ApiType, Config, IndicatorType, StrategyType
-from indicator import Indicator
-from strategy import CrossOverStrategy, OverReactStrategy
+from api.adapter import ApiAdapter
+from constants import (
+    ApiType,
+    Config,
+    EngineType,
+    IndicatorBackendType,
+    IndicatorType,
+    StorageType,
+    StrategyType,
+)
+from profiling import Profiler
+from registry import (
+    get_api,
+    get_engine,
+    get_indicator,
+    get_lookback,
+    get_storage,
+    get_strategy_function,
+    validate_parameters,
+)
+from strategy.signal_cache import SignalCache
 
 
 def main(opt):
-    module = importlib.import_module(__name__)
+    profiler = Profiler(
+        enabled=opt.get(Config.PROFILE, False),
+        cprofile_filename=opt.get(Config.CPROFILE_OUTPUT, None),
+    )
+    with profiler:
+        run(opt, profiler)
+    if profiler.enabled:
+        profiler.dump(opt.get(Config.PROFILE_OUTPUT, None))
 
+
+def run(opt, profiler: Profiler):
     assert opt[Config.API] in ApiType.list(), \
         "The api is unsupported."
     payload = {
         Config.SYMBOL: opt.get(Config.SYMBOL, ""),
         Config.INTERVAL: opt.get(Config.INTERVAL, ""),
+        Config.START: opt.get(Config.START, None),
+        Config.TIMEFRAME: opt.get(Config.TIMEFRAME, None),
     }
-    api = getattr(module, opt[Config.API.value])()
-    api_adapter = ApiAdapter(api)
-    candles = api_adapter.fetch_candles(f'{opt[Config.SYMBOL]}.csv', payload)
+    cache_only = opt.get(Config.CACHE_ONLY, False)
+    api = None if cache_only else get_api(opt[Config.API])()
+
+    storage_type = opt.get(Config.STORAGE, StorageType.CSV_STORAGE.value)
+    assert storage_type in StorageType.list(), \
+        "The storage type is unsupported."
+    storage = get_storage(storage_type)()
+    api_adapter = ApiAdapter(
+        api,
+        storage,
+        cache_only=cache_only,
+        compact=opt.get(Config.COMPACT, False),
+    )
 
     assert opt[Config.STRATEGY] in StrategyType.list(), \
         "The strategy type is unsupported."
-    indicator = Indicator(candles)
-    strategy = getattr(module, opt[Config.STRATEGY])(indicator)
-
-    assert opt[Config.INDICATOR] in IndicatorType.list(), \
+    # composite strategies declare the indicators by their rules
+    indicator_type = opt.get(Config.INDICATOR, None)
+    assert indicator_type is None or indicator_type in IndicatorType.list(), \
         "The indicator type is unsupported."
-    signal = strategy.trade_by_indicator(
-        IndicatorType(opt[Config.INDICATOR]))()
-
-    backtest = Backtest(candles, BacktestStrategy,
-                        cash=opt.get(Config.CASH, None),
-                        commission=opt.get(Config.COMMISSION, None),
-                        )
-    result = backtest.run(**{"signal": signal})
-    backtest.plot()
-
-
-class BacktestStrategy(Strategy):
-    def __init__(self, broker, data, params) -> None:
-        """ Setup signal from argument params."""
-        self.signal = None
-        super().__init__(broker, data, params)
-
-    def init(self):
-        """ Add signal as indicators."""
-        self.signal = self.I(lambda x: self.signal, "signal")
-        super().init()
-
-    def next(self) -> None:
-        """ Make strategy decisions."""
-        super().next()
-        current_signal = self.signal[-1]
-
-        if current_signal > 0:
-            self.buy()
-        if current_signal < 0:
-            self.sell()
+    parameters = validate_parameters(
+        opt[Config.STRATEGY],
+        indicator_type,
+        opt.get(Config.PARAMETERS, {}),
+    )
+
+    # only the latest tail_bars bars are traded, the lookback before them
+    # is loaded to warm the indicators up
+    lookback = get_lookback(opt[Config.STRATEGY], indicator_type, parameters)
+    tail_bars = opt.get(Config.TAIL_BARS, None)
+    bars = None if tail_bars is None else tail_bars - 1 + lookback
+    with profiler.stage("fetch"):
+        candles = api_adapter.fetch_candles(payload, bars=bars)
+
+    indicator_backend = opt.get(
+        Config.INDICATOR_BACKEND, IndicatorBackendType.TALIB.value)
+    assert indicator_backend in IndicatorBackendType.list(), \
+        "The indicator backend is unsupported."
+
+    def compute(candles):
+        indicator = get_indicator(indicator_backend)(candles)
+        return get_strategy_function(
+            opt[Config.STRATEGY], indicator_type, indicator)(**parameters)
+
+    with profiler.stage("signal"):
+        # a tail moves its first bar on every run, so it is not cached
+        if opt.get(Config.SIGNAL_CACHE, None) is not None \
+                and tail_bars is None:
+            # keyed by everything the signals depend on besides the candles
+            fields = {
+                key: opt.get(key, None) for key in (
+                    Config.SYMBOL, Config.INTERVAL, Config.TIMEFRAME,
+                    Config.STRATEGY, Config.INDICATOR, Config.COMPACT,
+                )
+            }
+            fields[Config.PARAMETERS] = parameters
+            fields[Config.INDICATOR_BACKEND] = indicator_backend
+            signal = SignalCache(opt[Config.SIGNAL_CACHE]).get(
+                fields, candles, compute, lookback)
+        else:
+            signal = compute(candles)
+    if tail_bars is not None:
+        candles, signal = candles.tail(tail_bars), signal[-tail_bars:]
+
+    engine_type = opt.get(Config.ENGINE, EngineType.BACKTESTING_ENGINE.value)
+    assert engine_type in EngineType.list(), \
+        "The engine type is unsupported."
+    engine = get_engine(engine_type)(
+        cash=opt.get(Config.CASH, 10000),
+        commission=opt.get(Config.COMMISSION, 0.0),
+    )
+    with profiler.stage("backtest"):
+        result = engine.run(candles, signal)
+    if opt.get(Config.PLOT, True):
+        with profiler.stage("plot"):
+            engine.plot()
 
 
 if __name__ == "__main__":
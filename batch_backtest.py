@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+
+import yaml
+
+from api.async_adapter import AsyncApiAdapter
+from constants import (
+    ApiType,
+    Config,
+    EngineType,
+    IndicatorBackendType,
+    IndicatorType,
+    StorageType,
+    StrategyType,
+)
+from engine.batch_runner import BatchRunner
+from registry import get_api, get_storage
+
+
+def main(opt):
+    assert opt[Config.API] in ApiType.list(), \
+        "The api is unsupported."
+    cache_only = opt.get(Config.CACHE_ONLY, False)
+    api = None if cache_only else get_api(opt[Config.API])()
+
+    storage_type = opt.get(Config.STORAGE, StorageType.CSV_STORAGE.value)
+    assert storage_type in StorageType.list(), \
+        "The storage type is unsupported."
+    storage = get_storage(storage_type)()
+    candles = asyncio.run(
+        AsyncApiAdapter(api, storage, cache_only=cache_only)
+        .fetch_candles_many(
+            opt[Config.SYMBOLS],
+            opt.get(Config.INTERVAL, ""),
+            opt.get(Config.TIMEFRAME, None),
+        ))
+
+    assert set(opt[Config.STRATEGIES]) <= set(StrategyType.list()), \
+        "The strategy type is unsupported."
+    assert set(opt[Config.INDICATORS]) <= set(IndicatorType.list()), \
+        "The indicator type is unsupported."
+    engine_type = opt.get(Config.ENGINE, EngineType.VECTORIZED_ENGINE.value)
+    assert engine_type in EngineType.list(), \
+        "The engine type is unsupported."
+
+    runner = BatchRunner(
+        engine_type=engine_type,
+        cash=opt.get(Config.CASH, 10000),
+        commission=opt.get(Config.COMMISSION, 0.0),
+        processes=opt.get(Config.PROCESSES, None),
+        indicator_backend=opt.get(
+            Config.INDICATOR_BACKEND, IndicatorBackendType.TALIB.value),
+    )
+    results = runner.run(
+        candles,
+        opt[Config.STRATEGIES],
+        opt[Config.INDICATORS],
+        opt.get(Config.PARAMETERS, None),
+    )
+    results.to_csv(opt.get(Config.OUTPUT, "batch-results.csv"), index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", type=str, default="config-batch.yaml")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = yaml.load(f, Loader=yaml.FullLoader)
+    main(config)
@@ -0,0 +1,130 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmark.suite_benchmark import make_candles
+from constants import CrawlerColumns, IndicatorBackendType
+from indicator.base import BaseIndicator
+from registry import get_indicator
+
+
+def cross_validate(candles: pd.DataFrame,
+                   reference: str = IndicatorBackendType.TALIB.value,
+                   candidate: str = IndicatorBackendType.NUMPY.value,
+                   rtol: float = 1e-7,
+                   atol: float = 1e-7,
+                   ) -> pd.DataFrame:
+    """ Compare every indicator of two backends with default parameters,
+        and the indicators of data by the momentum.
+    args:
+        candles (pd.DataFrame): candles indexed by datetime
+        reference (str): indicator backend of IndicatorBackendType
+        candidate (str): indicator backend of IndicatorBackendType
+        rtol (float): relative tolerance
+        atol (float): absolute tolerance
+
+    returns:
+        nan mismatches, max absolute difference and whether they agree
+            for each output of each indicator (pd.DataFrame)
+    """
+    backends = [get_indicator(reference)(candles),
+                get_indicator(candidate)(candles)]
+    rows = []
+    for name in sorted(BaseIndicator.__abstractmethods__):
+        if name.endswith("_with_data"):
+            outputs = [getattr(backend, name)(backend.mtm())
+                       for backend in backends]
+        else:
+            outputs = [getattr(backend, name)() for backend in backends]
+        if not isinstance(outputs[0], tuple):
+            outputs = [(output,) for output in outputs]
+
+        for position, (expected, actual) in enumerate(zip(*outputs)):
+            expected = np.asarray(expected, dtype=float)
+            actual = np.asarray(actual, dtype=float)
+            valid = ~np.isnan(expected) & ~np.isnan(actual)
+            rows.append({
+                "indicator": name,
+                "output": position,
+                "nan_mismatches": int(np.sum(
+                    np.isnan(expected) != np.isnan(actual))),
+                "max_abs_diff": float(np.max(
+                    np.abs(expected[valid] - actual[valid]), initial=0.0)),
+                "passed": bool(np.allclose(
+                    expected, actual, rtol=rtol, atol=atol, equal_nan=True)),
+            })
+    return pd.DataFrame(rows)
+
+
+def measure_methods(candles: pd.DataFrame, repeat: int) -> pd.DataFrame:
+    """ Best seconds of every indicator with default parameters on each
+        backend, results are not cached."""
+    rows = []
+    for backend in IndicatorBackendType.list():
+        indicator_class = get_indicator(backend)
+        indicator_class.cache = None
+        indicator = indicator_class(candles)
+        close = indicator._get_column(CrawlerColumns.CLOSE)
+        for name in sorted(BaseIndicator.__abstractmethods__):
+            method = getattr(indicator, name)
+            args = (close,) if name.endswith("_with_data") else ()
+            method(*args)  # compile the jit kernels first
+            rows.append({
+                "indicator": name,
+                "backend": backend,
+                "seconds": _best(lambda: method(*args), repeat),
+            })
+    return pd.DataFrame(rows).pivot(
+        index="indicator", columns="backend", values="seconds")
+
+
+def measure_periods(candles: pd.DataFrame,
+                    periods: int,
+                    repeat: int,
+                    ) -> dict:
+    """ Best seconds of the exponential moving averages of many periods,
+        one TA-Lib call per period against one fused pass."""
+    timeperiods = list(range(2, periods + 2))
+    talib_indicator = get_indicator(IndicatorBackendType.TALIB)(candles)
+    numpy_indicator = get_indicator(IndicatorBackendType.NUMPY)(candles)
+    numpy_indicator.ema_many(timeperiods[:1])
+    return {
+        IndicatorBackendType.TALIB.value: _best(lambda: [
+            talib_indicator.ema(timeperiod) for timeperiod in timeperiods
+        ], repeat),
+        IndicatorBackendType.NUMPY.value: _best(
+            lambda: numpy_indicator.ema_many(timeperiods), repeat),
+    }
+
+
+def _best(function, repeat: int) -> float:
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def main(opt):
+    candles = make_candles(opt.bars)
+    validation = cross_validate(candles)
+    print(validation.to_string(index=False))
+
+    print(measure_methods(candles, opt.repeat).to_string())
+    for backend, seconds in measure_periods(
+            candles, opt.periods, opt.repeat).items():
+        print(f"ema of {opt.periods} periods by {backend}: {seconds:.4f}s")
+    return 0 if validation["passed"].all() else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=100000)
+    parser.add_argument("--periods", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sys.exit(main(args))
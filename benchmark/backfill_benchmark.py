@@ -0,0 +1,161 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from api.binance_api import BinanceApi
+from api.http_client import HttpClient
+from constants import IntervalType
+
+INTERVAL = IntervalType.MINUTE_1
+
+
+class KlinesServer:
+    def __init__(self, bars: int, overlap: bool = False):
+        """ Local stand-in of the klines endpoint serving synthetic klines
+            listed bars intervals ago, the latest one still open.
+        args:
+            bars (int): number of the listed klines
+            overlap (bool): lead every page by the kline before its start,
+                            as pages of months overlap
+        """
+        interval = INTERVAL.milliseconds
+        now = int(time.time() * 1000)
+        self.open_times = [
+            now // interval * interval - (bars - 1 - position) * interval
+            for position in range(bars)
+        ]
+        self.overlap = overlap
+        self.requests = 0
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._get_handler())
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self) -> "KlinesServer":
+        threading.Thread(target=self.server.serve_forever, daemon=True) \
+            .start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_page(self, query: dict) -> list:
+        """ Klines opened within [startTime, endTime], up to limit."""
+        start = int(query.get("startTime", 0))
+        end = int(query.get("endTime", self.open_times[-1]))
+        limit = int(query.get("limit", 500))
+        if self.overlap:
+            start -= INTERVAL.milliseconds
+        open_times = [
+            open_time for open_time in self.open_times
+            if start <= open_time <= end
+        ][:limit]
+        return [_to_kline(open_time) for open_time in open_times]
+
+    def _get_handler(self) -> type:
+        klines_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {
+                    key: values[0]
+                    for key, values in parse_qs(url.query).items()
+                }
+                klines_server.requests += 1
+                body = json.dumps(klines_server.get_page(query)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def check_backfill(bars: int,
+                   page_limit: int,
+                   overlap: bool = False,
+                   start: bool = False,
+                   ) -> dict:
+    """ Backfill every listed kline (or the latest half of them) from the
+        stand-in server, expecting each closed kline exactly once in order
+        and the open one dropped.
+    args:
+        bars (int): number of the listed klines
+        page_limit (int): maximum number of klines per request
+        overlap (bool): whether the pages overlap
+        start (bool): backfill from the middle kline rather than the
+                      first listed one
+
+    returns:
+        rows, expected rows, requests, seconds and whether they passed
+            (dict)
+    """
+    with KlinesServer(bars, overlap=overlap) as server:
+        api = BinanceApi(
+            base_url=server.base_url,
+            page_limit=page_limit,
+            client=HttpClient(max_retries=0),
+        )
+        first = server.open_times[bars // 2 if start else 0]
+        params = {"symbol": "STANDIN", "interval": INTERVAL.value}
+        if start:
+            params["start"] = pd.Timestamp(first, unit="ms")
+
+        begin = time.perf_counter()
+        candles = api.fetch_candles(params)
+        seconds = time.perf_counter() - begin
+
+    # the latest listed kline is still open
+    expected = pd.to_datetime([
+        (open_time + INTERVAL.milliseconds - 1) // 1000
+        for open_time in server.open_times[:-1] if open_time >= first
+    ], unit="s")
+    datetimes = pd.DatetimeIndex(candles["DateTime"])
+    return {
+        "case": f"bars={bars} page_limit={page_limit} "
+                f"overlap={overlap} start={start}",
+        "rows": len(candles),
+        "expected": len(expected),
+        "requests": server.requests,
+        "seconds": seconds,
+        "passed": bool(datetimes.equals(expected)),
+    }
+
+
+def _to_kline(open_time: int) -> list:
+    close_time = open_time + INTERVAL.milliseconds - 1
+    price = f"{100 + open_time % 7:.8f}"
+    return [open_time, price, price, price, price, "1.00000000",
+            close_time, "100.00000000", 1, "0.5", "50.0", "0"]
+
+
+def main(opt):
+    results = pd.DataFrame([
+        check_backfill(opt.bars, opt.page_limit, overlap, start)
+        for overlap in (False, True)
+        for start in (False, True)
+    ])
+    print(results.to_string(index=False))
+    return 0 if results["passed"].all() else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=5000)
+    parser.add_argument("--page-limit", type=int, default=1000)
+    args = parser.parse_args()
+    sys.exit(main(args))
@@ -0,0 +1,115 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmark.suite_benchmark import make_candles
+from constants import IndicatorBackendType
+from indicator.lookback import LOOKBACK_REGISTRY, get_lookback as \
+    get_indicator_lookback
+from registry import get_indicator, get_lookback, get_strategy_function
+from registry.registry import STRATEGY_FUNCTION_REGISTRY
+
+
+def check_indicators(candles: pd.DataFrame,
+                     indicator_backend: str,
+                     rtol: float = 1e-6,
+                     ) -> pd.DataFrame:
+    """ Compare the latest value of every indicator computed from its
+        lookback with the one computed from the whole history.
+    args:
+        candles (pd.DataFrame): candles indexed by datetime
+        indicator_backend (str): indicator backend of IndicatorBackendType
+        rtol (float): relative tolerance
+
+    returns:
+        lookback and relative difference of each output of each indicator
+            (pd.DataFrame)
+    """
+    indicator_class = get_indicator(indicator_backend)
+    rows = []
+    for name in LOOKBACK_REGISTRY:
+        lookback = get_indicator_lookback(name)
+        outputs = [
+            getattr(indicator_class(tail), name)()
+            for tail in (candles, candles.tail(lookback))
+        ]
+        if not isinstance(outputs[0], tuple):
+            outputs = [(output,) for output in outputs]
+
+        for position, (expected, actual) in enumerate(zip(*outputs)):
+            expected, actual = float(expected[-1]), float(actual[-1])
+            difference = abs(expected - actual) / max(abs(expected), 1e-12)
+            rows.append({
+                "indicator": name,
+                "output": position,
+                "lookback": lookback,
+                "rel_diff": difference,
+                "passed": bool(difference <= rtol),
+            })
+    return pd.DataFrame(rows)
+
+
+def check_strategies(candles: pd.DataFrame,
+                     indicator_backend: str,
+                     tail_bars: int,
+                     ) -> pd.DataFrame:
+    """ Compare the signals of the latest tail_bars bars of every strategy
+        function computed from the tail and its lookback (as backtest.py
+        loads by tail_bars) with the ones computed from the whole history.
+    args:
+        candles (pd.DataFrame): candles indexed by datetime
+        indicator_backend (str): indicator backend of IndicatorBackendType
+        tail_bars (int): number of the latest bars to be compared
+
+    returns:
+        bars loaded, mismatched signals and the seconds of both of each
+            strategy function (pd.DataFrame)
+    """
+    indicator_class = get_indicator(indicator_backend)
+    indicator_class.cache = None
+    rows = []
+    for (strategy_type, indicator_type), entry in \
+            STRATEGY_FUNCTION_REGISTRY.items():
+        if indicator_type is None:
+            continue
+        bars = tail_bars - 1 + get_lookback(strategy_type, indicator_type, {})
+        signals, seconds = [], []
+        for tail in (candles, candles.tail(bars)):
+            start = time.perf_counter()
+            signals.append(get_strategy_function(
+                strategy_type, indicator_type, indicator_class(tail))())
+            seconds.append(time.perf_counter() - start)
+        rows.append({
+            "strategy": f"{strategy_type.value}.{entry.method}",
+            "bars": bars,
+            "mismatches": int(np.sum(
+                signals[0][-tail_bars:] != signals[1][-tail_bars:])),
+            "full_seconds": seconds[0],
+            "tail_seconds": seconds[1],
+        })
+    return pd.DataFrame(rows)
+
+
+def main(opt):
+    candles = make_candles(opt.bars)
+    passed = True
+    for backend in IndicatorBackendType.list():
+        print(f"indicator backend: {backend}")
+        indicators = check_indicators(candles, backend)
+        strategies = check_strategies(candles, backend, opt.tail_bars)
+        print(indicators.to_string(index=False))
+        print(strategies.to_string(index=False))
+        passed &= bool(indicators["passed"].all()) \
+            and not strategies["mismatches"].any()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=100000)
+    parser.add_argument("--tail-bars", type=int, default=100)
+    args = parser.parse_args()
+    sys.exit(main(args))
@@ -0,0 +1,117 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORTS = [
+    "backtest",
+    "api",
+    "api.binance_api",
+    "api.yahoo_api",
+    "indicator.talib_indicator",
+    "strategy",
+    "engine.vectorized_engine",
+    "engine.backtesting_engine",
+]
+
+# run in a fresh interpreter: from the config to the first signal,
+# reading the candles from the local storage only
+FIRST_SIGNAL = """
+import time
+start = time.perf_counter()
+import sys
+import yaml
+from constants import Config
+from indicator.talib_indicator import Indicator
+from registry import get_storage, get_strategy_function
+with open(sys.argv[1]) as f:
+    opt = yaml.load(f, Loader=yaml.FullLoader)
+storage = get_storage(opt[Config.STORAGE])(sys.argv[2])
+candles = storage.load(opt[Config.SYMBOL], opt[Config.INTERVAL])
+signal = get_strategy_function(
+    opt[Config.STRATEGY], opt[Config.INDICATOR], Indicator(candles))()
+print(time.perf_counter() - start)
+"""
+
+
+def measure_import(module: str, repeat: int) -> float:
+    """ Median seconds of importing the module in fresh interpreters."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    return statistics.median(
+        float(_run_python(["-c", code])) for _ in range(repeat))
+
+
+def measure_first_signal(bars: int, repeat: int) -> tuple:
+    """ Median seconds from the config to the first signal, measured
+        inside the interpreter and including the interpreter startup."""
+    with tempfile.TemporaryDirectory() as directory:
+        from storage.columnar_storage import ColumnarStorage
+
+        rng = np.random.default_rng(0)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, bars)))
+        ColumnarStorage(directory).append("SYNTHETIC", "1m", pd.DataFrame({
+            "DateTime": pd.date_range("2020-01-01", periods=bars,
+                                      freq="min"),
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": 1.0,
+        }))
+        config = os.path.join(directory, "config.yaml")
+        with open(config, "w") as f:
+            yaml.dump({
+                "storage": "ColumnarStorage",
+                "symbol": "SYNTHETIC",
+                "interval": "1m",
+                "strategy": "CrossOverStrategy",
+                "indicator": "MACD",
+            }, f)
+
+        inside, total = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            inside.append(float(_run_python(
+                ["-c", FIRST_SIGNAL, config, directory])))
+            total.append(time.perf_counter() - start)
+    return statistics.median(inside), statistics.median(total)
+
+
+def _run_python(args: list) -> str:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip().splitlines()[-1]
+
+
+def main(opt):
+    print(f"{'import':<40}{'seconds':>10}")
+    for module in IMPORTS:
+        print(f"{module:<40}{measure_import(module, opt.repeat):>10.3f}")
+
+    inside, total = measure_first_signal(opt.bars, opt.repeat)
+    print(f"{'config to first signal':<40}{inside:>10.3f}")
+    print(f"{'  including interpreter startup':<40}{total:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--bars", type=int, default=100000)
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,203 @@
+import argparse
+import inspect
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from api.adapter import ApiAdapter
+from constants import Config, CrawlerColumns, EngineType
+from indicator.base import BaseIndicator
+from indicator.talib_indicator import Indicator
+from registry import get_engine, get_strategy_function
+from registry.registry import STRATEGY_FUNCTION_REGISTRY
+from storage.csv_storage import CsvStorage
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYMBOL = "SYNTHETIC"
+INTERVAL = "1m"
+
+
+def make_candles(bars: int, seed: int = 0) -> pd.DataFrame:
+    """ Reproducible random walk candles indexed by datetime."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, bars)))
+    open_ = np.concatenate(([100.0], close[:-1]))
+    spread = np.abs(rng.normal(0, 5e-4, bars)) * close
+    return pd.DataFrame(
+        {
+            CrawlerColumns.OPEN.value: open_,
+            CrawlerColumns.HIGH.value: np.maximum(open_, close) + spread,
+            CrawlerColumns.LOW.value: np.minimum(open_, close) - spread,
+            CrawlerColumns.CLOSE.value: close,
+            CrawlerColumns.VOLUME.value: rng.uniform(1, 100, bars),
+        },
+        index=pd.date_range("2000-01-01", periods=bars, freq="min"),
+    )
+
+
+def get_cases(candles: pd.DataFrame,
+              directory: str,
+              engines: list,
+              ) -> dict:
+    """ Name and function of every benchmark case over the candles.
+    args:
+        candles (pd.DataFrame): synthetic candles
+        directory (str): directory of the stored csv
+        engines (list): engine types of the end-to-end backtests
+
+    returns:
+        functions without arguments of each case (dict[str, Callable])
+    """
+    indicator = Indicator(candles)
+    close = candles[CrawlerColumns.CLOSE.value].to_numpy()
+    cases = {}
+    for name in sorted(BaseIndicator.__abstractmethods__):
+        method = getattr(indicator, name)
+        if "data" in inspect.signature(method).parameters:
+            cases[f"indicator.{name}"] = _bind(method, close)
+        else:
+            cases[f"indicator.{name}"] = method
+
+    for (strategy_type, indicator_type), entry in \
+            STRATEGY_FUNCTION_REGISTRY.items():
+        if indicator_type is None:
+            continue
+        cases[f"strategy.{strategy_type.value}.{entry.method}"] = \
+            get_strategy_function(strategy_type, indicator_type, indicator)
+
+    storage = CsvStorage(directory)
+    storage.write(SYMBOL, INTERVAL, candles.rename_axis(
+        CrawlerColumns.DATETIME.value).reset_index())
+    api_adapter = ApiAdapter(None, storage, cache_only=True)
+    params = {Config.SYMBOL: SYMBOL, Config.INTERVAL: INTERVAL}
+    cases["storage.csv_load"] = _bind(api_adapter.fetch_candles, params)
+
+    for engine_type in engines:
+        cases[f"backtest.{engine_type}"] = _bind(
+            _backtest, api_adapter, params, engine_type)
+    return cases
+
+
+def measure(function: Callable, repeat: int) -> tuple:
+    """ Best seconds of the repeated calls, and the peak bytes allocated by
+        a separate traced call."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(seconds), peak
+
+
+def compare(results: dict,
+            baseline: dict,
+            tolerance: float,
+            ) -> list:
+    """ Cases slower than the baseline by more than the tolerance.
+    args:
+        results (dict): seconds of each case and number of bars
+        baseline (dict): stored results of the same layout
+        tolerance (float): allowed ratio of slowdown, e.g. 0.2
+
+    returns:
+        regressed (case, bars, seconds, baseline seconds) (list[tuple])
+    """
+    regressions = []
+    for case, by_bars in results.items():
+        for bars, result in by_bars.items():
+            expected = baseline.get(case, {}).get(bars)
+            if expected is None:
+                continue
+            if result["seconds"] > expected["seconds"] * (1 + tolerance):
+                regressions.append(
+                    (case, bars, result["seconds"], expected["seconds"]))
+    return regressions
+
+
+def _bind(function: Callable, *args) -> Callable:
+    return lambda: function(*args)
+
+
+def _backtest(api_adapter: ApiAdapter,
+              params: dict,
+              engine_type: str,
+              ) -> pd.Series:
+    """ Load the stored candles, compute the signal and backtest it."""
+    candles = api_adapter.fetch_candles(dict(params))
+    signal = get_strategy_function(
+        "CrossOverStrategy", "MACD", Indicator(candles))()
+    return get_engine(engine_type)().run(candles, signal)
+
+
+def main(opt):
+    # the benchmark measures the computation, not the cache of results
+    Indicator.cache = None
+    pattern = re.compile(opt.filter) if opt.filter else None
+
+    results = {}
+    print(f"{'case':<58}{'bars':>10}{'seconds':>10}"
+          f"{'bars/sec':>14}{'peak MiB':>10}")
+    for bars in opt.bars:
+        with tempfile.TemporaryDirectory() as directory:
+            cases = get_cases(make_candles(bars), directory, opt.engines)
+            for case, function in cases.items():
+                if pattern is not None and not pattern.search(case):
+                    continue
+                seconds, peak = measure(function, opt.repeat)
+                results.setdefault(case, {})[str(bars)] = {
+                    "seconds": seconds,
+                    "bars_per_second": bars / seconds,
+                    "peak_bytes": peak,
+                }
+                print(f"{case:<58}{bars:>10}{seconds:>10.4f}"
+                      f"{bars / seconds:>14.0f}{peak / 2 ** 20:>10.1f}")
+
+    if opt.save_baseline:
+        with open(opt.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        return 0
+    if not os.path.exists(opt.baseline):
+        return 0
+
+    with open(opt.baseline) as f:
+        regressions = compare(results, json.load(f), opt.tolerance)
+    for case, bars, seconds, expected in regressions:
+        print(f"REGRESSION {case} at {bars} bars: "
+              f"{seconds:.4f}s against {expected:.4f}s")
+    return 1 if regressions else 0
+
+
+def _parse_args(args: Optional[list] = None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, nargs="+",
+                        default=[10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", type=str, default=None,
+                        help="regular expression of the cases to run")
+    parser.add_argument("--engines", type=str, nargs="+",
+                        default=[EngineType.VECTORIZED_ENGINE.value],
+                        choices=EngineType.list())
+    parser.add_argument("--baseline", type=str, default=os.path.join(
+        ROOT, "benchmark", "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    return parser.parse_args(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(_parse_args()))
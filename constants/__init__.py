@@ -2,14 +2,24 @@ from constants.constants import (
     ApiType,
     Config,
     CrawlerColumns,
+    EngineType,
+    IndicatorBackendType,
     IndicatorType,
+    IntervalType,
+    RuleRole,
+    StorageType,
     StrategyType,
 )
 
 __all__ = [
     "Config",
     "ApiType",
+    "StorageType",
     "StrategyType",
+    "RuleRole",
     "IndicatorType",
+    "IndicatorBackendType",
+    "IntervalType",
+    "EngineType",
     "CrawlerColumns",
 ]
@@ -5,10 +5,39 @@ class Config(str, ExtendedEnum):
     API = "api"
     SYMBOL = "symbol"
     INTERVAL = "interval"
+    START = "start"
     STRATEGY = "strategy"
     INDICATOR = "indicator"
     CASH = "cash"
     COMMISSION = "commission"
+    STORAGE = "storage"
+    ENGINE = "engine"
+    PLOT = "plot"
+    SYMBOLS = "symbols"
+    STRATEGIES = "strategies"
+    INDICATORS = "indicators"
+    PARAMETERS = "parameters"
+    PROCESSES = "processes"
+    OUTPUT = "output"
+    POLL_INTERVAL = "poll_interval"
+    WARM_UP_BARS = "warm_up_bars"
+    CACHE_ONLY = "cache_only"
+    TIMEFRAME = "timeframe"
+    RULES = "rules"
+    WEIGHT = "weight"
+    ROLE = "role"
+    TRAIN_BARS = "train_bars"
+    TEST_BARS = "test_bars"
+    STEP_BARS = "step_bars"
+    METRIC = "metric"
+    PROFILE = "profile"
+    PROFILE_OUTPUT = "profile_output"
+    CPROFILE_OUTPUT = "cprofile_output"
+    COMPACT = "compact"
+    INDICATOR_BACKEND = "indicator_backend"
+    BARS = "bars"
+    TAIL_BARS = "tail_bars"
+    SIGNAL_CACHE = "signal_cache"
 
 
 class ApiType(ExtendedEnum):
@@ -16,9 +45,54 @@ class ApiType(ExtendedEnum):
     YAHOO_API = "YahooFinanceApi"
 
 
+class IntervalType(ExtendedEnum):
+    MINUTE_1 = "1m"
+    MINUTE_3 = "3m"
+    MINUTE_5 = "5m"
+    MINUTE_15 = "15m"
+    MINUTE_30 = "30m"
+    HOUR_1 = "1h"
+    HOUR_2 = "2h"
+    HOUR_4 = "4h"
+    HOUR_6 = "6h"
+    HOUR_8 = "8h"
+    HOUR_12 = "12h"
+    DAY_1 = "1d"
+    DAY_3 = "3d"
+    WEEK_1 = "1w"
+    MONTH_1 = "1M"  # approximated by 31 days
+
+    @property
+    def milliseconds(self) -> int:
+        units = {
+            "m": 60 * 1000,
+            "h": 60 * 60 * 1000,
+            "d": 24 * 60 * 60 * 1000,
+            "w": 7 * 24 * 60 * 60 * 1000,
+            "M": 31 * 24 * 60 * 60 * 1000,
+        }
+        return int(self.value[:-1]) * units[self.value[-1]]
+
+
+class EngineType(ExtendedEnum):
+    BACKTESTING_ENGINE = "BacktestingEngine"
+    VECTORIZED_ENGINE = "VectorizedEngine"
+
+
+class StorageType(ExtendedEnum):
+    CSV_STORAGE = "CsvStorage"
+    COLUMNAR_STORAGE = "ColumnarStorage"
+
+
 class StrategyType(ExtendedEnum):
     CROSSOVER_STRATEGY = "CrossOverStrategy"
     OVERREACT_STRATEGY = "OverReactStrategy"
+    COMPOSITE_STRATEGY = "CompositeStrategy"
+
+
+class RuleRole(ExtendedEnum):
+    TRIGGER = "trigger"  # votes for buying or selling
+    FILTER = "filter"  # vetoes the opposite trades
 
 
 class IndicatorType(ExtendedEnum):
@@ -36,6 +110,11 @@ class IndicatorType(ExtendedEnum):
     WILLR = "WILLR"
 
 
+class IndicatorBackendType(ExtendedEnum):
+    TALIB = "TaLib"
+    NUMPY = "NumPy"
+
+
 class CrawlerColumns(ExtendedEnum):
     DATETIME = "DateTime"  # millisecond
     OPEN = "Open"
@@ -0,0 +1,13 @@
+from utils.lazy import lazy_getattr
+
+_MODULES = {
+    "BacktestingEngine": "engine.backtesting_engine",
+    "BatchRunner": "engine.batch_runner",
+    "Screener": "engine.screener",
+    "WalkForward": "engine.walk_forward",
+    "VectorizedEngine": "engine.vectorized_engine",
+}
+
+__all__ = list(_MODULES)
+
+__getattr__ = lazy_getattr(__name__, _MODULES)
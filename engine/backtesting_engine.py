@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+from backtesting import Backtest, Strategy
+
+from engine.base import BaseEngine
+
+
+class BacktestingEngine(BaseEngine):
+    def __init__(self, cash: float = 10000, commission: float = 0.0):
+        """ Backtest by backtesting.py, calling the strategy per bar."""
+        super().__init__(cash, commission)
+        self.backtest = None
+
+    def run(self, candles: pd.DataFrame, signal: np.ndarray) -> pd.Series:
+        """
+        args:
+            candles (pd.DataFrame): candles indexed by datetime, or compact
+                                    candles
+            signal (np.ndarray): signal for trading points
+                                (1 for buying and -1 for selling)
+
+        returns:
+            statistics of the backtest (pd.Series)
+        """
+        if not isinstance(candles, pd.DataFrame):
+            candles = candles.to_frame()
+        self.backtest = Backtest(candles, BacktestStrategy,
+                                 cash=self.cash,
+                                 commission=self.commission,
+                                 )
+        return self.backtest.run(**{"signal": signal})
+
+    def plot(self) -> None:
+        self.backtest.plot()
+
+
+class BacktestStrategy(Strategy):
+    def __init__(self, broker, data, params) -> None:
+        """ Setup signal from argument params."""
+        self.signal = None
+        super().__init__(broker, data, params)
+
+    def init(self):
+        """ Add signal as indicators."""
+        self.signal = self.I(lambda x: self.signal, "signal")
+        super().init()
+
+    def next(self) -> None:
+        """ Make strategy decisions."""
+        super().next()
+        current_signal = self.signal[-1]
+
+        if current_signal > 0:
+            self.buy()
+        if current_signal < 0:
+            self.sell()
@@ -0,0 +1,22 @@
+import abc
+
+import numpy as np
+import pandas as pd
+
+
+class BaseEngine(metaclass=abc.ABCMeta):
+    def __init__(self, cash: float = 10000, commission: float = 0.0):
+        """ Get the initial cash and the commission ratio of a trade."""
+        self.cash = cash
+        self.commission = commission
+
+    @abc.abstractmethod
+    def run(self, candles: pd.DataFrame, signal: np.ndarray) -> pd.Series:
+        """ Backtest the signal (1 for buying and -1 for selling) over the
+            candles and return the statistics."""
+        pass
+
+    @abc.abstractmethod
+    def plot(self) -> None:
+        """ Plot the result of the latest run."""
+        pass
@@ -0,0 +1,148 @@
+import itertools
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import pandas as pd
+
+from constants.constants import EngineType, IndicatorBackendType
+from registry.registry import (
+    get_engine,
+    get_indicator,
+    get_strategy_function,
+    validate_parameters,
+)
+from storage.shared_candles import SharedCandles
+
+BatchJob = namedtuple(
+    "BatchJob", ["symbol", "strategy", "indicator", "parameters"])
+
+# candles attached by the worker process, keyed by symbol; the blocks are
+# kept referenced since the dataframes are views of their memory
+_worker_shared_candles = {}
+_worker_candles = {}
+
+
+class BatchRunner:
+    def __init__(self,
+                 engine_type: str = EngineType.VECTORIZED_ENGINE.value,
+                 cash: float = 10000,
+                 commission: float = 0.0,
+                 processes: Optional[int] = None,
+                 directory: Optional[str] = None,
+                 indicator_backend: str = IndicatorBackendType.TALIB.value,
+                 ):
+        """ Backtest a matrix of jobs on a process pool, headless.
+        args:
+            engine_type (str): backtest engine of EngineType
+            cash (float): initial cash of each job
+            commission (float): commission ratio of a trade
+            processes (int): number of worker processes, cpu count if None
+            directory (str): directory of memory mapped files sharing the
+                             candles, shared memory if None
+            indicator_backend (str): indicator backend of
+                                     IndicatorBackendType
+        """
+        self.engine_type = engine_type
+        self.cash = cash
+        self.commission = commission
+        self.processes = processes
+        self.directory = directory
+        self.indicator_backend = indicator_backend
+
+    def run(self,
+            candles: dict,
+            strategies: list,
+            indicators: list,
+            parameters: Optional[dict] = None,
+            ) -> pd.DataFrame:
+        """ Backtest every symbol x strategy x indicator x parameter set.
+        args:
+            candles (dict[str, pd.DataFrame]): candles of each symbol
+            strategies (list): strategy types of StrategyType
+            indicators (list): indicator types of IndicatorType
+            parameters (dict[str, dict[str, list[dict]]]): parameter sets
+                of each strategy type and indicator type passed to the
+                strategy function, the default parameters if missing
+
+        returns:
+            statistics of each job (pd.DataFrame)
+        """
+        parameters = parameters or {}
+        jobs = [
+            BatchJob(symbol, strategy_type, indicator_type,
+                     json.dumps(parameter_set, sort_keys=True))
+            for symbol, strategy_type, indicator_type in itertools.product(
+                candles, strategies, indicators)
+            for parameter_set in parameters.get(strategy_type, {})
+            .get(indicator_type, [{}])
+        ]
+
+        shared_candles = {
+            symbol: SharedCandles.from_frame(
+                symbol_candles,
+                filename=None if self.directory is None
+                else os.path.join(self.directory, f"{symbol}.candles"),
+            )
+            for symbol, symbol_candles in candles.items()
+        }
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_attach_candles,
+                initargs=({
+                    symbol: shared.handle
+                    for symbol, shared in shared_candles.items()
+                },),
+            ) as executor:
+                rows = list(executor.map(
+                    _run_job,
+                    jobs,
+                    itertools.repeat((
+                        self.engine_type,
+                        self.cash,
+                        self.commission,
+                        self.indicator_backend,
+                    )),
+                    chunksize=max(1, len(jobs) // (8 * (self.processes or 8))),
+                ))
+        finally:
+            for shared in shared_candles.values():
+                shared.unlink()
+
+        return pd.DataFrame(rows)
+
+
+def _attach_candles(handles: dict) -> None:
+    """ Map the shared candles once per worker process."""
+    for symbol, handle in handles.items():
+        _worker_shared_candles[symbol] = SharedCandles.attach(handle)
+        _worker_candles[symbol] = _worker_shared_candles[symbol].to_frame()
+
+
+def _run_job(job: BatchJob, engine_options: tuple) -> dict:
+    """ Backtest a job and flatten its statistics into a row."""
+    engine_type, cash, commission, indicator_backend = engine_options
+    row = job._asdict()
+    try:
+        parameters = validate_parameters(
+            job.strategy, job.indicator, json.loads(job.parameters))
+        signal = get_strategy_function(
+            job.strategy,
+            job.indicator,
+            get_indicator(indicator_backend)(
+                _worker_shared_candles[job.symbol]),
+        )(**parameters)
+
+        job_engine = get_engine(engine_type)(
+            cash=cash, commission=commission)
+        statistics = job_engine.run(_worker_candles[job.symbol], signal)
+        row.update({
+            key: value for key, value in statistics.items()
+            if not key.startswith("_")
+        })
+    except Exception as error:
+        row["error"] = str(error)
+    return row
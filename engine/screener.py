@@ -0,0 +1,136 @@
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import IndicatorType, StrategyType
+from indicator.panel_indicator import PanelIndicator
+from registry.registry import (
+    get_lookback,
+    get_strategy,
+    get_strategy_entry,
+    validate_parameters,
+)
+from storage.base import BaseStorage
+from storage.panel_candles import PanelCandles
+
+SCREENER_COLUMNS = [
+    "rank", "symbol", "datetime", "signal", "last_signal",
+    "bars_since_signal", "score",
+]
+
+
+class Screener:
+    def __init__(self,
+                 storage: BaseStorage,
+                 bars: Optional[int] = None,
+                 tail_bars: int = 100,
+                 ):
+        """ Rank a universe of symbols by the latest signal of a strategy,
+            computed at once over the latest bars of every symbol.
+        args:
+            storage (BaseStorage): local storage of the candles, only the
+                                   latest bars of each symbol are read
+            bars (int): number of the latest bars of each symbol, the
+                        tail_bars with the lookback of the strategy
+                        function before them if None
+            tail_bars (int): number of the latest bars whose signals are
+                             searched for the last nonzero one
+        """
+        self.storage = storage
+        self.bars = bars
+        self.tail_bars = tail_bars
+
+    def run(self,
+            symbols: list,
+            interval: str,
+            strategy: StrategyType,
+            indicator: IndicatorType,
+            parameters: Optional[dict] = None,
+            ) -> pd.DataFrame:
+        """
+        args:
+            symbols (list[str]): symbols of the universe
+            interval (str): interval of the candles
+            strategy (StrategyType): CrossOverStrategy or OverReactStrategy
+            indicator (IndicatorType)
+            parameters (dict): parameters of the strategy function
+
+        returns:
+            one row per symbol ranked by score (pd.DataFrame): the latest
+                datetime, the latest signal, the latest nonzero signal and
+                the bars since it, and the score of the latest bar
+        """
+        entry = get_strategy_entry(strategy, indicator)
+        assert entry.strategy_type in SCORE_REGISTRY, \
+            "The strategy type is unsupported by the screener."
+        parameters = validate_parameters(
+            strategy, indicator, parameters or {})
+
+        bars = self.bars or self.tail_bars - 1 + get_lookback(
+            strategy, indicator, parameters)
+        candles = {}
+        for symbol in symbols:
+            symbol_candles = self.storage.load_tail(symbol, interval, bars)
+            if not symbol_candles.empty:
+                candles[symbol] = symbol_candles
+        if not candles:
+            return pd.DataFrame(columns=SCREENER_COLUMNS)
+
+        panel = PanelCandles.from_tails(candles, bars)
+        # the lines are computed once for both the signals and the scores
+        panel_strategy = get_strategy(entry.strategy_type)(
+            PanelIndicator(panel))
+        lines = panel_strategy.get_lines(entry.method, **parameters)
+        signals = panel_strategy._get_signals(**lines)
+        scores = SCORE_REGISTRY[entry.strategy_type](**lines)
+
+        # position of the latest nonzero signal counted from the end
+        nonzero = signals[:, ::-1] != 0
+        bars_since = np.argmax(nonzero, axis=1).astype(float)
+        bars_since[~nonzero.any(axis=1)] = np.nan
+        last_signal = np.where(
+            np.isnan(bars_since), 0,
+            signals[np.arange(len(signals)),
+                    len(panel) - 1 - np.nan_to_num(bars_since).astype(int)])
+
+        results = pd.DataFrame({
+            "symbol": panel.symbols,
+            "datetime": panel.latest,
+            "signal": signals[:, -1],
+            "last_signal": last_signal,
+            "bars_since_signal": bars_since,
+            "score": scores[:, -1],
+        })
+        results = results.sort_values(
+            "score", ascending=False, na_position="last", kind="stable")
+        results.insert(0, "rank", np.arange(1, len(results) + 1))
+        return results.reset_index(drop=True)
+
+
+def _get_crossover_scores(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """ Spread of the fast line over the slow one relative to the slow
+        one, the strongest uptrend first."""
+    fast = np.asarray(fast, dtype=np.float64)
+    slow = np.broadcast_to(np.asarray(slow, dtype=np.float64), fast.shape)
+    spread = np.full(fast.shape, np.nan)
+    np.divide(fast - slow, np.abs(slow), out=spread, where=slow != 0)
+    # centerlines of zero, e.g. mtm, are ranked by the line itself
+    return np.where(slow == 0, fast, spread)
+
+
+def _get_overreact_scores(line: np.ndarray,
+                          lowerbound: float,
+                          upperbound: float,
+                          ) -> np.ndarray:
+    """ Distance of the line beyond the nearer bound, positive when oversold
+        or overbought and negative (how far from it) in between, e.g. rsi
+        of 25 and 75 both score 5 against the bounds 30/70."""
+    line = np.asarray(line, dtype=np.float64)
+    return np.maximum(lowerbound - line, line - upperbound)
+
+
+SCORE_REGISTRY: dict[StrategyType, Callable[..., np.ndarray]] = {
+    StrategyType.CROSSOVER_STRATEGY: _get_crossover_scores,
+    StrategyType.OVERREACT_STRATEGY: _get_overreact_scores,
+}
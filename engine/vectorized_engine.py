@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from engine.base import BaseEngine
+
+
+class VectorizedEngine(BaseEngine):
+    def __init__(self, cash: float = 10000, commission: float = 0.0):
+        """ Backtest by array operations over the whole history.
+            As BacktestStrategy does, a signal at a bar is filled at the
+            open of the next bar, buying goes long and selling goes short
+            with the whole equity; the commission is paid on the traded
+            value of each fill.
+        """
+        super().__init__(cash, commission)
+        self.result = None
+
+    def run(self, candles: pd.DataFrame, signal: np.ndarray) -> pd.Series:
+        """
+        args:
+            candles (pd.DataFrame): candles indexed by datetime, or compact
+                                    candles
+            signal (np.ndarray): signal for trading points
+                                (1 for buying and -1 for selling)
+
+        returns:
+            statistics of the backtest (pd.Series)
+        """
+        opens = np.asarray(candles[CrawlerColumns.OPEN.value], dtype=float)
+        closes = np.asarray(candles[CrawlerColumns.CLOSE.value], dtype=float)
+        positions = _get_positions(np.nan_to_num(np.asarray(signal)))
+
+        previous_positions = np.zeros_like(positions)
+        previous_positions[1:] = positions[:-1]
+        previous_closes = np.empty_like(closes)
+        previous_closes[0] = opens[0]
+        previous_closes[1:] = closes[:-1]
+
+        # hold the previous position over the gap to the open, pay the
+        # commission of the fill, then hold the new position to the close
+        factors = (1 + previous_positions * (opens / previous_closes - 1)) \
+            * (1 - self.commission * np.abs(positions - previous_positions)) \
+            * (1 + positions * (closes / opens - 1))
+        equity = self.cash * np.cumprod(factors)
+
+        trades = _get_trades(candles.index, opens, closes, positions,
+                             equity, self.commission)
+        self.result = _get_statistics(
+            candles.index, closes, positions, equity, trades, self.cash)
+        return self.result
+
+    def plot(self) -> None:
+        """ Plot the equity curve by bokeh, the plotting library of
+            backtesting.py."""
+        from bokeh.plotting import figure, show
+
+        equity_curve = self.result["_equity_curve"]
+        fig = figure(x_axis_type="datetime", title="Equity",
+                     sizing_mode="stretch_width")
+        fig.line(equity_curve.index, equity_curve["Equity"])
+        show(fig)
+
+
+def _get_positions(signal: np.ndarray) -> np.ndarray:
+    """ Position held from the open of each bar, i.e. the latest non-zero
+        signal before the bar."""
+    signs = np.sign(signal)
+    latest = np.where(signs != 0, np.arange(len(signs)), -1)
+    np.maximum.accumulate(latest, out=latest)
+    targets = np.where(latest >= 0, signs[np.maximum(latest, 0)], 0)
+
+    positions = np.zeros(len(signs), dtype=float)
+    positions[1:] = targets[:-1]
+    return positions
+
+
+def _get_trades(index: pd.Index,
+                opens: np.ndarray,
+                closes: np.ndarray,
+                positions: np.ndarray,
+                equity: np.ndarray,
+                commission: float,
+                ) -> pd.DataFrame:
+    """ Every run of the same non-zero position is a trade, entered at the
+        open of its first bar and exited at the open of the next change
+        (or the last close)."""
+    changes = np.flatnonzero(np.diff(positions, prepend=0))
+    entries = changes[positions[changes] != 0]
+    exits = np.searchsorted(changes, entries, side="right")
+    exits = np.append(changes, len(positions))[exits]
+
+    sizes = positions[entries]
+    entry_prices = opens[entries]
+    is_open = exits == len(positions)
+    exit_prices = np.where(
+        is_open, closes[-1], opens[np.minimum(exits, len(opens) - 1)])
+    returns = sizes * (exit_prices / entry_prices - 1) - 2 * commission
+
+    entry_equity = np.where(
+        entries > 0, equity[np.maximum(entries - 1, 0)], equity[0])
+    return pd.DataFrame({
+        "Size": sizes,
+        "EntryBar": entries,
+        "ExitBar": np.minimum(exits, len(positions) - 1),
+        "EntryPrice": entry_prices,
+        "ExitPrice": exit_prices,
+        "PnL": entry_equity * returns,
+        "ReturnPct": returns,
+        "EntryTime": index[entries],
+        "ExitTime": index[np.minimum(exits, len(positions) - 1)],
+    })
+
+
+def _get_statistics(index: pd.Index,
+                    closes: np.ndarray,
+                    positions: np.ndarray,
+                    equity: np.ndarray,
+                    trades: pd.DataFrame,
+                    cash: float,
+                    ) -> pd.Series:
+    """ Statistics named as the ones of backtesting.py."""
+    peaks = np.maximum.accumulate(equity)
+    drawdowns = 1 - equity / peaks
+    returns = trades["ReturnPct"].to_numpy()
+
+    statistics = pd.Series(dtype=object)
+    statistics["Start"] = index[0]
+    statistics["End"] = index[-1]
+    statistics["Duration"] = index[-1] - index[0]
+    statistics["Exposure Time [%]"] = np.mean(positions != 0) * 100
+    statistics["Equity Final [$]"] = equity[-1]
+    statistics["Equity Peak [$]"] = peaks[-1]
+    statistics["Return [%]"] = (equity[-1] / cash - 1) * 100
+    statistics["Buy & Hold Return [%]"] = (closes[-1] / closes[0] - 1) * 100
+    statistics["Max. Drawdown [%]"] = -drawdowns.max() * 100
+    statistics["# Trades"] = len(trades)
+    statistics["Win Rate [%]"] = \
+        np.mean(returns > 0) * 100 if len(returns) else np.nan
+    statistics["Best Trade [%]"] = \
+        returns.max() * 100 if len(returns) else np.nan
+    statistics["Worst Trade [%]"] = \
+        returns.min() * 100 if len(returns) else np.nan
+    statistics["Avg. Trade [%]"] = \
+        returns.mean() * 100 if len(returns) else np.nan
+    statistics["_equity_curve"] = pd.DataFrame(
+        {"Equity": equity, "DrawdownPct": drawdowns}, index=index)
+    statistics["_trades"] = trades
+    return statistics
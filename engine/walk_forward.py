@@ -0,0 +1,193 @@
+import itertools
+import json
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import EngineType, IndicatorBackendType
+from registry.registry import (
+    get_engine,
+    get_indicator,
+    get_strategy_function,
+    validate_parameters,
+)
+from storage.shared_array import SharedArray
+from storage.shared_candles import SharedCandles
+
+# positions of the bars, [train_start, train_end) and [test_start, test_end)
+Window = namedtuple(
+    "Window", ["train_start", "train_end", "test_start", "test_end"])
+
+# candles and signals of every parameter set attached by the worker
+# process; the blocks are kept referenced since the arrays are their views
+_worker_shared_candles = None
+_worker_candles = None
+_worker_shared_signals = None
+_worker_signals = None
+
+
+class WalkForward:
+    def __init__(self,
+                 engine_type: str = EngineType.VECTORIZED_ENGINE.value,
+                 cash: float = 10000,
+                 commission: float = 0.0,
+                 metric: str = "Return [%]",
+                 processes: Optional[int] = None,
+                 indicator_backend: str = IndicatorBackendType.TALIB.value,
+                 ):
+        """ Optimize the parameters on each train window and evaluate them
+            on the following test window, the windows run on a process pool.
+        args:
+            engine_type (str): backtest engine of EngineType
+            cash (float): initial cash of each backtest
+            commission (float): commission ratio of a trade
+            metric (str): statistic to be maximized on the train windows
+            processes (int): number of worker processes, cpu count if None
+            indicator_backend (str): indicator backend of
+                                     IndicatorBackendType
+        """
+        self.engine_type = engine_type
+        self.cash = cash
+        self.commission = commission
+        self.metric = metric
+        self.processes = processes
+        self.indicator_backend = indicator_backend
+
+    def run(self,
+            candles: pd.DataFrame,
+            strategy_type: str,
+            indicator_type: str,
+            parameter_grid: dict,
+            train_bars: int,
+            test_bars: int,
+            step_bars: Optional[int] = None,
+            ) -> pd.DataFrame:
+        """
+        args:
+            candles (pd.DataFrame): candles indexed by datetime
+            strategy_type (str): strategy type of StrategyType
+            indicator_type (str): indicator type of IndicatorType
+            parameter_grid (dict[str, list]): candidate values of each
+                parameter passed to the strategy function
+            train_bars (int): number of bars of a train window
+            test_bars (int): number of bars of a test window
+            step_bars (int): number of bars between windows, test_bars if
+                None so the test windows are consecutive
+
+        returns:
+            best parameters and statistics of each window (pd.DataFrame)
+        """
+        windows = get_windows(
+            len(candles), train_bars, test_bars, step_bars or test_bars)
+        assert windows, "The candles are shorter than a window."
+        parameter_sets = [
+            dict(zip(parameter_grid, values))
+            for values in itertools.product(*parameter_grid.values())
+        ]
+
+        # the indicators only look backward, so the signals of the whole
+        # history are computed once and sliced by the overlapping windows
+        strategy_function = get_strategy_function(
+            strategy_type,
+            indicator_type,
+            get_indicator(self.indicator_backend)(candles),
+        )
+        signals = np.vstack([
+            strategy_function(**validate_parameters(
+                strategy_type, indicator_type, parameter_set))
+            for parameter_set in parameter_sets
+        ])
+
+        shared_candles = SharedCandles.from_frame(candles)
+        shared_signals = SharedArray.from_array(signals)
+        del signals
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_attach_candles,
+                initargs=(shared_candles.handle, shared_signals.handle),
+            ) as executor:
+                rows = list(executor.map(
+                    _run_window,
+                    windows,
+                    itertools.repeat((
+                        self.engine_type,
+                        self.cash,
+                        self.commission,
+                        self.metric,
+                    )),
+                ))
+        finally:
+            shared_candles.unlink()
+            shared_signals.unlink()
+
+        for row in rows:
+            row["parameters"] = json.dumps(
+                parameter_sets[row["parameters"]], sort_keys=True)
+        return pd.DataFrame(rows)
+
+
+def get_windows(length: int,
+                train_bars: int,
+                test_bars: int,
+                step_bars: int,
+                ) -> list:
+    """ Slide the train and test windows over the bars.
+    args:
+        length (int): number of bars
+        train_bars (int): number of bars of a train window
+        test_bars (int): number of bars of a test window
+        step_bars (int): number of bars between windows
+
+    returns:
+        complete windows in order (list[Window])
+    """
+    return [
+        Window(start, start + train_bars,
+               start + train_bars, start + train_bars + test_bars)
+        for start in range(0, length - train_bars - test_bars + 1, step_bars)
+    ]
+
+
+def _attach_candles(handle, signals_handle) -> None:
+    """ Map the shared candles and signals once per worker process."""
+    global _worker_shared_candles, _worker_candles
+    global _worker_shared_signals, _worker_signals
+    _worker_shared_candles = SharedCandles.attach(handle)
+    _worker_candles = _worker_shared_candles.to_frame()
+    _worker_shared_signals = SharedArray.attach(signals_handle)
+    _worker_signals = _worker_shared_signals.array
+
+
+def _run_window(window: Window, options: tuple) -> dict:
+    """ Pick the parameter set maximizing the metric on the train window and
+        backtest it on the test window."""
+    engine_type, cash, commission, metric = options
+    engine = get_engine(engine_type)(cash=cash, commission=commission)
+
+    train = slice(window.train_start, window.train_end)
+    scores = np.array([
+        engine.run(_worker_candles.iloc[train], signal[train])[metric]
+        for signal in _worker_signals
+    ], dtype=float)
+    best = int(np.argmax(np.nan_to_num(scores, nan=-np.inf)))
+
+    test = slice(window.test_start, window.test_end)
+    statistics = engine.run(
+        _worker_candles.iloc[test], _worker_signals[best][test])
+    row = {
+        "train_start": _worker_candles.index[window.train_start],
+        "train_end": _worker_candles.index[window.train_end - 1],
+        "test_start": _worker_candles.index[window.test_start],
+        "test_end": _worker_candles.index[window.test_end - 1],
+        "parameters": best,
+        f"train {metric}": scores[best],
+    }
+    row.update({
+        key: value for key, value in statistics.items()
+        if not key.startswith("_")
+    })
+    return row
@@ -1,3 +1,23 @@
-from indicator.talib_indicator import Indicator
+from utils.lazy import lazy_getattr
 
-__all__ = ["Indicator"]
+_MODULES = {
+    "Indicator": "indicator.talib_indicator",
+    "IndicatorCache": "indicator.cache",
+    "NumpyIndicator": "indicator.numpy_indicator",
+    "PanelIndicator": "indicator.panel_indicator",
+    "StreamingSMA": "indicator.streaming_indicator",
+    "StreamingEMA": "indicator.streaming_indicator",
+    "StreamingWMA": "indicator.streaming_indicator",
+    "StreamingRSI": "indicator.streaming_indicator",
+    "StreamingMACD": "indicator.streaming_indicator",
+    "StreamingSTOCHF": "indicator.streaming_indicator",
+    "StreamingMOM": "indicator.streaming_indicator",
+    "StreamingROC": "indicator.streaming_indicator",
+    "StreamingWILLR": "indicator.streaming_indicator",
+    "StreamingMFI": "indicator.streaming_indicator",
+    "StreamingDX": "indicator.streaming_indicator",
+}
+
+__all__ = list(_MODULES)
+
+__getattr__ = lazy_getattr(__name__, _MODULES)
@@ -1,12 +1,38 @@
 import abc
 
 import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from indicator.cache import fingerprint
 
 
 class BaseIndicator(metaclass=abc.ABCMeta):
     def __init__(self, candles):
-        """ Get the historical candles data."""
+        """ Get the historical candles data, a dataframe or any container
+            exposing the columns as arrays, e.g. SharedCandles."""
         self.candles = candles
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> str:
+        """ Fingerprint of the candles, computed once per instance."""
+        if self._fingerprint is None:
+            if isinstance(self.candles, pd.DataFrame):
+                self._fingerprint = fingerprint(self.candles)
+            else:
+                self._fingerprint = fingerprint(
+                    self.candles.index,
+                    *(self.candles[column.value] for column in CrawlerColumns
+                      if column != CrawlerColumns.DATETIME),
+                )
+        return self._fingerprint
+
+    def _get_column(self, column: CrawlerColumns) -> np.ndarray:
+        """ Column as a contiguous float64 array, the backends compute on;
+            compact float32 candles are cast only while computing."""
+        return np.ascontiguousarray(
+            self.candles[column.value], dtype=np.float64)
 
     @abc.abstractmethod
     def bbands(self, timeperiod: int = 5) \
@@ -0,0 +1,151 @@
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from profiling.profiler import get_profiler
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "nbytes"])
+
+# memory bound of a cache by default, e.g. 64 results of 500k bars
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class IndicatorCache:
+    def __init__(self,
+                 maxsize: int = 256,
+                 max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+                 ):
+        """ Least recently used cache of indicator results. The cached
+            arrays are shared by every hit, so they are made read-only.
+        args:
+            maxsize (int): maximum number of results
+            max_bytes (int): maximum memory of results [unit: byte],
+                             unbounded if None
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        """ Get the cached result, None if missed."""
+        with self.lock:
+            if key not in self.results:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.results.move_to_end(key)
+            return self.results[key]
+
+    def put(self, key: Hashable, result) -> None:
+        """ Cache the result and evict the least recently used ones."""
+        with self.lock:
+            if key in self.results:
+                self.nbytes -= _get_nbytes(self.results.pop(key))
+            _set_readonly(result)
+            self.results[key] = result
+            self.nbytes += _get_nbytes(result)
+
+            while len(self.results) > self.maxsize or (
+                    self.max_bytes is not None
+                    and self.nbytes > self.max_bytes
+                    and len(self.results) > 1):
+                _, evicted = self.results.popitem(last=False)
+                self.nbytes -= _get_nbytes(evicted)
+
+    def clear(self) -> None:
+        """ Clear the results and the counters."""
+        with self.lock:
+            self.results.clear()
+            self.hits = self.misses = self.nbytes = 0
+
+    def info(self) -> CacheInfo:
+        """ Get the hit/miss counters and the size of the cache."""
+        with self.lock:
+            return CacheInfo(self.hits, self.misses,
+                             self.maxsize, len(self.results), self.nbytes)
+
+
+def fingerprint(*arrays) -> str:
+    """ Hash the content of arrays, series or dataframes."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        if isinstance(array, pd.DataFrame):
+            digest.update(fingerprint(
+                array.index, *(array[column] for column in array)).encode())
+            continue
+        if isinstance(array, pd.Index):
+            array = array.asi8 if array.dtype.kind == "M" else array.values
+        values = np.ascontiguousarray(np.asarray(array))
+        digest.update(str((values.dtype, values.shape)).encode())
+        # hash the buffer in place rather than a bytes copy of it
+        digest.update(values.tobytes() if values.dtype.hasobject
+                      else values.reshape(-1).view(np.uint8))
+    return digest.hexdigest()
+
+
+def cached(method: Callable) -> Callable:
+    """ Memoize an indicator method by its name, its parameters and the
+        fingerprint of the candles (and of the array parameters).
+    """
+    signature = inspect.signature(method)
+    stage = f"indicator.{method.__name__}"
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = get_profiler()
+        if self.cache is None:
+            with profiler.stage(stage):
+                return method(self, *args, **kwargs)
+
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        parameters = tuple(
+            (name, _get_hashable(value))
+            for name, value in arguments.arguments.items()
+            if name != "self"
+        )
+        key = (method.__name__, self.fingerprint, parameters)
+
+        result = self.cache.get(key)
+        if result is None:
+            with profiler.stage(stage):
+                result = method(self, *args, **kwargs)
+            self.cache.put(key, result)
+        else:
+            profiler.count("indicator.cache_hits")
+        return result
+
+    return wrapper
+
+
+def _get_hashable(value) -> Hashable:
+    if isinstance(value, (np.ndarray, pd.Series)):
+        return fingerprint(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _set_readonly(result) -> None:
+    if isinstance(result, tuple):
+        for value in result:
+            _set_readonly(value)
+    elif isinstance(result, np.ndarray):
+        result.flags.writeable = False
+
+
+def _get_nbytes(result) -> int:
+    if isinstance(result, tuple):
+        return sum(_get_nbytes(value) for value in result)
+    return getattr(result, "nbytes", 0)
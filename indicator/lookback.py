@@ -0,0 +1,98 @@
+import math
+
+# lookback of an indicator is the number of the latest bars its latest
+# value is computed from; the exponential indicators (e.g. ema, rsi) are
+# recursive over the whole history, so theirs includes the bars until the
+# seed weighs less than the tolerance of the value
+WARM_UP_TOLERANCE = 1e-8
+
+
+def get_warm_up(alpha: float) -> int:
+    """ Bars until the seed of an exponential smoothing weighs less than
+        the tolerance.
+    args:
+        alpha (float): smoothing factor, 2 / (period + 1) for ema and
+                       1 / period for Wilder's smoothing
+    """
+    return math.ceil(math.log(WARM_UP_TOLERANCE) / math.log(1 - alpha))
+
+
+def chain(*lookbacks: int) -> int:
+    """ Lookback of an indicator computed on another one, e.g. ema of mtm.
+    """
+    return sum(lookbacks) - len(lookbacks) + 1
+
+
+def bbands(timeperiod: int = 5, matype: int = 0) -> int:
+    return timeperiod
+
+
+def ema(timeperiod: int = 30) -> int:
+    return timeperiod + get_warm_up(2 / (timeperiod + 1))
+
+
+def sma(timeperiod: int = 30) -> int:
+    return timeperiod
+
+
+def wma(timeperiod: int = 30) -> int:
+    return timeperiod
+
+
+def dmi(timeperiod: int = 14) -> int:
+    return timeperiod + 1 + get_warm_up(1 / timeperiod)
+
+
+def kd(k_period: int = 5, d_period: int = 3, matype: int = 0) -> int:
+    return chain(k_period, d_period)
+
+
+def macd(fastperiod: int = 12,
+         slowperiod: int = 26,
+         signalperiod: int = 9,
+         ) -> int:
+    return chain(ema(max(fastperiod, slowperiod)), ema(signalperiod))
+
+
+def mfi(timeperiod: int = 14) -> int:
+    return timeperiod + 1
+
+
+def mtm(timeperiod: int = 10) -> int:
+    return timeperiod + 1
+
+
+def roc(timeperiod: int = 10) -> int:
+    return timeperiod + 1
+
+
+def rsi(timeperiod: int = 14) -> int:
+    return timeperiod + 1 + get_warm_up(1 / timeperiod)
+
+
+def willr(timeperiod: int = 14) -> int:
+    return timeperiod
+
+
+# lookback of each method of BaseIndicator, by the same parameters
+LOOKBACK_REGISTRY = {
+    "bbands": bbands,
+    "ema": ema,
+    "sma": sma,
+    "wma": wma,
+    "dmi": dmi,
+    "kd": kd,
+    "macd": macd,
+    "mfi": mfi,
+    "mtm": mtm,
+    "roc": roc,
+    "rsi": rsi,
+    "willr": willr,
+}
+
+
+def get_lookback(method: str, **parameters) -> int:
+    """ Lookback of the indicator method with its parameters."""
+    if method not in LOOKBACK_REGISTRY:
+        raise Exception(f"The lookback of {method} is undeclared.")
+    return LOOKBACK_REGISTRY[method](**parameters)
@@ -0,0 +1,556 @@
+import math
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from constants.constants import CrawlerColumns
+from indicator.base import BaseIndicator
+from indicator.cache import IndicatorCache, cached
+
+try:
+    # optional, the recursive kernels run as python loops without numba
+    import numba
+    jit = numba.njit(cache=True)
+except ImportError:
+    numba = None
+
+    def jit(function):
+        return function
+
+
+class NumpyIndicator(BaseIndicator):
+    # separated from the cache of the TA-Lib backend, whose results are
+    # keyed the same
+    cache: Optional[IndicatorCache] = IndicatorCache()
+
+    @cached
+    def bbands(self,
+               timeperiod: int = 5,
+               matype: int = 0,
+               ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+            matype (int): type of ma, only simple moving average (0)
+
+        returns:
+            bollinger bands[upperband, middleband, lowerband]
+                    (tuple[np.ndarray, np.ndarray, np.ndarray)
+        """
+        assert matype == 0, "The ma type is unsupported."
+        close = self._get_column(CrawlerColumns.CLOSE)
+        middleband = _sma(close, timeperiod)
+        deviation = np.full_like(close, np.nan)
+        if close.shape[-1] >= timeperiod:
+            deviation[..., timeperiod - 1:] = sliding_window_view(
+                close, timeperiod, axis=-1).std(axis=-1)
+        return middleband + 2 * deviation, middleband, \
+            middleband - 2 * deviation
+
+    @cached
+    def ema(self, timeperiod: int = 30) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            exponential moving average (np.ndarray)
+        """
+        return self.ema_many([timeperiod])[..., 0, :]
+
+    @cached
+    def ema_with_data(self,
+                      data: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            data (np.ndarray)
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            exponential moving average (np.ndarray)
+        """
+        return _ema(data, [timeperiod])[..., 0, :]
+
+    @cached
+    def ema_many(self, timeperiods: list) -> np.ndarray:
+        """ Exponential moving averages of several periods computed in one
+            pass over the close.
+        args:
+            timeperiods (list[int]) [unit: times of the data interval]
+
+        returns:
+            exponential moving average of each period
+                (np.ndarray) [shape: (periods, candles), or
+                              (symbols, periods, candles) of a panel]
+        """
+        return _ema(self._get_column(CrawlerColumns.CLOSE), timeperiods)
+
+    @cached
+    def sma(self, timeperiod: int = 30) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            simple moving average (np.ndarray)
+        """
+        return self.sma_many([timeperiod])[..., 0, :]
+
+    @cached
+    def sma_with_data(self,
+                      data: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            data (np.ndarray)
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            simple moving average (np.ndarray)
+        """
+        return _sma(np.asarray(data, dtype=np.float64), timeperiod)
+
+    @cached
+    def sma_many(self, timeperiods: list) -> np.ndarray:
+        """ Simple moving averages of several periods from one cumulative
+            sum of the close.
+        args:
+            timeperiods (list[int]) [unit: times of the data interval]
+
+        returns:
+            simple moving average of each period
+                (np.ndarray) [shape: (periods, candles), or
+                              (symbols, periods, candles) of a panel]
+        """
+        close = self._get_column(CrawlerColumns.CLOSE)
+        missing = np.isnan(close)
+        # count the nan alongside the sum so that only the windows
+        # containing nan stay nan, as _sma does
+        cumsum = _cumsum(np.where(missing, 0.0, close))
+        cumcount = _cumsum(missing)
+        smas = np.full(
+            close.shape[:-1] + (len(timeperiods), close.shape[-1]), np.nan)
+        for row, timeperiod in enumerate(timeperiods):
+            if close.shape[-1] < timeperiod:
+                continue
+            sma = smas[..., row, timeperiod - 1:]
+            np.subtract(cumsum[..., timeperiod:], cumsum[..., :-timeperiod],
+                        out=sma)
+            sma /= timeperiod
+            sma[cumcount[..., timeperiod:] > cumcount[..., :-timeperiod]] = \
+                np.nan
+        return smas
+
+    @cached
+    def wma(self, timeperiod: int = 30) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            weighted moving average (np.ndarray)
+        """
+        return _wma(self._get_column(CrawlerColumns.CLOSE), timeperiod)
+
+    @cached
+    def wma_with_data(self,
+                      data: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            data (np.ndarray)
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            weighted moving average (np.ndarray)
+        """
+        return _wma(np.asarray(data, dtype=np.float64), timeperiod)
+
+    @cached
+    def dmi(self, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            directional movement index (np.ndarray)
+        """
+        close = self._get_column(CrawlerColumns.CLOSE)
+        dmi = np.empty(close.shape)
+        _dx_kernel(
+            _get_rows(self._get_column(CrawlerColumns.HIGH)),
+            _get_rows(self._get_column(CrawlerColumns.LOW)),
+            _get_rows(close),
+            timeperiod,
+            _get_rows(dmi),
+        )
+        return dmi
+
+    @cached
+    def kd(self,
+           k_period: int = 5, d_period: int = 3,
+           matype: int = 0,
+           ) -> np.ndarray:
+        """
+        args:
+            k_period (int) [unit: times of the data interval]
+            d_period (int) [unit: times of the data interval]
+            matype (int): type of ma, only simple moving average (0)
+
+        returns:
+            stochastic oscillator[k, d] (tuple[np.ndarray, np.ndarray])
+        """
+        assert matype == 0, "The ma type is unsupported."
+        close = self._get_column(CrawlerColumns.CLOSE)
+        highest, lowest = _rolling_extremes(
+            self._get_column(CrawlerColumns.HIGH),
+            self._get_column(CrawlerColumns.LOW),
+            k_period,
+        )
+        k = _ratio(close - lowest, highest - lowest) * 100
+        d = _sma(k, d_period)
+        k[np.isnan(d)] = np.nan
+        return k, d
+
+    @cached
+    def macd(self,
+             fastperiod: int = 12,
+             slowperiod: int = 26,
+             signalperiod: int = 9,
+             ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        args:
+            slowperiod (int) [unit: times of the data interval]
+            fastperiod (int) [unit: times of the data interval]
+            signalperiod (int) [unit: times of the data interval]
+
+        returns:
+            moving average convergence/divergence
+                [macd, macdsignal, macdhist]
+                    (tuple[np.ndarray, np.ndarray, np.ndarray)
+        """
+        close = self._get_column(CrawlerColumns.CLOSE)
+        if slowperiod < fastperiod:
+            fastperiod, slowperiod = slowperiod, fastperiod
+        # as TA-Lib does, the fast ema starts with the slow one, seeded by
+        # the last fast period of the first slow period after the leading
+        # nan
+        slow = _ema(close, [slowperiod])[..., 0, :]
+        leading = np.cumprod(np.isnan(close), axis=-1) \
+            .sum(axis=-1, keepdims=True)
+        fast = _ema(np.where(
+            np.arange(close.shape[-1]) < leading + slowperiod - fastperiod,
+            np.nan, close), [fastperiod])[..., 0, :]
+        macd = fast - slow
+        signal = _ema(macd, [signalperiod])[..., 0, :]
+        macd[np.isnan(signal)] = np.nan
+        return macd, signal, macd - signal
+
+    @cached
+    def mfi(self, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            money flow index (np.ndarray)
+        """
+        typical_price = (self._get_column(CrawlerColumns.HIGH)
+                         + self._get_column(CrawlerColumns.LOW)
+                         + self._get_column(CrawlerColumns.CLOSE)) / 3
+        money_flow = typical_price[..., 1:] \
+            * self._get_column(CrawlerColumns.VOLUME)[..., 1:]
+        difference = np.diff(typical_price, axis=-1)
+        # the windows containing nan stay nan rather than count no flow
+        no_flow = np.where(np.isnan(difference), np.nan, 0.0)
+        positive = _rolling_sum(
+            np.where(difference > 0, money_flow, no_flow), timeperiod)
+        negative = _rolling_sum(
+            np.where(difference < 0, money_flow, no_flow), timeperiod)
+
+        total = positive + negative
+        mfi = np.full(typical_price.shape, np.nan)
+        mfi[..., 1:] = np.where(
+            total < 1.0, 0.0, 100 * positive / np.where(total < 1.0, 1, total))
+        return mfi
+
+    @cached
+    def mtm(self, timeperiod: int = 10) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            momentum (np.ndarray)
+        """
+        close = self._get_column(CrawlerColumns.CLOSE)
+        mtm = np.full_like(close, np.nan)
+        mtm[..., timeperiod:] = \
+            close[..., timeperiod:] - close[..., :-timeperiod]
+        return mtm
+
+    @cached
+    def roc(self, timeperiod: int = 10) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            rate of change (np.ndarray)
+        """
+        close = self._get_column(CrawlerColumns.CLOSE)
+        roc = np.full_like(close, np.nan)
+        roc[..., timeperiod:] = _ratio(
+            close[..., timeperiod:], close[..., :-timeperiod], 1.0) * 100 \
+            - 100
+        return roc
+
+    @cached
+    def rsi(self, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            relative strength index (np.ndarray)
+        """
+        close = self._get_column(CrawlerColumns.CLOSE)
+        rsi = np.empty(close.shape)
+        _rsi_kernel(_get_rows(close), timeperiod, _get_rows(rsi))
+        return rsi
+
+    @cached
+    def willr(self, timeperiod: int = 14) -> np.ndarray:
+        """
+        args:
+            timeperiod (int) [unit: times of the data interval]
+
+        returns:
+            williams %R (np.ndarray)
+        """
+        highest, lowest = _rolling_extremes(
+            self._get_column(CrawlerColumns.HIGH),
+            self._get_column(CrawlerColumns.LOW),
+            timeperiod,
+        )
+        return _ratio(
+            highest - self._get_column(CrawlerColumns.CLOSE),
+            highest - lowest,
+        ) * -100
+
+
+def _ratio(numerator: np.ndarray,
+           denominator: np.ndarray,
+           default: float = 0.0,
+           ) -> np.ndarray:
+    """ Divide, the default where the denominator is zero."""
+    ratio = np.full(np.broadcast(numerator, denominator).shape, default)
+    np.divide(numerator, denominator, out=ratio, where=denominator != 0)
+    ratio[np.isnan(numerator) | np.isnan(denominator)] = np.nan
+    return ratio
+
+
+def _sma(values: np.ndarray, timeperiod: int) -> np.ndarray:
+    """ Windows containing nan stay nan, as the leading nan which TA-Lib
+        skips."""
+    sma = np.full(values.shape, np.nan)
+    if values.shape[-1] >= timeperiod:
+        sma[..., timeperiod - 1:] = \
+            sliding_window_view(values, timeperiod, axis=-1).mean(axis=-1)
+    return sma
+
+
+def _wma(values: np.ndarray, timeperiod: int) -> np.ndarray:
+    wma = np.full(values.shape, np.nan)
+    if values.shape[-1] >= timeperiod:
+        weights = np.arange(1, timeperiod + 1) \
+            / (timeperiod * (timeperiod + 1) / 2)
+        wma[..., timeperiod - 1:] = \
+            sliding_window_view(values, timeperiod, axis=-1) @ weights
+    return wma
+
+
+def _rolling_sum(values: np.ndarray, timeperiod: int) -> np.ndarray:
+    total = np.full(values.shape, np.nan)
+    if values.shape[-1] >= timeperiod:
+        total[..., timeperiod - 1:] = \
+            sliding_window_view(values, timeperiod, axis=-1).sum(axis=-1)
+    return total
+
+
+def _cumsum(values: np.ndarray) -> np.ndarray:
+    """ Cumulative sum along the candles, prefixed by zero."""
+    cumsum = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,))
+    np.cumsum(values, axis=-1, out=cumsum[..., 1:])
+    return cumsum
+
+
+def _get_rows(values: np.ndarray) -> np.ndarray:
+    """ View of contiguous values as rows of candles, the kernels
+        iterate over."""
+    return values.reshape(-1, values.shape[-1])
+
+
+def _rolling_extremes(high: np.ndarray,
+                      low: np.ndarray,
+                      timeperiod: int,
+                      ) -> tuple:
+    """ Highest high and lowest low of each window."""
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    highest = np.empty(high.shape)
+    lowest = np.empty(low.shape)
+    _extremes_kernel(_get_rows(high), _get_rows(low), timeperiod,
+                     _get_rows(highest), _get_rows(lowest))
+    return highest, lowest
+
+
+def _ema(values: np.ndarray, timeperiods: list) -> np.ndarray:
+    """ Exponential moving average of each row of values and each period.
+    args:
+        values (np.ndarray): [shape: (..., candles)]
+        timeperiods (list[int]): periods, one row of values is shared by
+                                 all of them
+
+    returns:
+        exponential moving average (np.ndarray)
+            [shape: (..., periods, candles)]
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    timeperiods = np.asarray(timeperiods, dtype=np.int64)
+    ema = np.empty(values.shape[:-1] + (len(timeperiods), values.shape[-1]))
+    _ema_kernel(_get_rows(values), timeperiods, _get_rows(ema))
+    return ema
+
+
+@jit
+def _ema_kernel(values, timeperiods, out):
+    """ Seeded by the simple moving average of the first period after the
+        leading nan, as TA-Lib does."""
+    length = values.shape[1]
+    for row in range(values.shape[0]):
+        start = 0
+        while start < length and math.isnan(values[row, start]):
+            start += 1
+        for index in range(len(timeperiods)):
+            result = out[row * len(timeperiods) + index]
+            result[:] = np.nan
+            timeperiod = timeperiods[index]
+            if start + timeperiod > length:
+                continue
+
+            k = 2.0 / (timeperiod + 1)
+            value = 0.0
+            for i in range(start, start + timeperiod):
+                value += values[row, i]
+            value /= timeperiod
+            result[start + timeperiod - 1] = value
+            for i in range(start + timeperiod, length):
+                value = (values[row, i] - value) * k + value
+                result[i] = value
+
+
+@jit
+def _extremes_kernel(high, low, timeperiod, highest, lowest):
+    """ Rescan a window only when its extreme leaves it, as TA-Lib does."""
+    length = high.shape[1]
+    for row in range(high.shape[0]):
+        highest[row, :] = np.nan
+        lowest[row, :] = np.nan
+        high_index = -1
+        low_index = -1
+        for i in range(timeperiod - 1, length):
+            start = i - timeperiod + 1
+            if high_index < start:
+                high_index = start
+                for j in range(start + 1, i + 1):
+                    if high[row, j] >= high[row, high_index]:
+                        high_index = j
+            elif high[row, i] >= high[row, high_index]:
+                high_index = i
+            if low_index < start:
+                low_index = start
+                for j in range(start + 1, i + 1):
+                    if low[row, j] <= low[row, low_index]:
+                        low_index = j
+            elif low[row, i] <= low[row, low_index]:
+                low_index = i
+            highest[row, i] = high[row, high_index]
+            lowest[row, i] = low[row, low_index]
+
+
+@jit
+def _rsi_kernel(values, timeperiod, out):
+    """ Relative strength index of each row with Wilder's smoothing,
+        starting after the leading nan as TA-Lib does."""
+    length = values.shape[1]
+    for row in range(values.shape[0]):
+        out[row, :] = np.nan
+        start = 0
+        while start < length and math.isnan(values[row, start]):
+            start += 1
+        if length - start <= timeperiod:
+            continue
+
+        gain = 0.0
+        loss = 0.0
+        for i in range(start + 1, length):
+            difference = values[row, i] - values[row, i - 1]
+            if i - start <= timeperiod:
+                gain += max(difference, 0.0)
+                loss += max(-difference, 0.0)
+                if i - start < timeperiod:
+                    continue
+                gain /= timeperiod
+                loss /= timeperiod
+            else:
+                gain = (gain * (timeperiod - 1) + max(difference, 0.0)) \
+                    / timeperiod
+                loss = (loss * (timeperiod - 1) + max(-difference, 0.0)) \
+                    / timeperiod
+            total = gain + loss
+            out[row, i] = 0.0 if -1e-8 < total < 1e-8 \
+                else 100 * gain / total
+
+
+@jit
+def _dx_kernel(high, low, close, timeperiod, out):
+    """ Directional movement index of each row with Wilder's smoothing,
+        starting after the leading nan as TA-Lib does."""
+    length = high.shape[1]
+    for row in range(high.shape[0]):
+        out[row, :] = np.nan
+        start = 0
+        while start < length and math.isnan(close[row, start]):
+            start += 1
+        plus_dm = 0.0
+        minus_dm = 0.0
+        true_range = 0.0
+        value = 0.0
+        for i in range(start + 1, length):
+            plus_move = high[row, i] - high[row, i - 1]
+            minus_move = low[row, i - 1] - low[row, i]
+            plus = plus_move \
+                if plus_move > 0 and plus_move > minus_move else 0.0
+            minus = minus_move \
+                if minus_move > 0 and plus_move < minus_move else 0.0
+            current_range = max(
+                high[row, i] - low[row, i],
+                abs(high[row, i] - close[row, i - 1]),
+                abs(low[row, i] - close[row, i - 1]),
+            )
+            if i - start < timeperiod:
+                plus_dm += plus
+                minus_dm += minus
+                true_range += current_range
+                continue
+
+            plus_dm += plus - plus_dm / timeperiod
+            minus_dm += minus - minus_dm / timeperiod
+            true_range += current_range - true_range / timeperiod
+            if not -1e-8 < true_range < 1e-8:
+                plus_di = 100 * plus_dm / true_range
+                minus_di = 100 * minus_dm / true_range
+                if not -1e-8 < plus_di + minus_di < 1e-8:
+                    value = 100 * abs(minus_di - plus_di) \
+                        / (minus_di + plus_di)
+            out[row, i] = value
@@ -0,0 +1,43 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from indicator.cache import IndicatorCache, fingerprint
+from indicator.numpy_indicator import NumpyIndicator
+from storage.panel_candles import PanelCandles
+
+
+class PanelIndicator(NumpyIndicator):
+    # panel results are as large as the panel, keep fewer of them
+    cache: Optional[IndicatorCache] = IndicatorCache(maxsize=32)
+
+    def __init__(self, candles: PanelCandles):
+        """ Compute the indicators of many symbols at once, each result is
+            a (symbols x candles) matrix rather than an array, and
+            CrossOverStrategy and OverReactStrategy consume it the same.
+            The nan leading a row (a symbol listed later) is skipped as
+            TA-Lib does.
+        args:
+            candles (PanelCandles): aligned candles of the symbols
+        """
+        super().__init__(candles)
+
+    @property
+    def fingerprint(self) -> str:
+        """ Fingerprint of the panel, whose timestamps may be a matrix."""
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(
+                self.candles.timestamps, self.candles.values)
+        return self._fingerprint
+
+    @property
+    def symbols(self) -> list:
+        return self.candles.symbols
+
+    def to_frame(self, values: np.ndarray) -> pd.DataFrame:
+        """ Dataframe of a result of a panel aligned by datetime, indexed
+            by datetime with a column per symbol."""
+        return pd.DataFrame(
+            np.asarray(values).T, index=self.candles.index,
+            columns=self.symbols)
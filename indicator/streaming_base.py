@@ -0,0 +1,37 @@
+import abc
+from typing import Union
+
+import numpy as np
+
+from constants.constants import CrawlerColumns
+
+
+class BaseStreamingIndicator(metaclass=abc.ABCMeta):
+    # candle columns passed to update in order, e.g. (HIGH, LOW, CLOSE)
+    inputs: tuple = (CrawlerColumns.CLOSE,)
+
+    @property
+    @abc.abstractmethod
+    def lookback(self) -> int:
+        """ Number of bars consumed before the first valid output."""
+        pass
+
+    @abc.abstractmethod
+    def update(self, *values: float) -> Union[float, tuple]:
+        """ Consume a new bar and return the latest output
+            (nan during the lookback)."""
+        pass
+
+    def update_bar(self, bar) -> Union[float, tuple]:
+        """ Consume a new bar given by a mapping of candle columns,
+            e.g. a row of the candles dataframe.
+        """
+        return self.update(*(float(bar[column.value])
+                             for column in self.inputs))
+
+    def update_many(self, *arrays: np.ndarray) -> np.ndarray:
+        """ Consume bars in order and return all outputs
+            (useful to warm up the state from history).
+        """
+        outputs = [self.update(*values) for values in zip(*arrays)]
+        return np.array(outputs, dtype=float)
@@ -0,0 +1,339 @@
+import math
+from collections import deque
+
+from constants.constants import CrawlerColumns
+from indicator.streaming_base import BaseStreamingIndicator
+
+HLC = (CrawlerColumns.HIGH, CrawlerColumns.LOW, CrawlerColumns.CLOSE)
+HLCV = HLC + (CrawlerColumns.VOLUME,)
+
+
+def _is_zero(value: float) -> bool:
+    """ Same tolerance as TA_IS_ZERO of TA-Lib."""
+    return -1e-8 < value < 1e-8
+
+
+class StreamingSMA(BaseStreamingIndicator):
+    def __init__(self, timeperiod: int = 30):
+        """ Simple moving average updated in O(1) per bar."""
+        self.timeperiod = timeperiod
+        self.window = deque(maxlen=timeperiod)
+        self.total = 0.0
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, value: float) -> float:
+        if len(self.window) == self.timeperiod:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+        if len(self.window) < self.timeperiod:
+            return math.nan
+        return self.total / self.timeperiod
+
+
+class StreamingEMA(BaseStreamingIndicator):
+    def __init__(self, timeperiod: int = 30):
+        """ Exponential moving average seeded by the simple moving average
+            of the first period, as TA-Lib does."""
+        self.timeperiod = timeperiod
+        self.k = 2.0 / (timeperiod + 1)
+        self.seed = StreamingSMA(timeperiod)
+        self.value = math.nan
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, value: float) -> float:
+        if math.isnan(self.value):
+            self.value = self.seed.update(value)
+        else:
+            self.value = (value - self.value) * self.k + self.value
+        return self.value
+
+
+class StreamingWMA(BaseStreamingIndicator):
+    def __init__(self, timeperiod: int = 30):
+        """ Weighted moving average updated in O(1) per bar."""
+        self.timeperiod = timeperiod
+        self.divider = timeperiod * (timeperiod + 1) / 2
+        self.window = deque(maxlen=timeperiod)
+        self.total = 0.0
+        self.weighted_total = 0.0
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, value: float) -> float:
+        if len(self.window) == self.timeperiod:
+            self.weighted_total += self.timeperiod * value - self.total
+            self.total += value - self.window[0]
+        else:
+            self.weighted_total += (len(self.window) + 1) * value
+            self.total += value
+        self.window.append(value)
+        if len(self.window) < self.timeperiod:
+            return math.nan
+        return self.weighted_total / self.divider
+
+
+class StreamingMOM(BaseStreamingIndicator):
+    def __init__(self, timeperiod: int = 10):
+        """ Momentum, value minus the value of timeperiod bars ago."""
+        self.timeperiod = timeperiod
+        self.window = deque(maxlen=timeperiod + 1)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, value: float) -> float:
+        self.window.append(value)
+        if len(self.window) <= self.timeperiod:
+            return math.nan
+        return value - self.window[0]
+
+
+class StreamingROC(StreamingMOM):
+    def update(self, value: float) -> float:
+        """ Rate of change, ((value / previous value) - 1) * 100."""
+        self.window.append(value)
+        if len(self.window) <= self.timeperiod:
+            return math.nan
+        if self.window[0] == 0:
+            return 0.0
+        return (value / self.window[0] - 1) * 100
+
+
+class StreamingRSI(BaseStreamingIndicator):
+    def __init__(self, timeperiod: int = 14):
+        """ Relative strength index with Wilder's smoothing."""
+        self.timeperiod = timeperiod
+        self.count = 0
+        self.previous = math.nan
+        self.gain = 0.0
+        self.loss = 0.0
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, value: float) -> float:
+        self.count += 1
+        difference = value - self.previous
+        self.previous = value
+        if self.count == 1:
+            return math.nan
+
+        gain, loss = max(difference, 0.0), max(-difference, 0.0)
+        if self.count <= self.timeperiod:
+            self.gain += gain
+            self.loss += loss
+            return math.nan
+        if self.count == self.timeperiod + 1:
+            self.gain = (self.gain + gain) / self.timeperiod
+            self.loss = (self.loss + loss) / self.timeperiod
+        else:
+            self.gain = (self.gain * (self.timeperiod - 1) + gain) \
+                / self.timeperiod
+            self.loss = (self.loss * (self.timeperiod - 1) + loss) \
+                / self.timeperiod
+
+        total = self.gain + self.loss
+        if _is_zero(total):
+            return 0.0
+        return 100 * self.gain / total
+
+
+class StreamingMACD(BaseStreamingIndicator):
+    def __init__(self,
+                 fastperiod: int = 12,
+                 slowperiod: int = 26,
+                 signalperiod: int = 9,
+                 ):
+        """ Moving average convergence/divergence [macd, macdsignal,
+            macdhist]. As TA-Lib does, the fast ema is seeded by the simple
+            moving average of the fast period ending at the first bar of
+            the slow ema."""
+        if slowperiod < fastperiod:
+            fastperiod, slowperiod = slowperiod, fastperiod
+        self.fastperiod = fastperiod
+        self.slowperiod = slowperiod
+        self.signalperiod = signalperiod
+        self.count = 0
+        self.fast = StreamingEMA(fastperiod)
+        self.slow = StreamingEMA(slowperiod)
+        self.signal = StreamingEMA(signalperiod)
+
+    @property
+    def lookback(self) -> int:
+        return self.slowperiod - 1 + self.signalperiod - 1
+
+    def update(self, value: float) -> tuple:
+        self.count += 1
+        slow = self.slow.update(value)
+        if self.count > self.slowperiod - self.fastperiod:
+            fast = self.fast.update(value)
+        if math.isnan(slow):
+            return math.nan, math.nan, math.nan
+
+        macd = fast - slow
+        signal = self.signal.update(macd)
+        if math.isnan(signal):
+            return math.nan, math.nan, math.nan
+        return macd, signal, macd - signal
+
+
+class StreamingSTOCHF(BaseStreamingIndicator):
+    inputs = HLC
+
+    def __init__(self, k_period: int = 5, d_period: int = 3):
+        """ Fast stochastic oscillator [k, d] with simple moving average
+            as d, updated in O(k_period) per bar."""
+        self.k_period = k_period
+        self.d_period = d_period
+        self.highs = deque(maxlen=k_period)
+        self.lows = deque(maxlen=k_period)
+        self.d = StreamingSMA(d_period)
+
+    @property
+    def lookback(self) -> int:
+        return self.k_period - 1 + self.d_period - 1
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        self.highs.append(high)
+        self.lows.append(low)
+        if len(self.highs) < self.k_period:
+            return math.nan, math.nan
+
+        highest, lowest = max(self.highs), min(self.lows)
+        k = 0.0 if highest == lowest \
+            else 100 * (close - lowest) / (highest - lowest)
+        d = self.d.update(k)
+        if math.isnan(d):
+            return math.nan, math.nan
+        return k, d
+
+
+class StreamingWILLR(BaseStreamingIndicator):
+    inputs = HLC
+
+    def __init__(self, timeperiod: int = 14):
+        """ Williams %R updated in O(timeperiod) per bar."""
+        self.timeperiod = timeperiod
+        self.highs = deque(maxlen=timeperiod)
+        self.lows = deque(maxlen=timeperiod)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.highs.append(high)
+        self.lows.append(low)
+        if len(self.highs) < self.timeperiod:
+            return math.nan
+
+        highest, lowest = max(self.highs), min(self.lows)
+        if highest == lowest:
+            return 0.0
+        return -100 * (highest - close) / (highest - lowest)
+
+
+class StreamingMFI(BaseStreamingIndicator):
+    inputs = HLCV
+
+    def __init__(self, timeperiod: int = 14):
+        """ Money flow index updated in O(1) per bar."""
+        self.timeperiod = timeperiod
+        self.previous = math.nan
+        self.flows = deque(maxlen=timeperiod)
+        self.positive = 0.0
+        self.negative = 0.0
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, high: float, low: float,
+               close: float, volume: float) -> float:
+        typical_price = (high + low + close) / 3
+        previous, self.previous = self.previous, typical_price
+        if math.isnan(previous):
+            return math.nan
+
+        money_flow = typical_price * volume
+        positive = money_flow if typical_price > previous else 0.0
+        negative = money_flow if typical_price < previous else 0.0
+        if len(self.flows) == self.timeperiod:
+            oldest_positive, oldest_negative = self.flows[0]
+            self.positive -= oldest_positive
+            self.negative -= oldest_negative
+        self.flows.append((positive, negative))
+        self.positive += positive
+        self.negative += negative
+        if len(self.flows) < self.timeperiod:
+            return math.nan
+
+        total = self.positive + self.negative
+        if total < 1.0:
+            return 0.0
+        return 100 * self.positive / total
+
+
+class StreamingDX(BaseStreamingIndicator):
+    inputs = HLC
+
+    def __init__(self, timeperiod: int = 14):
+        """ Directional movement index with Wilder's smoothing."""
+        self.timeperiod = timeperiod
+        self.count = 0
+        self.previous = None
+        self.plus_dm = 0.0
+        self.minus_dm = 0.0
+        self.true_range = 0.0
+        self.value = math.nan
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.count += 1
+        previous, self.previous = self.previous, (high, low, close)
+        if previous is None:
+            return math.nan
+
+        previous_high, previous_low, previous_close = previous
+        plus_move = high - previous_high
+        minus_move = previous_low - low
+        plus_dm = plus_move \
+            if plus_move > 0 and plus_move > minus_move else 0.0
+        minus_dm = minus_move \
+            if minus_move > 0 and plus_move < minus_move else 0.0
+        true_range = max(high - low,
+                         abs(high - previous_close),
+                         abs(low - previous_close))
+
+        if self.count <= self.timeperiod:
+            self.plus_dm += plus_dm
+            self.minus_dm += minus_dm
+            self.true_range += true_range
+            return math.nan
+
+        self.plus_dm += plus_dm - self.plus_dm / self.timeperiod
+        self.minus_dm += minus_dm - self.minus_dm / self.timeperiod
+        self.true_range += true_range - self.true_range / self.timeperiod
+
+        value = 0.0 if math.isnan(self.value) else self.value
+        if not _is_zero(self.true_range):
+            plus_di = 100 * self.plus_dm / self.true_range
+            minus_di = 100 * self.minus_dm / self.true_range
+            if not _is_zero(plus_di + minus_di):
+                value = 100 * abs(minus_di - plus_di) / (minus_di + plus_di)
+        self.value = value
+        return value
@@ -1,14 +1,19 @@
+from typing import Optional
+
 import numpy as np
 import talib
 
+from constants.constants import CrawlerColumns
 from indicator.base import BaseIndicator
+from indicator.cache import IndicatorCache, cached
 
 
 class Indicator(BaseIndicator):
-    def __init__(self, candles):
-        """ Get the historical candles data."""
-        self.candles = candles
+    # shared by instances so rebuilt strategies and parameter sweeps
+    # reuse the results of the same candles
+    cache: Optional[IndicatorCache] = IndicatorCache()
 
+    @cached
     def bbands(self,
                timeperiod: int = 5,
                matype: talib.MA_Type = talib.MA_Type.SMA,
@@ -23,13 +28,14 @@ class Indicator(BaseIndicator):
                     (tuple[np.ndarray, np.ndarray, np.ndarray)
         """
         return talib.BBANDS(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
             nbdevup=2,
             nbdevdn=2,
             matype=talib.MA_Type.SMA,
         )
 
+    @cached
     def ema(self, timeperiod: int = 30) -> np.ndarray:
         """
         args:
@@ -39,10 +45,11 @@ class Indicator(BaseIndicator):
             exponential moving average (np.ndarray)
         """
         return talib.EMA(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def ema_with_data(self,
                       data: np.ndarray, timeperiod: int = 14) -> np.ndarray:
         """
@@ -58,6 +65,7 @@ class Indicator(BaseIndicator):
             timeperiod=timeperiod,
         )
 
+    @cached
     def sma(self, timeperiod: int = 30) -> np.ndarray:
         """
         args:
@@ -67,10 +75,11 @@ class Indicator(BaseIndicator):
             simple moving average (np.ndarray)
         """
         return talib.SMA(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def sma_with_data(self,
                       data: np.ndarray, timeperiod: int = 14) -> np.ndarray:
         """
@@ -86,6 +95,7 @@ class Indicator(BaseIndicator):
             timeperiod=timeperiod,
         )
 
+    @cached
     def wma(self, timeperiod: int = 30) -> np.ndarray:
         """
         args:
@@ -95,10 +105,11 @@ class Indicator(BaseIndicator):
             weighted moving average (np.ndarray)
         """
         return talib.WMA(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def wma_with_data(self,
                       data: np.ndarray, timeperiod: int = 14) -> np.ndarray:
         """
@@ -114,6 +125,7 @@ class Indicator(BaseIndicator):
             timeperiod=timeperiod,
         )
 
+    @cached
     def dmi(self, timeperiod: int = 14) -> np.ndarray:
         """
         args:
@@ -123,12 +135,13 @@ class Indicator(BaseIndicator):
             directional movement index (np.ndarray)
         """
         return talib.DX(
-            self.candles.High,
-            self.candles.Low,
-            self.candles.Close,
+            self._get_column(CrawlerColumns.HIGH),
+            self._get_column(CrawlerColumns.LOW),
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def kd(self,
            k_period: int = 5, d_period: int = 3,
            matype: talib.MA_Type = talib.MA_Type.SMA,
@@ -143,14 +156,15 @@ class Indicator(BaseIndicator):
             stochastic oscillator[k, d] (tuple[np.ndarray, np.ndarray])
         """
         return talib.STOCHF(
-            self.candles.High,
-            self.candles.Low,
-            self.candles.Close,
+            self._get_column(CrawlerColumns.HIGH),
+            self._get_column(CrawlerColumns.LOW),
+            self._get_column(CrawlerColumns.CLOSE),
             fastk_period=k_period,
             fastd_period=d_period,
             fastd_matype=matype,
         )
 
+    @cached
     def macd(self,
              fastperiod: int = 12,
              slowperiod: int = 26,
@@ -168,12 +182,13 @@ class Indicator(BaseIndicator):
                     (tuple[np.ndarray, np.ndarray, np.ndarray)
         """
         return talib.MACD(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             fastperiod=fastperiod,
             slowperiod=slowperiod,
             signalperiod=signalperiod,
         )
 
+    @cached
     def mfi(self, timeperiod: int = 14) -> np.ndarray:
         """
         args:
@@ -183,13 +198,14 @@ class Indicator(BaseIndicator):
             money flow index (np.ndarray)
         """
         return talib.MFI(
-            self.candles.High,
-            self.candles.Low,
-            self.candles.Close,
-            self.candles.volume,
+            self._get_column(CrawlerColumns.HIGH),
+            self._get_column(CrawlerColumns.LOW),
+            self._get_column(CrawlerColumns.CLOSE),
+            self._get_column(CrawlerColumns.VOLUME),
             timeperiod=timeperiod
         )
 
+    @cached
     def mtm(self, timeperiod: int = 10) -> np.ndarray:
         """
         args:
@@ -199,10 +215,11 @@ class Indicator(BaseIndicator):
             momentum (np.ndarray)
         """
         return talib.MOM(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def roc(self, timeperiod: int = 10) -> np.ndarray:
         """
         args:
@@ -212,10 +229,11 @@ class Indicator(BaseIndicator):
             rate of change (np.ndarray)
         """
         return talib.ROC(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def rsi(self, timeperiod: int = 14) -> np.ndarray:
         """
         args:
@@ -225,10 +243,11 @@ class Indicator(BaseIndicator):
             relative strength index (np.ndarray)
         """
         return talib.RSI(
-            self.candles.Close,
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod,
         )
 
+    @cached
     def willr(self, timeperiod: int = 14) -> np.ndarray:
         """
         args:
@@ -238,8 +257,8 @@ class Indicator(BaseIndicator):
             williams %R (np.ndarray)
         """
         return talib.WILLR(
-            self.candles.High,
-            self.candles.Low,
-            self.candles.Close,
+            self._get_column(CrawlerColumns.HIGH),
+            self._get_column(CrawlerColumns.LOW),
+            self._get_column(CrawlerColumns.CLOSE),
             timeperiod=timeperiod
         )
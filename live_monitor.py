@@ -0,0 +1,70 @@
+import argparse
+import functools
+import json
+
+import yaml
+
+from api.async_adapter import AsyncApiAdapter
+from constants import (
+    ApiType,
+    Config,
+    IndicatorType,
+    StorageType,
+    StrategyType,
+)
+from monitor import ApiFeed, SignalMonitor
+from registry import get_api, get_storage, validate_parameters
+from strategy import StreamingCrossOverStrategy, StreamingOverReactStrategy
+
+STREAMING_STRATEGIES = {
+    StrategyType.CROSSOVER_STRATEGY: StreamingCrossOverStrategy,
+    StrategyType.OVERREACT_STRATEGY: StreamingOverReactStrategy,
+}
+
+
+def main(opt):
+    assert opt[Config.API] in ApiType.list(), \
+        "The api is unsupported."
+    api = get_api(opt[Config.API])()
+
+    storage_type = opt.get(Config.STORAGE, StorageType.CSV_STORAGE.value)
+    assert storage_type in StorageType.list(), \
+        "The storage type is unsupported."
+    storage = get_storage(storage_type)()
+
+    assert opt[Config.STRATEGY] in [
+        strategy_type.value for strategy_type in STREAMING_STRATEGIES
+    ], "The strategy type is unsupported by the streaming monitor."
+    assert opt[Config.INDICATOR] in IndicatorType.list(), \
+        "The indicator type is unsupported."
+    create_strategy = functools.partial(
+        STREAMING_STRATEGIES[StrategyType(opt[Config.STRATEGY])],
+        IndicatorType(opt[Config.INDICATOR]),
+        **validate_parameters(
+            opt[Config.STRATEGY],
+            opt[Config.INDICATOR],
+            opt.get(Config.PARAMETERS, {}),
+        ),
+    )
+
+    symbols = opt.get(Config.SYMBOLS, [opt.get(Config.SYMBOL)])
+    feed = ApiFeed(AsyncApiAdapter(api, storage),
+                   symbols, opt.get(Config.INTERVAL, ""))
+    monitor = SignalMonitor(create_strategy, symbols,
+                            warm_up_bars=opt.get(Config.WARM_UP_BARS, 1000))
+    monitor.run(
+        feed,
+        on_event=lambda event: print(
+            json.dumps(event._asdict(), default=str), flush=True),
+        poll_interval=opt.get(Config.POLL_INTERVAL, 60),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", type=str, default="config.yaml")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = yaml.load(f, Loader=yaml.FullLoader)
+    main(config)
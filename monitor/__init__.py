@@ -0,0 +1,12 @@
+from utils.lazy import lazy_getattr
+
+_MODULES = {
+    "ApiFeed": "monitor.feed",
+    "ReplayFeed": "monitor.feed",
+    "SignalEvent": "monitor.signal_monitor",
+    "SignalMonitor": "monitor.signal_monitor",
+}
+
+__all__ = list(_MODULES)
+
+__getattr__ = lazy_getattr(__name__, _MODULES)
@@ -0,0 +1,80 @@
+import abc
+import asyncio
+from typing import Optional
+
+import pandas as pd
+
+from api.async_adapter import AsyncApiAdapter
+from constants.constants import Config
+
+
+class BaseFeed(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def poll(self) -> dict:
+        """ Get the candles of each symbol arrived since the last poll
+            (dict[str, pd.DataFrame])."""
+        pass
+
+
+class ApiFeed(BaseFeed):
+    def __init__(self,
+                 api_adapter: AsyncApiAdapter,
+                 symbols: list,
+                 interval: str = "",
+                 ):
+        """ Poll the api of each symbol concurrently; new candles are
+            persisted by the storage and only the ones after the latest
+            delivered candle are loaded back.
+        """
+        self.api_adapter = api_adapter
+        self.symbols = symbols
+        self.interval = interval
+        self.last_updates = {}
+
+    def poll(self) -> dict:
+        return asyncio.run(self._poll())
+
+    async def _poll(self) -> dict:
+        async def fetch(symbol: str) -> pd.DataFrame:
+            last_update = self.last_updates.get(symbol)
+            return await self.api_adapter.fetch_candles(
+                {Config.SYMBOL: symbol, Config.INTERVAL: self.interval},
+                start=None if last_update is None
+                else last_update + pd.Timedelta(1, "ms"),
+            )
+
+        candles = dict(zip(self.symbols, await asyncio.gather(
+            *(fetch(symbol) for symbol in self.symbols))))
+        for symbol, symbol_candles in candles.items():
+            if len(symbol_candles) > 0:
+                self.last_updates[symbol] = symbol_candles.index[-1]
+        return candles
+
+
+class ReplayFeed(BaseFeed):
+    def __init__(self,
+                 candles: dict,
+                 bars_per_poll: int = 1,
+                 initial_bars: Optional[int] = None,
+                 ):
+        """ Local stand-in feed replaying stored candles.
+        args:
+            candles (dict[str, pd.DataFrame]): candles of each symbol
+            bars_per_poll (int): number of bars delivered per poll
+            initial_bars (int): number of bars delivered by the first poll,
+                                bars_per_poll if None
+        """
+        self.candles = candles
+        self.bars_per_poll = bars_per_poll
+        self.position = 0
+        self.initial_bars = initial_bars
+
+    def poll(self) -> dict:
+        size = self.bars_per_poll
+        if self.position == 0 and self.initial_bars is not None:
+            size = self.initial_bars
+        start, self.position = self.position, self.position + size
+        return {
+            symbol: symbol_candles.iloc[start:self.position]
+            for symbol, symbol_candles in self.candles.items()
+        }
@@ -0,0 +1,84 @@
+import time
+from collections import namedtuple
+from typing import Callable, Optional
+
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from monitor.feed import BaseFeed
+from strategy.streaming_strategy import to_bars
+
+SignalEvent = namedtuple(
+    "SignalEvent", ["symbol", "datetime", "signal", "close", "latency"])
+
+
+class SignalMonitor:
+    def __init__(self,
+                 create_strategy: Callable,
+                 symbols: list,
+                 warm_up_bars: Optional[int] = 1000,
+                 ):
+        """ Feed new bars of each symbol through a streaming strategy and
+            emit the buying and selling events.
+        args:
+            create_strategy (Callable): create a BaseStreamingStrategy
+            symbols (list): symbols to be monitored
+            warm_up_bars (int): number of latest bars of the first poll
+                                warming up the state, all if None
+        """
+        self.strategies = {symbol: create_strategy() for symbol in symbols}
+        self.warm_up_bars = warm_up_bars
+
+    def warm_up(self, candles: dict) -> None:
+        """ Consume the history without emitting events."""
+        for symbol, symbol_candles in candles.items():
+            if self.warm_up_bars is not None:
+                symbol_candles = symbol_candles.iloc[-self.warm_up_bars:]
+            for bar in to_bars(symbol_candles):
+                self.strategies[symbol].update_bar(bar)
+
+    def on_candles(self, symbol: str, candles: pd.DataFrame) -> list:
+        """
+        args:
+            symbol (str): symbol of the candles
+            candles (pd.DataFrame): new candles indexed by datetime
+
+        returns:
+            buying and selling events of the new bars (list[SignalEvent])
+        """
+        events = []
+        for bar in to_bars(candles):
+            start = time.perf_counter()
+            signal = self.strategies[symbol].update_bar(bar)
+            if signal != 0:
+                events.append(SignalEvent(
+                    symbol,
+                    bar[CrawlerColumns.DATETIME.value],
+                    signal,
+                    bar[CrawlerColumns.CLOSE.value],
+                    time.perf_counter() - start,
+                ))
+        return events
+
+    def run(self,
+            feed: BaseFeed,
+            on_event: Callable = print,
+            poll_interval: float = 60,
+            max_polls: Optional[int] = None,
+            ) -> None:
+        """ Warm up by the first poll, then poll the feed periodically.
+        args:
+            feed (BaseFeed): source of new candles
+            on_event (Callable): callback of each SignalEvent
+            poll_interval (float): [unit: second]
+            max_polls (int): stop after the number of polls, never if None
+        """
+        self.warm_up(feed.poll())
+
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            time.sleep(poll_interval)
+            for symbol, candles in feed.poll().items():
+                for event in self.on_candles(symbol, candles):
+                    on_event(event)
+            polls += 1
@@ -0,0 +1,7 @@
+from profiling.profiler import Profiler, get_profiler, set_profiler
+
+__all__ = [
+    "Profiler",
+    "get_profiler",
+    "set_profiler",
+]
@@ -0,0 +1,121 @@
+import contextlib
+import cProfile
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler:
+    def __init__(self,
+                 enabled: bool = True,
+                 cprofile_filename: Optional[str] = None,
+                 ):
+        """ Accumulate the time of stages and the counters, which are
+            no-ops when disabled.
+        args:
+            enabled (bool): whether to record the stages
+            cprofile_filename (str): file of the cProfile stats dumped on
+                                     exit, no cProfile if None
+        """
+        self.enabled = enabled
+        self.cprofile_filename = cprofile_filename
+        self.stages = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.started = None
+        self.stopped = None
+        self._cprofile = None
+        self._previous = None
+
+    def __enter__(self) -> "Profiler":
+        """ Activate the profiler, so get_profiler returns it."""
+        self._previous = set_profiler(self)
+        self.started = time.perf_counter()
+        if self.enabled and self.cprofile_filename is not None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_filename)
+            self._cprofile = None
+        self.stopped = time.perf_counter()
+        set_profiler(self._previous)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """ Time the block as a call of the stage."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            with self.lock:
+                calls, total = self.stages.get(name, (0, 0.0))
+                self.stages[name] = (calls + 1, total + seconds)
+            logger.debug(json.dumps({"stage": name, "seconds": seconds}))
+
+    def count(self, name: str, value: int = 1) -> None:
+        """ Increase the counter."""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self) -> dict:
+        """
+        returns:
+            wall seconds, calls and seconds of each stage (inclusive of the
+                nested stages) and counters (dict)
+        """
+        stopped = self.stopped or time.perf_counter()
+        total = stopped - self.started if self.started is not None else 0.0
+        with self.lock:
+            return {
+                "seconds": total,
+                "stages": {
+                    name: {
+                        "calls": calls,
+                        "seconds": seconds,
+                        "ratio": seconds / total if total > 0 else 0.0,
+                    }
+                    for name, (calls, seconds) in sorted(
+                        self.stages.items(), key=lambda item: -item[1][1])
+                },
+                "counters": dict(self.counters),
+            }
+
+    def dump(self, filename: Optional[str] = None) -> None:
+        """ Write the report as JSON to the file, or print it if None."""
+        report = json.dumps(self.report(), indent=2, default=str)
+        if filename is None:
+            print(report)
+            return
+        with open(filename, "w") as f:
+            f.write(report)
+
+
+_profiler = Profiler(enabled=False)
+
+
+def get_profiler() -> Profiler:
+    """ Get the active profiler, a disabled one by default."""
+    return _profiler
+
+
+def set_profiler(profiler: Optional[Profiler]) -> Optional[Profiler]:
+    """ Activate the profiler and return the previous one."""
+    global _profiler
+    previous = _profiler
+    _profiler = profiler or Profiler(enabled=False)
+    return previous
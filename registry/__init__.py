@@ -0,0 +1,23 @@
+from registry.registry import (
+    get_api,
+    get_engine,
+    get_indicator,
+    get_lookback,
+    get_storage,
+    get_strategy,
+    get_strategy_entry,
+    get_strategy_function,
+    validate_parameters,
+)
+
+__all__ = [
+    "get_api",
+    "get_storage",
+    "get_engine",
+    "get_indicator",
+    "get_lookback",
+    "get_strategy",
+    "get_strategy_entry",
+    "get_strategy_function",
+    "validate_parameters",
+]
@@ -0,0 +1,243 @@
+import functools
+import importlib
+import inspect
+from collections import namedtuple
+from typing import Callable
+
+from constants.constants import (
+    ApiType,
+    Config,
+    EngineType,
+    IndicatorBackendType,
+    IndicatorType,
+    StorageType,
+    StrategyType,
+)
+from indicator import lookback
+
+# method of the strategy class, its parameter schema {name: type} and its
+# lookback, the number of the latest bars the latest signal is computed
+# from, as a function of the parameters
+StrategyEntry = namedtuple(
+    "StrategyEntry", ["strategy_type", "method", "parameters", "lookback"])
+
+API_REGISTRY = {
+    ApiType.BINANCE_API: "api.binance_api:BinanceApi",
+    ApiType.YAHOO_API: "api.yahoo_api:YahooFinanceApi",
+}
+
+STORAGE_REGISTRY = {
+    StorageType.CSV_STORAGE: "storage.csv_storage:CsvStorage",
+    StorageType.COLUMNAR_STORAGE: "storage.columnar_storage:ColumnarStorage",
+}
+
+ENGINE_REGISTRY = {
+    EngineType.BACKTESTING_ENGINE:
+        "engine.backtesting_engine:BacktestingEngine",
+    EngineType.VECTORIZED_ENGINE: "engine.vectorized_engine:VectorizedEngine",
+}
+
+INDICATOR_REGISTRY = {
+    IndicatorBackendType.TALIB: "indicator.talib_indicator:Indicator",
+    IndicatorBackendType.NUMPY: "indicator.numpy_indicator:NumpyIndicator",
+}
+
+STRATEGY_REGISTRY = {
+    StrategyType.CROSSOVER_STRATEGY:
+        "strategy.crossover_strategy:CrossOverStrategy",
+    StrategyType.OVERREACT_STRATEGY:
+        "strategy.overreact_strategy:OverReactStrategy",
+    StrategyType.COMPOSITE_STRATEGY:
+        "strategy.composite_strategy:CompositeStrategy",
+}
+
+_CROSSOVER_PERIODS = {"fastperiod": int, "slowperiod": int}
+_OVERREACT_BOUNDS = {"timeperiod": int,
+                     "lowerbound": float, "upperbound": float}
+
+
+def _get_crossover_lookback(line: Callable[[int], int]) -> Callable:
+    """ The crossover compares the latest bar with the previous one."""
+    return lambda fastperiod, slowperiod: \
+        max(line(fastperiod), line(slowperiod)) + 1
+
+
+def _get_overreact_lookback(line: Callable[[int], int]) -> Callable:
+    return lambda timeperiod, lowerbound, upperbound: line(timeperiod)
+
+
+def _get_rules_lookback(rules: list, threshold: float) -> int:
+    assert rules, "The rules are empty."
+    return max(
+        get_lookback(
+            rule[Config.STRATEGY],
+            rule[Config.INDICATOR],
+            validate_parameters(rule[Config.STRATEGY],
+                                rule[Config.INDICATOR],
+                                rule.get(Config.PARAMETERS, {})),
+        )
+        for rule in rules
+    )
+
+
+STRATEGY_FUNCTION_REGISTRY = {
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.SMA):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_sma", _CROSSOVER_PERIODS,
+                      _get_crossover_lookback(lookback.sma)),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.EMA):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_ema", _CROSSOVER_PERIODS,
+                      _get_crossover_lookback(lookback.ema)),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.WMA):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_wma", _CROSSOVER_PERIODS,
+                      _get_crossover_lookback(lookback.wma)),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.MACD):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY, "trade_by_macd",
+                      {"fastperiod": int, "slowperiod": int,
+                       "signalperiod": int},
+                      lambda fastperiod, slowperiod, signalperiod:
+                          lookback.macd(fastperiod, slowperiod,
+                                        signalperiod) + 1),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.MTM):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_mtm", {"timeperiod": int},
+                      lambda timeperiod: lookback.mtm(timeperiod) + 1),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.MTM_MA):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_mtm_and_mtm_ma",
+                      {"mtm_period": int, "mtm_ma_period": int},
+                      lambda mtm_period, mtm_ma_period: lookback.chain(
+                          lookback.mtm(mtm_period),
+                          lookback.ema(mtm_ma_period)) + 1),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.ROC):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_roc", {"timeperiod": int},
+                      lambda timeperiod: lookback.roc(timeperiod) + 1),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.ROC_MA):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_roc_and_roc_ma",
+                      {"roc_period": int, "roc_ma_period": int},
+                      lambda roc_period, roc_ma_period: lookback.chain(
+                          lookback.roc(roc_period),
+                          lookback.sma(roc_ma_period)) + 1),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.RSI):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_rsi", {"timeperiod": int},
+                      lambda timeperiod: lookback.rsi(timeperiod) + 1),
+    (StrategyType.CROSSOVER_STRATEGY, IndicatorType.KD):
+        StrategyEntry(StrategyType.CROSSOVER_STRATEGY,
+                      "trade_by_kd", {"k_period": int, "d_period": int},
+                      lambda k_period, d_period:
+                          lookback.kd(k_period, d_period) + 1),
+    (StrategyType.OVERREACT_STRATEGY, IndicatorType.RSI):
+        StrategyEntry(StrategyType.OVERREACT_STRATEGY,
+                      "trade_by_rsi", _OVERREACT_BOUNDS,
+                      _get_overreact_lookback(lookback.rsi)),
+    (StrategyType.OVERREACT_STRATEGY, IndicatorType.MFI):
+        StrategyEntry(StrategyType.OVERREACT_STRATEGY,
+                      "trade_by_mfi", _OVERREACT_BOUNDS,
+                      _get_overreact_lookback(lookback.mfi)),
+    (StrategyType.OVERREACT_STRATEGY, IndicatorType.WILLR):
+        StrategyEntry(StrategyType.OVERREACT_STRATEGY,
+                      "trade_by_willr", _OVERREACT_BOUNDS,
+                      _get_overreact_lookback(lookback.willr)),
+    # the indicators are declared by the rules
+    (StrategyType.COMPOSITE_STRATEGY, None):
+        StrategyEntry(StrategyType.COMPOSITE_STRATEGY, "trade_by_rules",
+                      {"rules": list, "threshold": float},
+                      _get_rules_lookback),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def load(path: str):
+    """ Import `module:attribute` on first use."""
+    module_name, attribute = path.split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def get_api(api_type: ApiType) -> type:
+    return load(API_REGISTRY[ApiType(api_type)])
+
+
+def get_storage(storage_type: StorageType) -> type:
+    return load(STORAGE_REGISTRY[StorageType(storage_type)])
+
+
+def get_engine(engine_type: EngineType) -> type:
+    return load(ENGINE_REGISTRY[EngineType(engine_type)])
+
+
+def get_indicator(indicator_backend: IndicatorBackendType) -> type:
+    return load(INDICATOR_REGISTRY[IndicatorBackendType(indicator_backend)])
+
+
+def get_strategy(strategy_type: StrategyType) -> type:
+    return load(STRATEGY_REGISTRY[StrategyType(strategy_type)])
+
+
+def get_strategy_entry(strategy_type: StrategyType,
+                       indicator_type: IndicatorType) -> StrategyEntry:
+    """ Get the strategy function declared for the indicator."""
+    if indicator_type is not None:
+        indicator_type = IndicatorType(indicator_type)
+    entry = STRATEGY_FUNCTION_REGISTRY.get(
+        (StrategyType(strategy_type), indicator_type))
+    if entry is None:
+        raise Exception("The strategy logic is unsupported.")
+    return entry
+
+
+def get_strategy_function(strategy_type: StrategyType,
+                          indicator_type: IndicatorType,
+                          indicator) -> Callable:
+    """
+    args:
+        strategy_type (StrategyType)
+        indicator_type (IndicatorType)
+        indicator (BaseIndicator): indicators computation resources
+
+    returns:
+        trading strategy function (Callable[..., np.ndarray])
+    """
+    entry = get_strategy_entry(strategy_type, indicator_type)
+    return getattr(get_strategy(entry.strategy_type)(indicator), entry.method)
+
+
+def validate_parameters(strategy_type: StrategyType,
+                        indicator_type: IndicatorType,
+                        parameters: dict) -> dict:
+    """ Check the parameters by the declared schema and cast their types.
+    """
+    schema = get_strategy_entry(strategy_type, indicator_type).parameters
+    unknown = set(parameters) - set(schema)
+    if unknown:
+        raise Exception(f"The parameters {sorted(unknown)} are unsupported.")
+    return {name: schema[name](value) for name, value in parameters.items()}
+
+
+def get_lookback(strategy_type: StrategyType,
+                 indicator_type: IndicatorType,
+                 parameters: dict) -> int:
+    """ Get the number of the latest bars the latest signal of the strategy
+        function is computed from, e.g. to load only the tail of the
+        candles.
+    args:
+        strategy_type (StrategyType)
+        indicator_type (IndicatorType)
+        parameters (dict): validated parameters, the omitted ones are the
+                           defaults of the strategy function
+
+    returns:
+        lookback (int) [unit: times of the data interval]
+    """
+    entry = get_strategy_entry(strategy_type, indicator_type)
+    method = getattr(get_strategy(entry.strategy_type), entry.method)
+    arguments = inspect.signature(method).bind(None, **parameters)
+    arguments.apply_defaults()
+    return entry.lookback(**{
+        name: value for name, value in arguments.arguments.items()
+        if name != "self"
+    })
@@ -0,0 +1,46 @@
+import argparse
+
+import yaml
+
+from constants import Config, IndicatorType, StorageType, StrategyType
+from engine.screener import Screener
+from registry import get_storage
+
+
+def main(opt):
+    storage_type = opt.get(Config.STORAGE, StorageType.CSV_STORAGE.value)
+    assert storage_type in StorageType.list(), \
+        "The storage type is unsupported."
+    storage = get_storage(storage_type)()
+
+    assert opt[Config.STRATEGY] in StrategyType.list(), \
+        "The strategy type is unsupported."
+    assert opt[Config.INDICATOR] in IndicatorType.list(), \
+        "The indicator type is unsupported."
+
+    screener = Screener(
+        storage,
+        bars=opt.get(Config.BARS, None),
+        tail_bars=opt.get(Config.TAIL_BARS, 100),
+    )
+    results = screener.run(
+        opt[Config.SYMBOLS],
+        opt.get(Config.INTERVAL, ""),
+        opt[Config.STRATEGY],
+        opt[Config.INDICATOR],
+        opt.get(Config.PARAMETERS, None),
+    )
+    if Config.OUTPUT in opt:
+        results.to_csv(opt[Config.OUTPUT], index=False)
+    else:
+        print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", type=str, default="config-screener.yaml")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = yaml.load(f, Loader=yaml.FullLoader)
+    main(config)
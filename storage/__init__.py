@@ -0,0 +1,18 @@
+from utils.lazy import lazy_getattr
+
+_MODULES = {
+    "CandleIndex": "storage.candle_index",
+    "CompactCandles": "storage.compact_candles",
+    "CsvStorage": "storage.csv_storage",
+    "ColumnarStorage": "storage.columnar_storage",
+    "PanelCandles": "storage.panel_candles",
+    "Resampler": "storage.resampler",
+    "SharedArray": "storage.shared_array",
+    "SharedArrayHandle": "storage.shared_array",
+    "SharedCandles": "storage.shared_candles",
+    "SharedCandlesHandle": "storage.shared_candles",
+}
+
+__all__ = list(_MODULES)
+
+__getattr__ = lazy_getattr(__name__, _MODULES)
@@ -0,0 +1,98 @@
+import abc
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from storage.compact_candles import CompactCandles
+
+
+class BaseStorage(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def last_updated(self, symbol: str, interval: str) -> Optional[datetime]:
+        """ Get the datetime of the latest stored candle."""
+        pass
+
+    @abc.abstractmethod
+    def timestamps(self, symbol: str, interval: str) -> np.ndarray:
+        """ Get the epoch milliseconds of the stored candles in order."""
+        pass
+
+    @abc.abstractmethod
+    def append(self, symbol: str, interval: str,
+               candles: pd.DataFrame) -> None:
+        """ Append new candles to the storage."""
+        pass
+
+    @abc.abstractmethod
+    def write(self, symbol: str, interval: str,
+              candles: pd.DataFrame) -> None:
+        """ Replace the stored candles."""
+        pass
+
+    @abc.abstractmethod
+    def load(self,
+             symbol: str,
+             interval: str,
+             start: Optional[datetime] = None,
+             end: Optional[datetime] = None,
+             ) -> pd.DataFrame:
+        """ Load stored candles within [start, end]."""
+        pass
+
+    def load_tail(self,
+                  symbol: str,
+                  interval: str,
+                  bars: int,
+                  end: Optional[datetime] = None,
+                  ) -> pd.DataFrame:
+        """ Load the latest bars of the stored candles up to end."""
+        candles = self.load(symbol, interval, end=end)
+        return candles.iloc[max(len(candles) - bars, 0):]
+
+    def load_compact(self,
+                     symbol: str,
+                     interval: str,
+                     start: Optional[datetime] = None,
+                     end: Optional[datetime] = None,
+                     ) -> CompactCandles:
+        """ Load stored candles within [start, end] as compact arrays."""
+        return CompactCandles.from_frame(
+            self.load(symbol, interval, start=start, end=end))
+
+    def merge(self, symbol: str, interval: str,
+              candles: Optional[pd.DataFrame] = None) -> None:
+        """ Merge candles anywhere in the stored range, sorting the candles
+            and dropping duplicate datetimes (the latest one is kept).
+
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            candles (pd.DataFrame): candles with columns of CrawlerColumns
+        """
+        stored = self.load(symbol, interval) \
+            .rename_axis(CrawlerColumns.DATETIME.value).reset_index()
+        if candles is not None and not candles.empty:
+            stored = pd.concat([stored, candles], ignore_index=True)
+
+        stored[CrawlerColumns.DATETIME.value] = \
+            pd.to_datetime(stored[CrawlerColumns.DATETIME.value])
+        stored = stored \
+            .drop_duplicates(CrawlerColumns.DATETIME.value, keep="last") \
+            .sort_values(CrawlerColumns.DATETIME.value, kind="stable")
+        self.write(symbol, interval,
+                   stored[[column.value for column in CrawlerColumns]])
+
+
+def to_timestamps(datetimes: pd.Series) -> np.ndarray:
+    """ Convert datetimes (or datetime strings) to epoch milliseconds."""
+    return pd.to_datetime(datetimes).to_numpy(
+        dtype="datetime64[ms]").astype(np.int64)
+
+
+def to_timestamp(value: datetime) -> int:
+    """ Convert a datetime to epoch millisecond."""
+    return int(pd.Timestamp(value).to_datetime64().astype("datetime64[ms]")
+               .astype(np.int64))
@@ -0,0 +1,80 @@
+from typing import Optional
+
+import numpy as np
+
+
+class CandleIndex:
+    def __init__(self,
+                 timestamps: np.ndarray,
+                 interval: Optional[int] = None,
+                 ):
+        """ Index over the stored candles.
+        args:
+            timestamps (np.ndarray): epoch milliseconds of the candles
+            interval (int): candle interval [unit: millisecond], required
+                            by the gaps only
+        """
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.interval = interval
+        self.ordered = not np.any(np.diff(self.timestamps) <= 0)
+
+    def has_duplicates(self) -> bool:
+        """ Whether the candles repeat or are out of order."""
+        return not self.ordered
+
+    def extend(self, timestamps: np.ndarray) -> None:
+        """ Append the candles stored after the indexed ones, checking the
+            order of the new candles only.
+        args:
+            timestamps (np.ndarray): epoch milliseconds of the candles
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if len(timestamps) == 0:
+            return
+        if len(self.timestamps) > 0:
+            self.ordered &= bool(timestamps[0] > self.timestamps[-1])
+        self.ordered &= not np.any(np.diff(timestamps) <= 0)
+        self.timestamps = np.concatenate((self.timestamps, timestamps))
+
+    def gaps(self,
+             start: Optional[int] = None,
+             end: Optional[int] = None,
+             ) -> list:
+        """ Missing ranges between the stored candles within [start, end],
+            including the range before the first stored candle.
+
+        args:
+            start (int): first epoch millisecond of interest
+            end (int): last epoch millisecond of interest
+
+        returns:
+            (start, end) of each missing range, bounded by the
+                neighbouring stored candles (list[tuple[int, int]])
+        """
+        assert self.interval is not None, "The interval is unspecified."
+        timestamps = self.timestamps
+        if len(timestamps) == 0:
+            return []
+        if self.ordered:
+            # only the candles within the range and their neighbours
+            lower = 0 if start is None \
+                else max(int(np.searchsorted(timestamps, start)) - 1, 0)
+            upper = len(timestamps) if end is None \
+                else int(np.searchsorted(timestamps, end, side="right")) + 1
+            timestamps = timestamps[lower:upper]
+        else:
+            timestamps = np.unique(timestamps)
+
+        gaps = []
+        if start is not None and start + self.interval <= timestamps[0]:
+            gaps.append((start, int(timestamps[0])))
+
+        missing = np.flatnonzero(np.diff(timestamps) > self.interval)
+        for gap_start, gap_end in zip(timestamps[missing],
+                                      timestamps[missing + 1]):
+            if start is not None and gap_end < start:
+                continue
+            if end is not None and gap_start > end:
+                continue
+            gaps.append((int(gap_start), int(gap_end)))
+        return gaps
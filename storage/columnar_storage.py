@@ -0,0 +1,277 @@
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from storage.base import BaseStorage, to_timestamp, to_timestamps
+from storage.compact_candles import VALUE_COLUMNS, CompactCandles
+
+DATETIME_DTYPE = np.dtype(np.int64)  # epoch millisecond
+VALUE_DTYPE = np.dtype(np.float64)
+
+
+class ColumnarStorage(BaseStorage):
+    def __init__(self, directory: str = "candles"):
+        """ Get the root directory of the columnar segments.
+            Each symbol and interval owns a directory with one raw binary
+            file per column of CrawlerColumns, so new candles are appended
+            in place and loaded through memory mapping without parsing.
+        """
+        self.directory = directory
+
+    def last_updated(self, symbol: str, interval: str) -> Optional[datetime]:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+
+        returns:
+            datetime of the latest stored candle (datetime)
+        """
+        timestamps = self._read_column(
+            symbol, interval, CrawlerColumns.DATETIME)
+        if len(timestamps) == 0:
+            return None
+        return pd.Timestamp(int(timestamps[-1]), unit="ms").to_pydatetime()
+
+    def timestamps(self, symbol: str, interval: str) -> np.ndarray:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+
+        returns:
+            epoch milliseconds of the stored candles (np.ndarray)
+        """
+        return self._read_column(symbol, interval, CrawlerColumns.DATETIME)
+
+    def append(self, symbol: str, interval: str,
+               candles: pd.DataFrame) -> None:
+        """ Only candles newer than the latest stored one are appended,
+            use merge for older ones.
+
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            candles (pd.DataFrame): candles with columns of CrawlerColumns
+        """
+        if candles is None or candles.empty:
+            return
+
+        timestamps = to_timestamps(candles[CrawlerColumns.DATETIME.value])
+        order = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+
+        stored = self._read_column(symbol, interval, CrawlerColumns.DATETIME)
+        if len(stored) > 0:
+            order = order[timestamps > stored[-1]]
+            timestamps = timestamps[timestamps > stored[-1]]
+        if len(timestamps) == 0:
+            return
+
+        os.makedirs(self._get_directory(symbol, interval), exist_ok=True)
+        for column in CrawlerColumns:
+            if column == CrawlerColumns.DATETIME:
+                values = timestamps
+            else:
+                values = candles[column.value].to_numpy(
+                    dtype=VALUE_DTYPE)[order]
+            with open(self._get_filename(symbol, interval, column),
+                      "ab") as f:
+                f.write(np.ascontiguousarray(values).tobytes())
+
+    def write(self, symbol: str, interval: str,
+              candles: pd.DataFrame) -> None:
+        """ Rewrite the columns through temporary files, so the memory
+            mapped columns are replaced at once.
+
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            candles (pd.DataFrame): sorted candles with columns of
+                                    CrawlerColumns
+        """
+        os.makedirs(self._get_directory(symbol, interval), exist_ok=True)
+        for column in CrawlerColumns:
+            if column == CrawlerColumns.DATETIME:
+                values = to_timestamps(candles[column.value])
+            else:
+                values = candles[column.value].to_numpy(dtype=VALUE_DTYPE)
+            filename = self._get_filename(symbol, interval, column)
+            with open(f"{filename}.tmp", "wb") as f:
+                f.write(np.ascontiguousarray(values).tobytes())
+            os.replace(f"{filename}.tmp", filename)
+
+    def load(self,
+             symbol: str,
+             interval: str,
+             start: Optional[datetime] = None,
+             end: Optional[datetime] = None,
+             ) -> pd.DataFrame:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            candles indexed by datetime (pd.DataFrame)
+        """
+        columns, lower, upper = self._read_columns(
+            symbol, interval, start, end)
+        return _to_frame(columns, lower, upper)
+
+    def load_tail(self,
+                  symbol: str,
+                  interval: str,
+                  bars: int,
+                  end: Optional[datetime] = None,
+                  ) -> pd.DataFrame:
+        """ Read only the latest bars of each column, located by the size
+            of the files (or by end within the mapped datetimes).
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            bars (int): number of the latest candles
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            candles indexed by datetime (pd.DataFrame)
+        """
+        if end is None:
+            upper = min(self._get_length(symbol, interval, column)
+                        for column in CrawlerColumns)
+        else:
+            _, _, upper = self._read_columns(symbol, interval, end=end)
+        lower = max(upper - bars, 0)
+        columns = {
+            column: self._read_rows(symbol, interval, column, lower, upper)
+            for column in CrawlerColumns
+        }
+        return _to_frame(columns, 0, upper - lower)
+
+    def load_compact(self,
+                     symbol: str,
+                     interval: str,
+                     start: Optional[datetime] = None,
+                     end: Optional[datetime] = None,
+                     ) -> CompactCandles:
+        """ Cast the memory mapped columns into compact arrays directly,
+            without float64 copies of the candles.
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            candles within [start, end] (CompactCandles)
+        """
+        columns, lower, upper = self._read_columns(
+            symbol, interval, start, end)
+        candles = CompactCandles.empty(upper - lower)
+        candles.timestamps[:] = columns[CrawlerColumns.DATETIME][lower:upper]
+        for row, column in enumerate(VALUE_COLUMNS):
+            candles.values[row] = columns[column][lower:upper]
+        return candles
+
+    def _read_columns(self,
+                      symbol: str,
+                      interval: str,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      ) -> tuple:
+        """ Map the columns and find the positions of [start, end]."""
+        columns = {
+            column: self._read_column(symbol, interval, column)
+            for column in CrawlerColumns
+        }
+        # a partially written append leaves columns with different lengths
+        length = min(len(values) for values in columns.values())
+
+        timestamps = columns[CrawlerColumns.DATETIME][:length]
+        lower = 0 if start is None else np.searchsorted(
+            timestamps, to_timestamp(start), side="left")
+        upper = length if end is None else np.searchsorted(
+            timestamps, to_timestamp(end), side="right")
+        return columns, int(lower), int(upper)
+
+    def _read_column(self,
+                     symbol: str,
+                     interval: str,
+                     column: CrawlerColumns,
+                     ) -> np.ndarray:
+        """ Memory map the binary file of the column."""
+        dtype = _get_dtype(column)
+        length = self._get_length(symbol, interval, column)
+        if length == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(
+            self._get_filename(symbol, interval, column),
+            dtype=dtype,
+            mode="r",
+            shape=(length,),
+        )
+
+    def _read_rows(self,
+                   symbol: str,
+                   interval: str,
+                   column: CrawlerColumns,
+                   lower: int,
+                   upper: int,
+                   ) -> np.ndarray:
+        """ Read the rows [lower, upper) of the column, cheaper than
+            mapping the file for a few rows."""
+        dtype = _get_dtype(column)
+        if upper <= lower:
+            return np.empty(0, dtype=dtype)
+        return np.fromfile(
+            self._get_filename(symbol, interval, column),
+            dtype=dtype,
+            count=upper - lower,
+            offset=lower * dtype.itemsize,
+        )
+
+    def _get_length(self,
+                    symbol: str,
+                    interval: str,
+                    column: CrawlerColumns,
+                    ) -> int:
+        """ Number of the rows in the binary file of the column."""
+        filename = self._get_filename(symbol, interval, column)
+        if not os.path.exists(filename):
+            return 0
+        return os.path.getsize(filename) // _get_dtype(column).itemsize
+
+    def _get_directory(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.directory, symbol, interval or "")
+
+    def _get_filename(self,
+                      symbol: str,
+                      interval: str,
+                      column: CrawlerColumns,
+                      ) -> str:
+        return os.path.join(
+            self._get_directory(symbol, interval), f"{column.value}.bin")
+
+
+def _get_dtype(column: CrawlerColumns) -> np.dtype:
+    return DATETIME_DTYPE \
+        if column == CrawlerColumns.DATETIME else VALUE_DTYPE
+
+
+def _to_frame(columns: dict, lower: int, upper: int) -> pd.DataFrame:
+    """ Copy the rows [lower, upper) of the columns into a dataframe of
+        one float64 block."""
+    timestamps = columns[CrawlerColumns.DATETIME]
+    return pd.DataFrame(
+        np.stack([columns[column][lower:upper] for column in VALUE_COLUMNS],
+                 axis=1),
+        index=pd.DatetimeIndex(
+            np.array(timestamps[lower:upper]).astype("datetime64[ms]")),
+        columns=[column.value for column in VALUE_COLUMNS],
+    )
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+
+VALUE_COLUMNS = [
+    column for column in CrawlerColumns if column != CrawlerColumns.DATETIME]
+VALUE_DTYPE = np.dtype(np.float32)
+
+
+class CompactCandles:
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray):
+        """ Candles as contiguous arrays: the int64 timestamps [unit:
+            millisecond] and one float32 row per column of OHLCV, half the
+            memory of float64 dataframe columns. The columns are exposed
+            as arrays (e.g. `Close`) so Indicator consumes the container
+            directly.
+        args:
+            timestamps (np.ndarray): epoch milliseconds of the candles
+            values (np.ndarray): OHLCV [shape: (5, candles)]
+        """
+        self.timestamps = timestamps
+        self.values = values
+
+    @classmethod
+    def empty(cls, length: int) -> "CompactCandles":
+        """ Allocate the arrays to be filled column by column."""
+        return cls(
+            np.empty(length, dtype=np.int64),
+            np.empty((len(VALUE_COLUMNS), length), dtype=VALUE_DTYPE),
+        )
+
+    @classmethod
+    def from_frame(cls, candles: pd.DataFrame) -> "CompactCandles":
+        """ Copy the candles indexed by datetime into compact arrays."""
+        compact_candles = cls.empty(len(candles))
+        compact_candles.timestamps[:] = pd.DatetimeIndex(candles.index) \
+            .as_unit("ms").asi8
+        for row, column in enumerate(VALUE_COLUMNS):
+            compact_candles.values[row] = candles[column.value]
+        return compact_candles
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.timestamps.view("datetime64[ms]"))
+
+    @property
+    def Open(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.OPEN)]
+
+    @property
+    def High(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.HIGH)]
+
+    @property
+    def Low(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.LOW)]
+
+    @property
+    def Close(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.CLOSE)]
+
+    @property
+    def Volume(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.VOLUME)]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def tail(self, bars: int) -> "CompactCandles":
+        """ Views of the latest bars, as a dataframe does."""
+        lower = max(len(self) - bars, 0)
+        return CompactCandles(
+            self.timestamps[lower:], self.values[:, lower:])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """ Column by name of CrawlerColumns, as a dataframe does."""
+        return getattr(self, column)
+
+    def to_frame(self) -> pd.DataFrame:
+        """ Dataframe of float32 columns which are views of the arrays."""
+        return pd.DataFrame(
+            {
+                column.value: self.values[row]
+                for row, column in enumerate(VALUE_COLUMNS)
+            },
+            index=self.index,
+            copy=False,
+        )
@@ -0,0 +1,168 @@
+import io
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from storage.base import BaseStorage, to_timestamps
+
+# initial guess of the bytes of a stored line, the tail read grows from
+TAIL_LINE_BYTES = 128
+
+
+class CsvStorage(BaseStorage):
+    def __init__(self, directory: str = "."):
+        """ Get the directory of csv files."""
+        self.directory = directory
+
+    def last_updated(self, symbol: str, interval: str) -> Optional[datetime]:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+
+        returns:
+            datetime of the latest stored candle (datetime)
+        """
+        filename = self._get_filename(symbol, interval)
+        if not os.path.exists(filename):
+            return None
+
+        historical_candles = self._read_tail(filename, 1)
+        if historical_candles.empty:
+            return None
+        return historical_candles.index[-1].to_pydatetime()
+
+    def timestamps(self, symbol: str, interval: str) -> np.ndarray:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+
+        returns:
+            epoch milliseconds of the stored candles (np.ndarray)
+        """
+        filename = self._get_filename(symbol, interval)
+        if not os.path.exists(filename):
+            return np.empty(0, dtype=np.int64)
+        return to_timestamps(pd.read_csv(
+            filename,
+            usecols=[CrawlerColumns.DATETIME.value],
+        )[CrawlerColumns.DATETIME.value])
+
+    def append(self, symbol: str, interval: str,
+               candles: pd.DataFrame) -> None:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            candles (pd.DataFrame): candles with columns of CrawlerColumns
+        """
+        filename = self._get_filename(symbol, interval)
+        candles.to_csv(
+            filename,
+            mode="a",
+            header=(not os.path.exists(filename)),
+            index=False,
+        )
+
+    def write(self, symbol: str, interval: str,
+              candles: pd.DataFrame) -> None:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            candles (pd.DataFrame): sorted candles with columns of
+                                    CrawlerColumns
+        """
+        filename = self._get_filename(symbol, interval)
+        candles.to_csv(f"{filename}.tmp", index=False,
+                       date_format="%Y-%m-%d %H:%M:%S")
+        os.replace(f"{filename}.tmp", filename)
+
+    def load(self,
+             symbol: str,
+             interval: str,
+             start: Optional[datetime] = None,
+             end: Optional[datetime] = None,
+             ) -> pd.DataFrame:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            candles indexed by datetime (pd.DataFrame)
+        """
+        candles = _read_candles(self._get_filename(symbol, interval))
+        return candles.loc[start:end]
+
+    def load_tail(self,
+                  symbol: str,
+                  interval: str,
+                  bars: int,
+                  end: Optional[datetime] = None,
+                  ) -> pd.DataFrame:
+        """ Load the latest bars, none of a symbol without the csv file.
+            Only the end of the file holding them is read and parsed.
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the candles
+            bars (int): number of the latest candles
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            candles indexed by datetime (pd.DataFrame)
+        """
+        filename = self._get_filename(symbol, interval)
+        if not os.path.exists(filename):
+            return pd.DataFrame(
+                columns=[column.value for column in CrawlerColumns
+                         if column != CrawlerColumns.DATETIME],
+                index=pd.DatetimeIndex([]),
+            )
+        return self._read_tail(filename, bars, end=end)
+
+    def _read_tail(self,
+                   filename: str,
+                   bars: int,
+                   end: Optional[datetime] = None,
+                   ) -> pd.DataFrame:
+        """ Parse the lines from the end of the file, doubling the bytes
+            read until they hold the latest bars up to end (or the file is
+            read through).
+        """
+        with open(filename, "rb") as f:
+            header = f.readline()
+            body = f.tell()
+            size = f.seek(0, os.SEEK_END)
+            length = max(bars, 1) * TAIL_LINE_BYTES
+            while True:
+                offset = max(size - length, body)
+                f.seek(offset)
+                lines = f.read(size - offset)
+                if offset > body:
+                    # the first line read may start before the offset
+                    lines = lines[lines.find(b"\n") + 1:] \
+                        if b"\n" in lines else b""
+                candles = _read_candles(io.BytesIO(header + lines)) \
+                    .loc[:end]
+                if len(candles) >= bars or offset == body:
+                    return candles.iloc[max(len(candles) - bars, 0):]
+                length *= 2
+
+    def _get_filename(self, symbol: str, interval: str) -> str:
+        """ Keep the original naming `<symbol>.csv` of the cache."""
+        return os.path.join(self.directory, f"{symbol}.csv")
+
+
+def _read_candles(source) -> pd.DataFrame:
+    """ Parse the csv candles indexed by datetime."""
+    candles = pd.read_csv(source, index_col=CrawlerColumns.DATETIME.value)
+    candles.index = pd.DatetimeIndex(candles.index.values)
+    return candles
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+
+VALUE_COLUMNS = [
+    column for column in CrawlerColumns if column != CrawlerColumns.DATETIME]
+
+
+class PanelCandles:
+    def __init__(self,
+                 symbols: list,
+                 timestamps: np.ndarray,
+                 values: np.ndarray,
+                 ):
+        """ Candles of many symbols aligned by datetime (or by position),
+            one (symbols x candles) matrix per column of OHLCV. The columns are
+            exposed as matrices (e.g. `Close`) so PanelIndicator computes
+            every symbol in one call.
+        args:
+            symbols (list[str]): symbols of the rows
+            timestamps (np.ndarray): epoch milliseconds of the candles
+                [shape: (candles), or (symbols, candles) aligned by
+                        position]
+            values (np.ndarray): OHLCV [shape: (5, symbols, candles)]
+        """
+        self.symbols = symbols
+        self.timestamps = timestamps
+        self.values = values
+
+    @classmethod
+    def from_frames(cls,
+                    candles: dict,
+                    intersect: bool = True,
+                    ) -> "PanelCandles":
+        """ Align the candles of each symbol by datetime.
+        args:
+            candles (dict[str, pd.DataFrame]): candles of each symbol
+            intersect (bool): keep the datetimes shared by all symbols,
+                              otherwise keep all of them and leave nan
+                              where a symbol has no candle
+
+        returns:
+            panel candles (PanelCandles)
+        """
+        assert candles, "The candles are empty."
+        index = None
+        for frame in candles.values():
+            frame_index = pd.DatetimeIndex(frame.index)
+            if index is None:
+                index = frame_index
+            elif intersect:
+                index = index.intersection(frame_index)
+            else:
+                index = index.union(frame_index)
+        index = index.sort_values()
+
+        values = np.empty((len(VALUE_COLUMNS), len(candles), len(index)))
+        for row, frame in enumerate(candles.values()):
+            frame = frame[~frame.index.duplicated(keep="last")] \
+                .reindex(index)
+            for column_row, column in enumerate(VALUE_COLUMNS):
+                values[column_row, row] = frame[column.value]
+        return cls(list(candles), index.as_unit("ms").asi8, values)
+
+    @classmethod
+    def from_tails(cls, candles: dict, bars: int) -> "PanelCandles":
+        """ Align the latest bars of each symbol by position rather than
+            by datetime, so every row ends with the latest candle of its
+            symbol whenever it was; shorter histories are led by nan.
+        args:
+            candles (dict[str, pd.DataFrame]): candles of each symbol
+            bars (int): number of the latest candles of each symbol
+
+        returns:
+            panel candles (PanelCandles)
+        """
+        names = [column.value for column in VALUE_COLUMNS]
+        timestamps = np.zeros((len(candles), bars), dtype=np.int64)
+        values = np.full((len(VALUE_COLUMNS), len(candles), bars), np.nan)
+        for row, frame in enumerate(candles.values()):
+            length = min(len(frame), bars)
+            if length == 0:
+                continue
+            timestamps[row, -length:] = pd.DatetimeIndex(
+                frame.index[-length:]).as_unit("ms").asi8
+            # selecting the columns costs more than the rows of a tail
+            if list(frame.columns) != names:
+                frame = frame[names]
+            values[:, row, -length:] = frame.to_numpy()[-length:].T
+        return cls(list(candles), timestamps, values)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """ Datetimes shared by the symbols aligned by datetime."""
+        assert self.timestamps.ndim == 1, \
+            "The candles are aligned by position."
+        return pd.DatetimeIndex(self.timestamps.view("datetime64[ms]"))
+
+    @property
+    def latest(self) -> pd.DatetimeIndex:
+        """ Datetime of the latest candle of each symbol."""
+        latest = np.broadcast_to(
+            self.timestamps[..., -1], (len(self.symbols),))
+        return pd.DatetimeIndex(latest.view("datetime64[ms]"))
+
+    @property
+    def Open(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.OPEN)]
+
+    @property
+    def High(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.HIGH)]
+
+    @property
+    def Low(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.LOW)]
+
+    @property
+    def Close(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.CLOSE)]
+
+    @property
+    def Volume(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.VOLUME)]
+
+    def __len__(self) -> int:
+        return self.timestamps.shape[-1]
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """ Column by name of CrawlerColumns, as a dataframe does."""
+        return getattr(self, column)
+
+    def to_frame(self, symbol: str) -> pd.DataFrame:
+        """ Dataframe of the candles of a symbol, the rows with nan (where
+            the symbol has no candle) dropped."""
+        row = self.symbols.index(symbol)
+        timestamps = self.timestamps \
+            if self.timestamps.ndim == 1 else self.timestamps[row]
+        return pd.DataFrame(
+            {
+                column.value: self.values[column_row, row]
+                for column_row, column in enumerate(VALUE_COLUMNS)
+            },
+            index=pd.DatetimeIndex(timestamps.view("datetime64[ms]")),
+        ).dropna()
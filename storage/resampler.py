@@ -0,0 +1,196 @@
+from collections import namedtuple
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns, IntervalType
+from storage.base import BaseStorage, to_timestamp, to_timestamps
+
+# weeks start on monday, 1970-01-05, as the weekly candles of binance
+WEEK_OFFSET = 4 * 24 * 60 * 60 * 1000
+
+# candles aggregated since the bucket floor first (none since the first
+# stored candle), and the first datetime of their last, maybe open, bucket
+Aggregate = namedtuple("Aggregate", ["candles", "first", "last_bucket"])
+
+
+class Resampler:
+    def __init__(self, storage: BaseStorage):
+        """ Derive candles of longer intervals from the stored candles,
+            keeping the aggregates to be extended from their last bucket
+            as new candles arrive.
+        args:
+            storage (BaseStorage): storage of the base candles
+        """
+        self.storage = storage
+        self.aggregates = {}
+
+    def load(self,
+             symbol: str,
+             interval: str,
+             timeframe: Optional[str] = None,
+             start: Optional[datetime] = None,
+             end: Optional[datetime] = None,
+             ) -> pd.DataFrame:
+        """
+        args:
+            symbol (str): symbol of the candles
+            interval (str): interval of the stored candles
+            timeframe (str): interval of the derived candles
+            start (datetime): first datetime to be loaded (inclusive)
+            end (datetime): last datetime to be loaded (inclusive)
+
+        returns:
+            candles indexed by the datetime of their last base candle
+                (pd.DataFrame)
+        """
+        if timeframe is None or timeframe == interval:
+            return self.storage.load(symbol, interval, start=start, end=end)
+        assert timeframe in IntervalType.list() \
+            and interval in IntervalType.list(), \
+            "The timeframe is unsupported."
+        assert IntervalType(timeframe).milliseconds \
+            > IntervalType(interval).milliseconds, \
+            "The timeframe should be longer than the interval."
+
+        candles = self._update(
+            symbol,
+            interval,
+            timeframe,
+            None if start is None
+            else get_bucket_floor(to_timestamp(start), timeframe),
+        )
+        return candles.loc[start:end]
+
+    def invalidate(self, symbol: str, interval: str) -> None:
+        """ Drop the aggregates of the stored candles, e.g. after earlier
+            candles were merged into them."""
+        for key in list(self.aggregates):
+            if key[:2] == (symbol, interval):
+                del self.aggregates[key]
+
+    def _update(self,
+                symbol: str,
+                interval: str,
+                timeframe: str,
+                first: Optional[int] = None,
+                ) -> pd.DataFrame:
+        """ Aggregate the base candles since the last (maybe open) bucket,
+            or since the bucket floor first if the aggregate does not
+            cover it; the buckets before the last one are unchanged since
+            the storages only append newer candles (merges invalidate).
+        """
+        key = (symbol, interval, timeframe)
+        aggregate = self.aggregates.get(key)
+        if aggregate is not None and aggregate.first is not None \
+                and (first is None or first < aggregate.first):
+            aggregate = None
+
+        candles = self.storage.load(
+            symbol,
+            interval,
+            start=_to_datetime(first if aggregate is None
+                               else aggregate.last_bucket),
+        )
+        timestamps = to_timestamps(candles.index)
+        starts = get_bucket_starts(timestamps, timeframe)
+        resampled = _aggregate(candles, starts)
+        if aggregate is not None:
+            resampled = pd.concat([aggregate.candles.iloc[:-1], resampled])
+
+        if len(starts) > 0:
+            self.aggregates[key] = Aggregate(
+                candles=resampled,
+                first=first if aggregate is None else aggregate.first,
+                last_bucket=int(timestamps[starts[-1]]),
+            )
+        return resampled
+
+
+def resample(candles: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """ Aggregate sorted candles into candles of a longer interval.
+    args:
+        candles (pd.DataFrame): candles indexed by datetime
+        timeframe (str): interval of the aggregated candles
+
+    returns:
+        candles indexed by the datetime of their last base candle
+            (pd.DataFrame)
+    """
+    assert timeframe in IntervalType.list(), "The timeframe is unsupported."
+    return _aggregate(
+        candles, get_bucket_starts(to_timestamps(candles.index), timeframe))
+
+
+def get_bucket_starts(timestamps: np.ndarray, timeframe: str) -> np.ndarray:
+    """ Get the position of the first candle of each bucket.
+    args:
+        timestamps (np.ndarray): sorted epoch milliseconds of the candles
+        timeframe (str): interval of the buckets
+
+    returns:
+        positions of the first candle of each bucket (np.ndarray)
+    """
+    if len(timestamps) == 0:
+        return np.empty(0, dtype=np.int64)
+    buckets = _get_buckets(timestamps, timeframe)
+    return np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+
+
+def get_bucket_floor(timestamp: int, timeframe: str) -> int:
+    """ Get the first epoch millisecond of the bucket of a timestamp.
+    args:
+        timestamp (int): epoch millisecond
+        timeframe (str): interval of the buckets
+
+    returns:
+        first epoch millisecond of the bucket (int)
+    """
+    interval = IntervalType(timeframe)
+    if interval == IntervalType.MONTH_1:
+        return int(np.datetime64(timestamp, "ms").astype("datetime64[M]")
+                   .astype("datetime64[ms]").astype(np.int64))
+    bucket = int(_get_buckets(np.array([timestamp]), timeframe)[0])
+    if interval == IntervalType.WEEK_1:
+        return bucket * interval.milliseconds + WEEK_OFFSET
+    return bucket * interval.milliseconds
+
+
+def _get_buckets(timestamps: np.ndarray, timeframe: str) -> np.ndarray:
+    """ Number of the bucket of each epoch millisecond."""
+    interval = IntervalType(timeframe)
+    if interval == IntervalType.MONTH_1:
+        return timestamps.astype("datetime64[ms]") \
+            .astype("datetime64[M]").astype(np.int64)
+    if interval == IntervalType.WEEK_1:
+        return (timestamps - WEEK_OFFSET) // interval.milliseconds
+    return timestamps // interval.milliseconds
+
+
+def _to_datetime(timestamp: Optional[int]) -> Optional[datetime]:
+    if timestamp is None:
+        return None
+    return pd.Timestamp(timestamp, unit="ms").to_pydatetime()
+
+
+def _aggregate(candles: pd.DataFrame, starts: np.ndarray) -> pd.DataFrame:
+    if len(starts) == 0:
+        return candles.iloc[:0]
+    ends = np.append(starts[1:], len(candles)) - 1
+    return pd.DataFrame(
+        {
+            CrawlerColumns.OPEN.value:
+                candles[CrawlerColumns.OPEN.value].to_numpy()[starts],
+            CrawlerColumns.HIGH.value: np.maximum.reduceat(
+                candles[CrawlerColumns.HIGH.value].to_numpy(), starts),
+            CrawlerColumns.LOW.value: np.minimum.reduceat(
+                candles[CrawlerColumns.LOW.value].to_numpy(), starts),
+            CrawlerColumns.CLOSE.value:
+                candles[CrawlerColumns.CLOSE.value].to_numpy()[ends],
+            CrawlerColumns.VOLUME.value: np.add.reduceat(
+                candles[CrawlerColumns.VOLUME.value].to_numpy(), starts),
+        },
+        index=candles.index[ends],
+    )
@@ -0,0 +1,50 @@
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# name is the shared memory name, dtype the string of the numpy dtype
+SharedArrayHandle = namedtuple(
+    "SharedArrayHandle", ["name", "shape", "dtype"])
+
+
+class SharedArray:
+    def __init__(self, memory: shared_memory.SharedMemory, handle):
+        """ Array in one block of shared memory, so processes map the same
+            pages instead of unpickling copies, e.g. the signals of every
+            parameter set of a walk-forward.
+        args:
+            memory (shared_memory.SharedMemory): block of the array
+            handle (SharedArrayHandle): shape and dtype of the array
+        """
+        self.memory = memory
+        self.array = np.ndarray(
+            handle.shape, dtype=np.dtype(handle.dtype), buffer=memory.buf)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "SharedArray":
+        """ Copy the array into a new block."""
+        array = np.asarray(array)
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1))
+        shared_array = cls(memory, SharedArrayHandle(
+            memory.name, array.shape, array.dtype.str))
+        shared_array.array[...] = array
+        return shared_array
+
+    @classmethod
+    def attach(cls, handle: "SharedArrayHandle") -> "SharedArray":
+        """ Map the block created by another process."""
+        return cls(shared_memory.SharedMemory(name=handle.name), handle)
+
+    @property
+    def handle(self) -> "SharedArrayHandle":
+        """ Picklable reference to the block."""
+        return SharedArrayHandle(
+            self.memory.name, self.array.shape, self.array.dtype.str)
+
+    def unlink(self) -> None:
+        """ Release the block, called by the creating process only."""
+        self.array = None
+        self.memory.close()
+        self.memory.unlink()
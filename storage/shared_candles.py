@@ -0,0 +1,151 @@
+import os
+from collections import namedtuple
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+
+VALUE_COLUMNS = [
+    column for column in CrawlerColumns if column != CrawlerColumns.DATETIME]
+
+# name is the shared memory name, or the file path if backed by a file
+SharedCandlesHandle = namedtuple(
+    "SharedCandlesHandle", ["name", "length", "is_file"])
+
+
+class SharedCandles:
+    def __init__(self,
+                 buffer: np.ndarray,
+                 length: int,
+                 memory: Optional[shared_memory.SharedMemory] = None,
+                 filename: Optional[str] = None,
+                 ):
+        """ Candles laid out in one block of shared memory or of a memory
+            mapped file: the int64 timestamps [unit: nanosecond] followed
+            by one contiguous float64 row per column of OHLCV. Processes
+            map the same pages instead of unpickling copies, and the
+            columns are exposed as arrays (e.g. `Close`) so Indicator
+            consumes the container directly.
+        """
+        self.buffer = buffer
+        self.length = length
+        self.memory = memory
+        self.filename = filename
+
+        offset = length * np.dtype(np.int64).itemsize
+        self.timestamps = buffer[:offset].view(np.int64)
+        self.values = buffer[offset:].view(np.float64) \
+            .reshape(len(VALUE_COLUMNS), length)
+
+    @classmethod
+    def from_frame(cls,
+                   candles: pd.DataFrame,
+                   filename: Optional[str] = None,
+                   ) -> "SharedCandles":
+        """ Copy the candles indexed by datetime into a new block.
+        args:
+            candles (pd.DataFrame): candles indexed by datetime
+            filename (str): file to be memory mapped, shared memory if None
+
+        returns:
+            candles in the new block (SharedCandles)
+        """
+        length = len(candles)
+        size = max(length * (1 + len(VALUE_COLUMNS)) * 8, 1)
+        if filename is None:
+            memory = shared_memory.SharedMemory(create=True, size=size)
+            shared_candles = cls(
+                np.ndarray((size,), dtype=np.uint8, buffer=memory.buf),
+                length,
+                memory=memory,
+            )
+        else:
+            shared_candles = cls(
+                np.memmap(filename, dtype=np.uint8, mode="w+", shape=size),
+                length,
+                filename=filename,
+            )
+
+        shared_candles.timestamps[:] = pd.DatetimeIndex(candles.index) \
+            .as_unit("ns").asi8
+        for row, column in enumerate(VALUE_COLUMNS):
+            shared_candles.values[row] = \
+                candles[column.value].to_numpy(dtype=np.float64)
+        return shared_candles
+
+    @classmethod
+    def attach(cls, handle: "SharedCandlesHandle") -> "SharedCandles":
+        """ Map the block created by another process."""
+        if handle.is_file:
+            return cls(
+                np.memmap(handle.name, dtype=np.uint8, mode="r"),
+                handle.length,
+                filename=handle.name,
+            )
+        memory = shared_memory.SharedMemory(name=handle.name)
+        return cls(
+            np.ndarray((memory.size,), dtype=np.uint8, buffer=memory.buf),
+            handle.length,
+            memory=memory,
+        )
+
+    @property
+    def handle(self) -> "SharedCandlesHandle":
+        """ Picklable reference to the block."""
+        if self.memory is None:
+            return SharedCandlesHandle(self.filename, self.length, True)
+        return SharedCandlesHandle(self.memory.name, self.length, False)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.timestamps.view("datetime64[ns]"))
+
+    @property
+    def Open(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.OPEN)]
+
+    @property
+    def High(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.HIGH)]
+
+    @property
+    def Low(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.LOW)]
+
+    @property
+    def Close(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.CLOSE)]
+
+    @property
+    def Volume(self) -> np.ndarray:
+        return self.values[VALUE_COLUMNS.index(CrawlerColumns.VOLUME)]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """ Column by name of CrawlerColumns, as a dataframe does."""
+        return getattr(self, column)
+
+    def to_frame(self) -> pd.DataFrame:
+        """ Dataframe whose columns are views of the block."""
+        return pd.DataFrame(
+            {
+                column.value: self.values[row]
+                for row, column in enumerate(VALUE_COLUMNS)
+            },
+            index=self.index,
+            copy=False,
+        )
+
+    def unlink(self) -> None:
+        """ Release the block, called by the creating process only."""
+        self.buffer = self.timestamps = self.values = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+        else:
+            os.remove(self.filename)
@@ -1,4 +1,15 @@
-from strategy.crossover_strategy import CrossOverStrategy
-from strategy.overreact_strategy import OverReactStrategy
+from utils.lazy import lazy_getattr
 
-__all__ = ["CrossOverStrategy", "OverReactStrategy"]
+_MODULES = {
+    "CompositeStrategy": "strategy.composite_strategy",
+    "CrossOverStrategy": "strategy.crossover_strategy",
+    "CrossOverSweep": "strategy.crossover_sweep",
+    "OverReactStrategy": "strategy.overreact_strategy",
+    "SignalCache": "strategy.signal_cache",
+    "StreamingCrossOverStrategy": "strategy.streaming_strategy",
+    "StreamingOverReactStrategy": "strategy.streaming_strategy",
+}
+
+__all__ = list(_MODULES)
+
+__getattr__ = lazy_getattr(__name__, _MODULES)
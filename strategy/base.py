@@ -1,4 +1,6 @@
 import abc
+import inspect
+from typing import Callable
 
 import numpy as np
 
@@ -11,11 +13,31 @@ class BaseStrategy(metaclass=abc.ABCMeta):
         self.indicator = indicator
 
     @abc.abstractmethod
-    def trade_by_indicator(self, 
-        indicator_type: IndicatorType) -> Callable[[], np.ndarray]:
+    def trade_by_indicator(
+            self, indicator_type: IndicatorType) -> Callable[[], np.ndarray]:
         """ Get trading strategy function."""
         pass
 
+    def get_lines(self, method: str, **parameters) -> dict:
+        """ Get the lines (and the bounds) the signal logic of a strategy
+            function compares, e.g. the fast and slow moving averages.
+        args:
+            method (str): strategy function, e.g. trade_by_sma
+            parameters (dict): parameters of the strategy function
+
+        returns:
+            keyword arguments of the signal logic (dict)
+        """
+        get_lines = getattr(
+            self, method.replace("trade_by_", "_get_lines_by_", 1), None)
+        assert get_lines is not None, \
+            "The lines of the strategy function are unsupported."
+        # the defaults are declared by the strategy function only
+        arguments = inspect.signature(getattr(self, method)).bind(
+            **parameters)
+        arguments.apply_defaults()
+        return get_lines(**arguments.arguments)
+
     @abc.abstractmethod
     def _get_signals(self) -> np.ndarray:
         """ Implement signal logic."""
@@ -35,4 +57,4 @@ class BaseStrategy(metaclass=abc.ABCMeta):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        return signal_buy.astype(int) - signal_sell.astype(int)
+        return np.subtract(signal_buy, signal_sell, dtype=np.int8)
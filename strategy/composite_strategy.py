@@ -0,0 +1,99 @@
+from typing import Callable, Optional
+
+import numpy as np
+
+from constants.constants import Config, IndicatorType, RuleRole, StrategyType
+from registry.registry import (
+    get_strategy_entry,
+    get_strategy_function,
+    validate_parameters,
+)
+from strategy.base import BaseStrategy
+
+
+class CompositeStrategy(BaseStrategy):
+    strategy_type = StrategyType.COMPOSITE_STRATEGY
+
+    def trade_by_indicator(
+        self,
+        indicator_type: Optional[IndicatorType] = None,
+    ) -> Callable[[], np.ndarray]:
+        """ Get trading strategy function."""
+        entry = get_strategy_entry(self.strategy_type, indicator_type)
+        return getattr(self, entry.method)
+
+    def trade_by_rules(
+        self,
+        rules: list,
+        threshold: float = 0.5,
+    ) -> np.ndarray:
+        """ Consider the agreement of several strategies to be trading time.
+            1. buy when the weighted signals of triggers reach threshold
+               and no filter signals selling
+            2. sell when the weighted signals of triggers reach -threshold
+               and no filter signals buying
+
+        args:
+            rules (list[dict]): strategy, indicator and parameters of each
+                                rule, with weight (1 by default) and role
+                                (trigger by default, or filter)
+            threshold (float) the weighted signals to trade
+
+        returns:
+            singal (np.ndarray): signal for trading points
+                                (1 for buying and -1 for selling)
+        """
+        assert rules, "The rules are empty."
+        assert threshold > 0, "The threshold should be positive."
+        signals, weights, is_filter = [], [], []
+        for rule in rules:
+            assert rule[Config.STRATEGY] != self.strategy_type.value, \
+                "The strategy type is unsupported."
+            assert rule.get(Config.ROLE, RuleRole.TRIGGER.value) \
+                in RuleRole.list(), "The rule role is unsupported."
+            parameters = validate_parameters(
+                rule[Config.STRATEGY],
+                rule[Config.INDICATOR],
+                rule.get(Config.PARAMETERS, {}),
+            )
+            # the rules share the indicator, so its cached inputs and lines
+            # are computed once
+            signals.append(get_strategy_function(
+                rule[Config.STRATEGY],
+                rule[Config.INDICATOR],
+                self.indicator,
+            )(**parameters))
+            weights.append(float(rule.get(Config.WEIGHT, 1)))
+            is_filter.append(rule.get(Config.ROLE) == RuleRole.FILTER.value)
+
+        return self._get_signals(
+            np.vstack(signals),
+            np.array(weights),
+            np.array(is_filter, dtype=bool),
+            threshold,
+        )
+
+    def _get_signals(
+        self,
+        signals: np.ndarray,
+        weights: np.ndarray,
+        is_filter: np.ndarray,
+        threshold: float,
+    ) -> np.ndarray:
+        """ Implement signal logic.
+
+        args:
+            signals (np.ndarray): signal of each rule [shape: (rules, bars)]
+            weights (np.ndarray): weight of each rule
+            is_filter (np.ndarray): whether each rule is a filter
+            threshold (float) the weighted signals to trade
+
+        returns:
+            singal (np.ndarray): signal for trading points
+                                (1 for buying and -1 for selling)
+        """
+        score = weights[~is_filter] @ signals[~is_filter]
+        filters = signals[is_filter]
+        signal_buy = (score >= threshold) & ~np.any(filters < 0, axis=0)
+        signal_sell = (score <= -threshold) & ~np.any(filters > 0, axis=0)
+        return self._combine_signals(signal_buy, signal_sell)
@@ -2,36 +2,19 @@ from typing import Callable
 
 import numpy as np
 
-from constants.constants import IndicatorType
+from constants.constants import IndicatorType, StrategyType
+from registry.registry import get_strategy_entry
 from strategy.base import BaseStrategy
 
 
 class CrossOverStrategy(BaseStrategy):
+    strategy_type = StrategyType.CROSSOVER_STRATEGY
+
     def trade_by_indicator(
             self, indicator_type: IndicatorType) -> Callable[[], np.ndarray]:
         """ Get trading strategy function."""
-        if (indicator_type == IndicatorType.SMA):
-            return self.trade_by_sma
-        elif (indicator_type == IndicatorType.EMA):
-            return self.trade_by_ema
-        elif (indicator_type == IndicatorType.WMA):
-            return self.trade_by_wma
-        elif (indicator_type == IndicatorType.MACD):
-            return self.trade_by_macd
-        elif (indicator_type == IndicatorType.MTM):
-            return self.trade_by_mtm
-        elif (indicator_type == IndicatorType.MTM_MA):
-            return self.trade_by_mtm_and_mtm_ma
-        elif (indicator_type == IndicatorType.ROC):
-            return self.trade_by_roc
-        elif (indicator_type == IndicatorType.ROC_MA):
-            return self.trade_by_roc_and_roc_ma
-        elif (indicator_type == IndicatorType.RSI):
-            return self.trade_by_rsi
-        elif (indicator_type == IndicatorType.KD):
-            return self.trade_by_kd
-        else:
-            raise Exception("The strategy logic is unsupported.")
+        entry = get_strategy_entry(self.strategy_type, indicator_type)
+        return getattr(self, entry.method)
 
     def trade_by_sma(
         self,
@@ -50,9 +33,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        sma1 = self.indicator.sma(timeperiod=fastperiod)
-        sma2 = self.indicator.sma(timeperiod=slowperiod)
-        return self._get_signals(sma1, sma2)
+        return self._get_signals(**self._get_lines_by_sma(
+            fastperiod=fastperiod, slowperiod=slowperiod))
 
     def trade_by_ema(
         self,
@@ -71,9 +53,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        ema1 = self.indicator.ema(timeperiod=fastperiod)
-        ema2 = self.indicator.ema(timeperiod=slowperiod)
-        return self._get_signals(ema1, ema2)
+        return self._get_signals(**self._get_lines_by_ema(
+            fastperiod=fastperiod, slowperiod=slowperiod))
 
     def trade_by_wma(
         self,
@@ -92,9 +73,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        wma1 = self.indicator.wma(timeperiod=fastperiod)
-        wma2 = self.indicator.wma(timeperiod=slowperiod)
-        return self._get_signals(wma1, wma2)
+        return self._get_signals(**self._get_lines_by_wma(
+            fastperiod=fastperiod, slowperiod=slowperiod))
 
     def trade_by_kd(
         self,
@@ -113,8 +93,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        k, d = self.indicator.kd(k_period=k_period, d_period=d_period)
-        return self._get_signals(d, k)
+        return self._get_signals(**self._get_lines_by_kd(
+            k_period=k_period, d_period=d_period))
 
     def trade_by_macd(
         self,
@@ -122,8 +102,11 @@ class CrossOverStrategy(BaseStrategy):
         slowperiod: int = 26,
         signalperiod: int = 9,
     ) -> np.ndarray:
-        macd, macd_signal, macd_hist = self.indicator.macd()
-        return self._get_signals(macd, macd_signal)
+        return self._get_signals(**self._get_lines_by_macd(
+            fastperiod=fastperiod,
+            slowperiod=slowperiod,
+            signalperiod=signalperiod,
+        ))
 
     def trade_by_mtm(self, timeperiod: int = 10) -> np.ndarray:
         """ Consider crossover points to be trading time.
@@ -137,9 +120,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        mtm = self.indicator.mtm(timeperiod=timeperiod)
-        centerline = np.zeros_like(mtm)
-        return self._get_signals(mtm, centerline)
+        return self._get_signals(
+            **self._get_lines_by_mtm(timeperiod=timeperiod))
 
     def trade_by_mtm_and_mtm_ma(
         self,
@@ -158,9 +140,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        mtm = self.indicator.mtm(timeperiod=mtm_period)
-        mtm_ma = self.indicator.ema_with_data(mtm, timeperiod=mtm_ma_period)
-        return self._get_signals(mtm, mtm_ma)
+        return self._get_signals(**self._get_lines_by_mtm_and_mtm_ma(
+            mtm_period=mtm_period, mtm_ma_period=mtm_ma_period))
 
     def trade_by_roc(self, timeperiod: int = 10) -> np.ndarray:
         """ Consider crossover points to be trading time.
@@ -174,9 +155,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        roc = self.indicator.roc(timeperiod=timeperiod)
-        centerline = np.zeros_like(roc)
-        return self._get_signals(roc, centerline)
+        return self._get_signals(
+            **self._get_lines_by_roc(timeperiod=timeperiod))
 
     def trade_by_roc_and_roc_ma(
         self,
@@ -195,9 +175,8 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        roc = self.indicator.roc(timeperiod=roc_period)
-        roc_ma = self.indicator.sma_with_data(roc, timeperiod=roc_ma_period)
-        return self._get_trading_point(roc, roc_ma)
+        return self._get_signals(**self._get_lines_by_roc_and_roc_ma(
+            roc_period=roc_period, roc_ma_period=roc_ma_period))
 
     def trade_by_rsi(self, timeperiod: int = 14) -> np.ndarray:
         """ Consider crossover points to be trading time.
@@ -211,9 +190,89 @@ class CrossOverStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        rsi = self.indicator.rsi(timeperiod=timeperiod)
-        centerline = np.ones_like(rsi) * 50
-        return self._get_signals(rsi, centerline)
+        return self._get_signals(
+            **self._get_lines_by_rsi(timeperiod=timeperiod))
+
+    def _get_lines_by_sma(self,
+                          fastperiod: int,
+                          slowperiod: int) -> dict:
+        return {
+            "fast": self.indicator.sma(timeperiod=fastperiod),
+            "slow": self.indicator.sma(timeperiod=slowperiod),
+        }
+
+    def _get_lines_by_ema(self,
+                          fastperiod: int,
+                          slowperiod: int) -> dict:
+        return {
+            "fast": self.indicator.ema(timeperiod=fastperiod),
+            "slow": self.indicator.ema(timeperiod=slowperiod),
+        }
+
+    def _get_lines_by_wma(self,
+                          fastperiod: int,
+                          slowperiod: int) -> dict:
+        return {
+            "fast": self.indicator.wma(timeperiod=fastperiod),
+            "slow": self.indicator.wma(timeperiod=slowperiod),
+        }
+
+    def _get_lines_by_kd(self,
+                         k_period: int,
+                         d_period: int) -> dict:
+        k, d = self.indicator.kd(k_period=k_period, d_period=d_period)
+        return {"fast": d, "slow": k}
+
+    def _get_lines_by_macd(self,
+                           fastperiod: int,
+                           slowperiod: int,
+                           signalperiod: int) -> dict:
+        macd, macd_signal, macd_hist = self.indicator.macd(
+            fastperiod=fastperiod,
+            slowperiod=slowperiod,
+            signalperiod=signalperiod,
+        )
+        return {"fast": macd, "slow": macd_signal}
+
+    def _get_lines_by_centerline(self,
+                                 line: np.ndarray,
+                                 centerline: float) -> dict:
+        return {
+            "fast": line,
+            "slow": np.broadcast_to(centerline, np.shape(line)),
+        }
+
+    def _get_lines_by_mtm(self, timeperiod: int) -> dict:
+        return self._get_lines_by_centerline(
+            self.indicator.mtm(timeperiod=timeperiod), 0.0)
+
+    def _get_lines_by_roc(self, timeperiod: int) -> dict:
+        return self._get_lines_by_centerline(
+            self.indicator.roc(timeperiod=timeperiod), 0.0)
+
+    def _get_lines_by_rsi(self, timeperiod: int) -> dict:
+        return self._get_lines_by_centerline(
+            self.indicator.rsi(timeperiod=timeperiod), 50.0)
+
+    def _get_lines_by_mtm_and_mtm_ma(self,
+                                     mtm_period: int,
+                                     mtm_ma_period: int) -> dict:
+        mtm = self.indicator.mtm(timeperiod=mtm_period)
+        return {
+            "fast": mtm,
+            "slow": self.indicator.ema_with_data(
+                mtm, timeperiod=mtm_ma_period),
+        }
+
+    def _get_lines_by_roc_and_roc_ma(self,
+                                     roc_period: int,
+                                     roc_ma_period: int) -> dict:
+        roc = self.indicator.roc(timeperiod=roc_period)
+        return {
+            "fast": roc,
+            "slow": self.indicator.sma_with_data(
+                roc, timeperiod=roc_ma_period),
+        }
 
     def _get_signals(
         self,
@@ -224,14 +283,32 @@ class CrossOverStrategy(BaseStrategy):
 
         args:
             slow (np.ndarray): slow line, e.g. 20 MA
+                               [shape: (bars) or (symbols, bars)]
             fast (np.ndarray): fast line, e.g. 10 MA
+                               [shape: (bars) or (symbols, bars)]
 
         returns:
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        prev_fast = np.roll(fast, shift=1)
-        prev_slow = np.roll(slow, shift=1)
-        signal_buy = (fast > slow) & (prev_fast < prev_slow)
-        signal_sell = (fast < slow) & (prev_fast > prev_slow)
-        return self._combine_signals(signal_buy, signal_sell)
+        fast = np.asarray(fast)
+        slow = np.asarray(slow)
+        signal = np.zeros(fast.shape, dtype=np.int8)
+        if fast.shape[-1] < 2:
+            return signal
+
+        # compare each bar with the previous one through shifted views,
+        # reusing two boolean buffers instead of rolled copies; the bars
+        # are the last axis so that a panel (symbols x bars) works the same
+        cross = np.empty(fast[..., 1:].shape, dtype=bool)
+        previous = np.empty_like(cross)
+        np.greater(fast[..., 1:], slow[..., 1:], out=cross)
+        np.less(fast[..., :-1], slow[..., :-1], out=previous)
+        np.logical_and(cross, previous, out=cross)
+        signal[..., 1:] = cross
+        np.less(fast[..., 1:], slow[..., 1:], out=cross)
+        np.greater(fast[..., :-1], slow[..., :-1], out=previous)
+        np.logical_and(cross, previous, out=cross)
+        np.subtract(signal[..., 1:], cross, out=signal[..., 1:],
+                    casting="unsafe")
+        return signal
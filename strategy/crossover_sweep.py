@@ -0,0 +1,149 @@
+from typing import Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns, IndicatorType
+
+
+class CrossOverSweep:
+    def __init__(self, indicator, chunk_size: int = 64):
+        """ Evaluate crossover signals for grids of (fast, slow) periods.
+        args:
+            indicator (BaseIndicator): indicators computation resources
+            chunk_size (int): number of (fast, slow) pairs evaluated per
+                              batch, bounding the temporaries to
+                              chunk_size x bars
+        """
+        self.indicator = indicator
+        self.chunk_size = chunk_size
+
+    def sweep(self,
+              indicator_type: IndicatorType,
+              fastperiods: Sequence[int],
+              slowperiods: Sequence[int],
+              ) -> pd.DataFrame:
+        """ Summarize the signals of every pair with fastperiod <
+            slowperiod; returns assume holding long after buying and
+            short after selling, without commission.
+
+        args:
+            indicator_type (IndicatorType): SMA, EMA or WMA
+            fastperiods (Sequence[int]) [unit: times of the data interval]
+            slowperiods (Sequence[int]) [unit: times of the data interval]
+
+        returns:
+            summary indexed by (fastperiod, slowperiod) with columns
+                buys, sells and total_return (pd.DataFrame)
+        """
+        close = np.asarray(
+            self.indicator.candles[CrawlerColumns.CLOSE.value],
+            dtype=float,
+        )
+        # log return from the bar to the last bar
+        remaining_returns = np.log(close[-1] / close)
+
+        pairs, summaries = [], []
+        for chunk_pairs, signals in self._iterate_signals(
+                indicator_type, fastperiods, slowperiods):
+            total_returns = np.expm1(
+                _sum_position_returns(signals, remaining_returns))
+            pairs.extend(chunk_pairs)
+            summaries.append(np.column_stack([
+                (signals > 0).sum(axis=1),
+                (signals < 0).sum(axis=1),
+                total_returns,
+            ]))
+
+        summary = pd.DataFrame(
+            np.concatenate(summaries) if summaries else np.empty((0, 3)),
+            index=pd.MultiIndex.from_tuples(
+                pairs, names=["fastperiod", "slowperiod"]),
+            columns=["buys", "sells", "total_return"],
+        )
+        return summary.astype({"buys": int, "sells": int})
+
+    def signals(self,
+                indicator_type: IndicatorType,
+                fastperiods: Sequence[int],
+                slowperiods: Sequence[int],
+                ) -> tuple:
+        """
+        args:
+            indicator_type (IndicatorType): SMA, EMA or WMA
+            fastperiods (Sequence[int]) [unit: times of the data interval]
+            slowperiods (Sequence[int]) [unit: times of the data interval]
+
+        returns:
+            (fastperiod, slowperiod) pairs and their signals as rows
+                (tuple[list, np.ndarray])
+        """
+        pairs, signals = [], []
+        for chunk_pairs, chunk_signals in self._iterate_signals(
+                indicator_type, fastperiods, slowperiods):
+            pairs.extend(chunk_pairs)
+            signals.append(chunk_signals)
+        return pairs, np.concatenate(signals)
+
+    def _iterate_signals(self,
+                         indicator_type: IndicatorType,
+                         fastperiods: Sequence[int],
+                         slowperiods: Sequence[int],
+                         ) -> Iterator[tuple]:
+        """ Compute every distinct line once, then evaluate the pairs
+            chunk by chunk as 2-D arrays."""
+        moving_average = {
+            IndicatorType.SMA: self.indicator.sma,
+            IndicatorType.EMA: self.indicator.ema,
+            IndicatorType.WMA: self.indicator.wma,
+        }.get(indicator_type)
+        if moving_average is None:
+            raise Exception("The strategy logic is unsupported.")
+
+        periods = np.unique(np.concatenate([fastperiods, slowperiods]))
+        lines = np.stack([
+            np.asarray(moving_average(timeperiod=int(period)), dtype=float)
+            for period in periods
+        ])
+        row = {period: index for index, period in enumerate(periods)}
+
+        pairs = [
+            (int(fast), int(slow))
+            for fast in np.unique(fastperiods)
+            for slow in np.unique(slowperiods)
+            if fast < slow
+        ]
+        for start in range(0, len(pairs), self.chunk_size):
+            chunk_pairs = pairs[start:start + self.chunk_size]
+            fast = lines[[row[fast] for fast, _ in chunk_pairs]]
+            slow = lines[[row[slow] for _, slow in chunk_pairs]]
+            yield chunk_pairs, _get_crossover_signals(fast, slow)
+
+
+def _get_crossover_signals(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """ Row-wise crossover signal, same as CrossOverStrategy._get_signals
+        (1 for buying and -1 for selling)."""
+    difference = np.subtract(fast, slow, out=fast)
+    above = difference > 0
+    below = difference < 0
+    signals = np.zeros(difference.shape, dtype=np.int8)
+    signals[:, 1:] += above[:, 1:] & below[:, :-1]
+    signals[:, 1:] -= below[:, 1:] & above[:, :-1]
+    return signals
+
+
+def _sum_position_returns(signals: np.ndarray,
+                          remaining_returns: np.ndarray) -> np.ndarray:
+    """ Sum of log returns of each row holding the latest signal, computed
+        over the signal events only: every position change contributes
+        the change times the log return from its bar to the last bar."""
+    rows, columns = np.nonzero(signals)
+    positions = signals[rows, columns].astype(float)
+    previous_positions = np.zeros_like(positions)
+    previous_positions[1:] = positions[:-1]
+    previous_positions[1:][rows[1:] != rows[:-1]] = 0
+    return np.bincount(
+        rows,
+        weights=(positions - previous_positions) * remaining_returns[columns],
+        minlength=signals.shape[0],
+    )
@@ -2,22 +2,19 @@ from typing import Callable
 
 import numpy as np
 
-from constants.constants import IndicatorType
+from constants.constants import IndicatorType, StrategyType
+from registry.registry import get_strategy_entry
 from strategy.base import BaseStrategy
 
 
 class OverReactStrategy(BaseStrategy):
+    strategy_type = StrategyType.OVERREACT_STRATEGY
+
     def trade_by_indicator(
             self, indicator_type: IndicatorType) -> Callable[[], np.ndarray]:
         """ Get trading strategy function."""
-        if (indicator_type == IndicatorType.RSI):
-            return self.trade_by_rsi
-        elif (indicator_type == IndicatorType.MFI):
-            return self.trade_by_mfi
-        elif (indicator_type == IndicatorType.WILLR):
-            return self.trade_by_willr
-        else:
-            raise Exception("The strategy logic is unsupported.")
+        entry = get_strategy_entry(self.strategy_type, indicator_type)
+        return getattr(self, entry.method)
 
     def trade_by_mfi(
         self,
@@ -38,9 +35,11 @@ class OverReactStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        mfi = self.indicator.mfi(timeperiod=timeperiod)
-        return self._get_signals(mfi,
-                                 lowerbound=lowerbound, upperbound=upperbound)
+        return self._get_signals(**self._get_lines_by_mfi(
+            timeperiod=timeperiod,
+            lowerbound=lowerbound,
+            upperbound=upperbound,
+        ))
 
     def trade_by_rsi(
         self,
@@ -61,9 +60,11 @@ class OverReactStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        rsi = self.indicator.rsi(timeperiod=timeperiod)
-        return self._get_signals(rsi,
-                                 lowerbound=lowerbound, upperbound=upperbound)
+        return self._get_signals(**self._get_lines_by_rsi(
+            timeperiod=timeperiod,
+            lowerbound=lowerbound,
+            upperbound=upperbound,
+        ))
 
     def trade_by_willr(
         self,
@@ -84,9 +85,41 @@ class OverReactStrategy(BaseStrategy):
             singal (np.ndarray): signal for trading points
                                 (1 for buying and -1 for selling)
         """
-        willr = self.indicator.willr(timeperiod=timeperiod)
-        return self._get_signals(willr,
-                                 lowerbound=lowerbound, upperbound=upperbound)
+        return self._get_signals(**self._get_lines_by_willr(
+            timeperiod=timeperiod,
+            lowerbound=lowerbound,
+            upperbound=upperbound,
+        ))
+
+    def _get_lines_by_mfi(self,
+                          timeperiod: int,
+                          lowerbound: float,
+                          upperbound: float) -> dict:
+        return {
+            "line": self.indicator.mfi(timeperiod=timeperiod),
+            "lowerbound": lowerbound,
+            "upperbound": upperbound,
+        }
+
+    def _get_lines_by_rsi(self,
+                          timeperiod: int,
+                          lowerbound: float,
+                          upperbound: float) -> dict:
+        return {
+            "line": self.indicator.rsi(timeperiod=timeperiod),
+            "lowerbound": lowerbound,
+            "upperbound": upperbound,
+        }
+
+    def _get_lines_by_willr(self,
+                            timeperiod: int,
+                            lowerbound: float,
+                            upperbound: float) -> dict:
+        return {
+            "line": self.indicator.willr(timeperiod=timeperiod),
+            "lowerbound": lowerbound,
+            "upperbound": upperbound,
+        }
 
     def _get_signals(
         self,
@@ -97,6 +130,7 @@ class OverReactStrategy(BaseStrategy):
         """
         args:
             line (np.ndarray): line, e.g. 10 MA
+                               [shape: (bars) or (symbols, bars)]
             lowerbound (float): threshold for oversold
             upperbound (float): threshold for overbought
 
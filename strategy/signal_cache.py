@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from constants.constants import CrawlerColumns
+from profiling.profiler import get_profiler
+
+VALUE_COLUMNS = [
+    column for column in CrawlerColumns if column != CrawlerColumns.DATETIME]
+
+
+class SignalCache:
+    def __init__(self, directory: str = "signals"):
+        """ Persist the signals of strategy functions, one file per key of
+            the run (e.g. symbol, interval, strategy, indicator and
+            parameters) and the first datetime of the candles. A file
+            records the range of the candles it was computed on, so the
+            signals are reused as long as the candles only grow by newer
+            bars, and only the new bars (with the lookback) are computed.
+        args:
+            directory (str): directory of the signal files
+        """
+        self.directory = directory
+
+    def get(self,
+            fields: dict,
+            candles,
+            compute: Callable,
+            lookback: int,
+            ) -> np.ndarray:
+        """
+        args:
+            fields (dict): what the signals depend on besides the candles,
+                           e.g. symbol, interval, strategy, indicator,
+                           parameters and indicator backend
+            candles (pd.DataFrame, or CompactCandles): candles of the run
+            compute (Callable): function of the candles returning signals
+            lookback (int): number of the latest bars a signal is computed
+                            from
+
+        returns:
+            signal (np.ndarray): signal for trading points
+                                (1 for buying and -1 for selling)
+        """
+        if len(candles) == 0:
+            return compute(candles)
+
+        timestamps = pd.DatetimeIndex(candles.index).as_unit("ms").asi8
+        filename = self._get_filename(fields, int(timestamps[0]))
+        signal, length = self._load(filename, candles, timestamps)
+        profiler = get_profiler()
+        if length == len(candles):
+            profiler.count("signal_cache.hits")
+            return signal
+
+        # the new bars are computed with their lookback before them
+        bars = len(candles) - length + lookback - 1
+        if length == 0 or bars >= len(candles):
+            signal = compute(candles)
+        else:
+            profiler.count("signal_cache.extensions")
+            signal = np.concatenate((
+                signal,
+                compute(candles.tail(bars))[length - len(candles):],
+            ))
+        self._save(filename, signal, candles, timestamps)
+        return signal
+
+    def _load(self,
+              filename: str,
+              candles,
+              timestamps: np.ndarray,
+              ) -> tuple:
+        """ Load the cached signals of the candles, valid when the candles
+            still contain the last cached bar at the same position; the
+            storages only append newer bars or merge gaps (which shifts
+            the positions), so the bars before it are not compared.
+
+        returns:
+            cached signal and the number of the bars it covers
+                (tuple[np.ndarray, int]), none of them if invalid
+        """
+        if not os.path.exists(filename):
+            return None, 0
+        with np.load(filename) as cached:
+            signal = cached["signal"]
+            last_timestamp = int(cached["last_timestamp"])
+            last_values = cached["last_values"]
+
+        length = len(signal)
+        if length > len(candles) \
+                or timestamps[length - 1] != last_timestamp \
+                or not np.array_equal(
+                    _get_values(candles, length - 1), last_values):
+            return None, 0
+        return signal, length
+
+    def _save(self,
+              filename: str,
+              signal: np.ndarray,
+              candles,
+              timestamps: np.ndarray,
+              ) -> None:
+        """ Write through a temporary file, so a file is replaced at once.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(f"{filename}.tmp", "wb") as f:
+            np.savez(
+                f,
+                signal=signal,
+                last_timestamp=timestamps[-1],
+                last_values=_get_values(candles, len(candles) - 1),
+            )
+        os.replace(f"{filename}.tmp", filename)
+
+    def _get_filename(self, fields: dict, first_timestamp: int) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(
+            {**fields, "first_timestamp": first_timestamp},
+            sort_keys=True,
+            default=str,
+        ).encode())
+        return os.path.join(self.directory, f"{digest.hexdigest()}.npz")
+
+
+def _get_values(candles, position: int) -> np.ndarray:
+    """ OHLCV of the candle at the position."""
+    return np.array([
+        np.asarray(candles[column.value])[position]
+        for column in VALUE_COLUMNS
+    ], dtype=np.float64)
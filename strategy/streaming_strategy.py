@@ -0,0 +1,192 @@
+import abc
+import math
+from typing import Callable
+
+from constants.constants import CrawlerColumns, IndicatorType
+from indicator.streaming_indicator import (
+    StreamingEMA,
+    StreamingMACD,
+    StreamingMFI,
+    StreamingMOM,
+    StreamingROC,
+    StreamingRSI,
+    StreamingSMA,
+    StreamingSTOCHF,
+    StreamingWILLR,
+    StreamingWMA,
+)
+
+
+class BaseStreamingStrategy(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def update_bar(self, bar) -> int:
+        """ Consume a new bar given by a mapping of candle columns and
+            return its signal (1 for buying and -1 for selling)."""
+        pass
+
+
+class StreamingCrossOverStrategy(BaseStreamingStrategy):
+    def __init__(self, indicator_type: IndicatorType, **params):
+        """ Evaluate the logic of CrossOverStrategy on the latest bar only.
+        args:
+            indicator_type (IndicatorType): indicator of the strategy
+            params: parameters of the trade_by_* method of
+                    CrossOverStrategy, the defaults if missing
+        """
+        get_lines = {
+            IndicatorType.SMA: self._get_lines_by_sma,
+            IndicatorType.EMA: self._get_lines_by_ema,
+            IndicatorType.WMA: self._get_lines_by_wma,
+            IndicatorType.MACD: self._get_lines_by_macd,
+            IndicatorType.MTM: self._get_lines_by_mtm,
+            IndicatorType.MTM_MA: self._get_lines_by_mtm_and_mtm_ma,
+            IndicatorType.ROC: self._get_lines_by_roc,
+            IndicatorType.ROC_MA: self._get_lines_by_roc_and_roc_ma,
+            IndicatorType.RSI: self._get_lines_by_rsi,
+            IndicatorType.KD: self._get_lines_by_kd,
+        }.get(indicator_type)
+        if get_lines is None:
+            raise Exception("The strategy logic is unsupported.")
+
+        self.lines = get_lines(**params)
+        self.previous_fast = math.nan
+        self.previous_slow = math.nan
+
+    def update_bar(self, bar) -> int:
+        """ Same as CrossOverStrategy._get_signals on the latest bar."""
+        fast, slow = self.lines(bar)
+        signal_buy = fast > slow and self.previous_fast < self.previous_slow
+        signal_sell = fast < slow and self.previous_fast > self.previous_slow
+        self.previous_fast, self.previous_slow = fast, slow
+        return int(signal_buy) - int(signal_sell)
+
+    def _get_lines_by_moving_average(self,
+                                     moving_average: type,
+                                     fastperiod: int,
+                                     slowperiod: int,
+                                     ) -> Callable:
+        fast = moving_average(fastperiod)
+        slow = moving_average(slowperiod)
+        return lambda bar: (fast.update_bar(bar), slow.update_bar(bar))
+
+    def _get_lines_by_sma(self,
+                          fastperiod: int = 6,
+                          slowperiod: int = 12) -> Callable:
+        return self._get_lines_by_moving_average(
+            StreamingSMA, fastperiod, slowperiod)
+
+    def _get_lines_by_ema(self,
+                          fastperiod: int = 6,
+                          slowperiod: int = 12) -> Callable:
+        return self._get_lines_by_moving_average(
+            StreamingEMA, fastperiod, slowperiod)
+
+    def _get_lines_by_wma(self,
+                          fastperiod: int = 6,
+                          slowperiod: int = 12) -> Callable:
+        return self._get_lines_by_moving_average(
+            StreamingWMA, fastperiod, slowperiod)
+
+    def _get_lines_by_kd(self,
+                         k_period: int = 5,
+                         d_period: int = 3) -> Callable:
+        kd = StreamingSTOCHF(k_period=k_period, d_period=d_period)
+
+        def get_lines(bar) -> tuple:
+            k, d = kd.update_bar(bar)
+            return d, k
+        return get_lines
+
+    def _get_lines_by_macd(self,
+                           fastperiod: int = 12,
+                           slowperiod: int = 26,
+                           signalperiod: int = 9) -> Callable:
+        macd = StreamingMACD(fastperiod=fastperiod,
+                             slowperiod=slowperiod,
+                             signalperiod=signalperiod)
+
+        def get_lines(bar) -> tuple:
+            macd_line, macd_signal, _ = macd.update_bar(bar)
+            return macd_line, macd_signal
+        return get_lines
+
+    def _get_lines_by_centerline(self,
+                                 line, centerline: float) -> Callable:
+        return lambda bar: (line.update_bar(bar), centerline)
+
+    def _get_lines_by_mtm(self, timeperiod: int = 10) -> Callable:
+        return self._get_lines_by_centerline(StreamingMOM(timeperiod), 0)
+
+    def _get_lines_by_roc(self, timeperiod: int = 10) -> Callable:
+        return self._get_lines_by_centerline(StreamingROC(timeperiod), 0)
+
+    def _get_lines_by_rsi(self, timeperiod: int = 14) -> Callable:
+        return self._get_lines_by_centerline(StreamingRSI(timeperiod), 50)
+
+    def _get_lines_by_line_and_moving_average(self,
+                                              line,
+                                              moving_average,
+                                              ) -> Callable:
+        """ The moving average starts from the first valid value of the
+            line, as TA-Lib skips the leading nan."""
+        def get_lines(bar) -> tuple:
+            value = line.update_bar(bar)
+            if math.isnan(value):
+                return value, math.nan
+            return value, moving_average.update(value)
+        return get_lines
+
+    def _get_lines_by_mtm_and_mtm_ma(self,
+                                     mtm_period: int = 22,
+                                     mtm_ma_period: int = 10) -> Callable:
+        return self._get_lines_by_line_and_moving_average(
+            StreamingMOM(mtm_period), StreamingEMA(mtm_ma_period))
+
+    def _get_lines_by_roc_and_roc_ma(self,
+                                     roc_period: int = 22,
+                                     roc_ma_period: int = 10) -> Callable:
+        return self._get_lines_by_line_and_moving_average(
+            StreamingROC(roc_period), StreamingSMA(roc_ma_period))
+
+
+class StreamingOverReactStrategy(BaseStreamingStrategy):
+    def __init__(self,
+                 indicator_type: IndicatorType,
+                 timeperiod: int = 14,
+                 lowerbound: float = 30,
+                 upperbound: float = 70,
+                 ):
+        """ Evaluate the logic of OverReactStrategy on the latest bar only.
+        args:
+            indicator_type (IndicatorType): indicator of the strategy
+            timeperiod (int) [unit: times of the data interval]
+            lowerbound (float) the lower threshold implies oversold
+            upperbound (float) the upper threshold implies overbought
+        """
+        line = {
+            IndicatorType.RSI: StreamingRSI,
+            IndicatorType.MFI: StreamingMFI,
+            IndicatorType.WILLR: StreamingWILLR,
+        }.get(indicator_type)
+        if line is None:
+            raise Exception("The strategy logic is unsupported.")
+
+        self.line = line(timeperiod)
+        self.lowerbound = lowerbound
+        self.upperbound = upperbound
+
+    def update_bar(self, bar) -> int:
+        """ Same as OverReactStrategy._get_signals on the latest bar."""
+        value = self.line.update_bar(bar)
+        return int(value < self.lowerbound) - int(value > self.upperbound)
+
+
+def to_bars(candles) -> list:
+    """ Split candles indexed by datetime into bars of candle columns."""
+    columns = [column.value for column in CrawlerColumns
+               if column != CrawlerColumns.DATETIME]
+    return [
+        dict(zip(columns, values), **{CrawlerColumns.DATETIME.value: index})
+        for index, values in zip(
+            candles.index, candles[columns].to_numpy(dtype=float))
+    ]
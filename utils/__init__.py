@@ -0,0 +1,5 @@
+from utils.lazy import lazy_getattr
+
+__all__ = [
+    "lazy_getattr",
+]
@@ -0,0 +1,21 @@
+import importlib
+from typing import Callable
+
+
+def lazy_getattr(package_name: str, modules: dict) -> Callable:
+    """ Module __getattr__ of a package importing each member from its
+        module only when the member is accessed.
+    args:
+        package_name (str): name of the package, i.e. its __name__
+        modules (dict[str, str]): module of each member
+
+    returns:
+        __getattr__ of the package (Callable)
+    """
+    def __getattr__(name: str):
+        if name not in modules:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(modules[name]), name)
+
+    return __getattr__
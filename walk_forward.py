@@ -0,0 +1,76 @@
+import argparse
+
+import yaml
+
+from api.adapter import ApiAdapter
+from constants import (
+    ApiType,
+    Config,
+    EngineType,
+    IndicatorBackendType,
+    IndicatorType,
+    StorageType,
+    StrategyType,
+)
+from engine.walk_forward import WalkForward
+from registry import get_api, get_storage
+
+
+def main(opt):
+    assert opt[Config.API] in ApiType.list(), \
+        "The api is unsupported."
+    payload = {
+        Config.SYMBOL: opt.get(Config.SYMBOL, ""),
+        Config.INTERVAL: opt.get(Config.INTERVAL, ""),
+        Config.START: opt.get(Config.START, None),
+        Config.TIMEFRAME: opt.get(Config.TIMEFRAME, None),
+    }
+    cache_only = opt.get(Config.CACHE_ONLY, False)
+    api = None if cache_only else get_api(opt[Config.API])()
+
+    storage_type = opt.get(Config.STORAGE, StorageType.CSV_STORAGE.value)
+    assert storage_type in StorageType.list(), \
+        "The storage type is unsupported."
+    storage = get_storage(storage_type)()
+    api_adapter = ApiAdapter(api, storage, cache_only=cache_only)
+    candles = api_adapter.fetch_candles(payload)
+
+    assert opt[Config.STRATEGY] in StrategyType.list(), \
+        "The strategy type is unsupported."
+    assert opt[Config.INDICATOR] in IndicatorType.list(), \
+        "The indicator type is unsupported."
+    engine_type = opt.get(Config.ENGINE, EngineType.VECTORIZED_ENGINE.value)
+    assert engine_type in EngineType.list(), \
+        "The engine type is unsupported."
+
+    walk_forward = WalkForward(
+        engine_type=engine_type,
+        cash=opt.get(Config.CASH, 10000),
+        commission=opt.get(Config.COMMISSION, 0.0),
+        metric=opt.get(Config.METRIC, "Return [%]"),
+        processes=opt.get(Config.PROCESSES, None),
+        indicator_backend=opt.get(
+            Config.INDICATOR_BACKEND, IndicatorBackendType.TALIB.value),
+    )
+    results = walk_forward.run(
+        candles,
+        opt[Config.STRATEGY],
+        opt[Config.INDICATOR],
+        opt.get(Config.PARAMETERS, {}),
+        opt[Config.TRAIN_BARS],
+        opt[Config.TEST_BARS],
+        opt.get(Config.STEP_BARS, None),
+    )
+    results.to_csv(
+        opt.get(Config.OUTPUT, "walk-forward-results.csv"), index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", type=str,
+                        default="config-walk-forward.yaml")
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = yaml.load(f, Loader=yaml.FullLoader)
+    main(config)